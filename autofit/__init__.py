@@ -1,7 +1,5 @@
 from . import conf
 from . import exc
-from .aggregator import Aggregator
-from .aggregator import PhaseOutput
 from .mapper import link
 from .mapper import prior
 from .mapper.model import AbstractModel
@@ -43,19 +41,9 @@ from .non_linear.abstract_search import Analysis
 from .non_linear.abstract_search import NonLinearSearch
 from .non_linear.abstract_search import PriorPasser
 from .non_linear.abstract_search import Result
-from autofit.non_linear.grid.grid_search import GridSearch as SearchGridSearch
 # from autofit.non_linear.grid.sensitivity import Sensitivity
-from autofit.non_linear.grid.grid_search import GridSearchResult
 from .non_linear.initializer import InitializerBall
 from .non_linear.initializer import InitializerPrior
-from .non_linear.mcmc.emcee import Emcee
-from .mock.mock_search import MockResult
-from .mock.mock_search import MockSearch
-from .non_linear.nest.dynesty import DynestyDynamic
-from .non_linear.nest.dynesty import DynestyStatic
-from .non_linear.nest.multi_nest import MultiNest
-from .non_linear.optimize.pyswarms import PySwarmsGlobal
-from .non_linear.optimize.pyswarms import PySwarmsLocal
 from .non_linear.paths import Paths
 from .non_linear.paths import convert_paths
 from .non_linear.paths import make_path
@@ -74,7 +62,28 @@ from .tools.phase import as_grid_search
 from .tools.phase_property import PhaseProperty
 from .tools.pipeline import Pipeline
 from .tools.pipeline import ResultsCollection
+from .tools.lazy import LazyImports
+
+# Names whose modules import optional sampler libraries or are slow to import. Each is imported the first time it is
+# accessed (e.g. as af.Emcee).
+_lazy_imports = LazyImports(globals())
+_lazy_imports.add("""
+from .aggregator import Aggregator
+from .aggregator import PhaseOutput
+from .non_linear.grid.grid_search import GridSearch as SearchGridSearch
+from .non_linear.grid.grid_search import GridSearchResult
+from .non_linear.mcmc.emcee import Emcee
+from .mock.mock_search import MockResult
+from .mock.mock_search import MockSearch
+from .non_linear.nest.dynesty import DynestyDynamic
+from .non_linear.nest.dynesty import DynestyStatic
+from .non_linear.nest.multi_nest import MultiNest
+from .non_linear.optimize.pyswarms import PySwarmsGlobal
+from .non_linear.optimize.pyswarms import PySwarmsLocal
+""")
+__getattr__ = _lazy_imports.getattr
+__dir__ = _lazy_imports.dir
 
 conf.instance.register(__file__)
 
-__version__ = '0.73.1'
+__version__ = '0.73.1'
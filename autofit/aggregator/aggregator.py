@@ -12,13 +12,12 @@ Example:
 ./aggregator.py ../output pipeline=data_mass_x1_source_x1_positions
 """
 
-import os
 from os import path
-import zipfile
 from collections import defaultdict
 from shutil import rmtree
 from typing import List, Union, Iterator, Tuple
 
+from .index import Index
 from .phase_output import PhaseOutput
 from .predicate import AttributePredicate
 
@@ -95,7 +94,7 @@ class AbstractAggregator:
 
     def remove_unzipped(self):
         """
-        Removes the unzipped output directory for each phase.
+        Removes the unzipped output directory for each phase which is also held in a .zip archive.
         """
         for phase in self.phases:
 
@@ -103,6 +102,9 @@ class AbstractAggregator:
 
             unzipped_path = path.join(split_path)
 
+            if not path.exists(f"{unzipped_path}.zip"):
+                continue
+
             rmtree(
                 unzipped_path,
                 ignore_errors=True
@@ -288,8 +290,12 @@ class Aggregator(AbstractAggregator):
         """
         Class to aggregate phase results for all subdirectories in a given directory.
 
-        The whole directory structure is traversed and a Phase object created for each directory that contains a
-        metadata file.
+        The whole directory structure is traversed and a Phase object created for each directory, or folder of a .zip
+        archive, that contains a metadata file. Archives are not extracted.
+
+        The metadata, completion status and location of each phase are kept in an index in the directory, which is
+        refreshed for phases which have changed each time an aggregator is created. Predicates on the metadata are
+        evaluated using the index, with pickles only being loaded (directly from the archive) when they are accessed.
 
         Parameters
         ----------
@@ -307,16 +313,8 @@ class Aggregator(AbstractAggregator):
         self._directory = directory
         phases = []
 
-        for root, _, filenames in os.walk(directory):
-            for filename in filenames:
-                if filename.endswith(".zip"):
-                    with zipfile.ZipFile(path.join(root, filename), "r") as f:
-                        f.extractall(path.join(root, filename[:-4]))
-
-        for root, _, filenames in os.walk(directory):
-            if "metadata" in filenames:
-                if not completed_only or ".completed" in filenames:
-                    phases.append(PhaseOutput(root))
+        if path.isdir(directory):
+            phases = Index(directory).scan(completed_only=completed_only)
 
         if len(phases) == 0:
             print(f"\nNo phases found in {directory}\n")
@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+
+class PickleCache:
+    def __init__(self, max_bytes: int = 512 * 1024 ** 2):
+        """
+        A least recently used cache of objects loaded from pickles, shared by every `PhaseOutput`.
+
+        Objects are keyed by the location of the pickle and its modification time, so a pickle which is rewritten is
+        loaded again. The size of an object is taken to be the size of its pickle, and the least recently used objects
+        are discarded when the total size exceeds *max_bytes*.
+
+        Parameters
+        ----------
+        max_bytes
+            The maximum total size of the pickles of the cached objects. A pickle larger than this is never cached.
+        """
+        self._max_bytes = max_bytes
+        self._objects = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self.size > self._max_bytes:
+            _, (_, size) = self._objects.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    def load(
+            self,
+            key: Hashable,
+            read: Callable[[], bytes],
+            loads: Callable[[bytes], object]
+    ):
+        """
+        Retrieve an object from the cache, or load it and add it to the cache.
+
+        Parameters
+        ----------
+        key
+            Identifies the pickle, including its modification time
+        read
+            Reads the pickle
+        loads
+            Creates the object from the pickle (e.g. pickle.loads)
+        """
+        try:
+            obj, _ = self._objects[key]
+        except KeyError:
+            pass
+        else:
+            self._objects.move_to_end(key)
+            self.hits += 1
+            return obj
+
+        self.misses += 1
+        string = read()
+        obj = loads(string)
+        if len(string) <= self._max_bytes:
+            self._objects[key] = (obj, len(string))
+            self.size += len(string)
+            self._evict()
+        return obj
+
+    def grow(self, key: Hashable, nbytes: int):
+        """
+        Add to the size of a cached object, for example when data read from another file is attached to it, so that
+        its size reflects the memory it holds. An object which becomes larger than *max_bytes* is removed.
+
+        Parameters
+        ----------
+        key
+            Identifies the pickle of the object
+        nbytes
+            The number of bytes added to the object
+        """
+        try:
+            obj, size = self._objects[key]
+        except KeyError:
+            return
+        size += nbytes
+        self.size += nbytes
+        if size > self._max_bytes:
+            del self._objects[key]
+            self.size -= size
+            self.evictions += 1
+        else:
+            self._objects[key] = (obj, size)
+            self._evict()
+
+    def clear(self):
+        self._objects.clear()
+        self.size = 0
+
+    def __len__(self):
+        return len(self._objects)
+
+    @property
+    def stats(self) -> dict:
+        """
+        The number of hits, misses and evictions since the cache was created and its current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "objects": len(self),
+            "size": self.size,
+            "max_bytes": self._max_bytes,
+        }
@@ -0,0 +1,169 @@
+import json
+import os
+import zipfile
+from os import path
+from typing import Dict, List, Optional
+
+from .phase_output import PhaseOutput
+
+INDEX_FILENAME = ".aggregator_index.json"
+INDEX_VERSION = 1
+
+
+def _zip_phases(zip_path: str) -> List[dict]:
+    """
+    Read the metadata of every phase in a zip archive, without extracting it.
+
+    A phase is any folder in the archive containing a metadata file.
+    """
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        names = set(archive.namelist())
+        phases = []
+        for name in sorted(names):
+            if name.startswith("__MACOSX") or path.basename(name) != "metadata":
+                continue
+            prefix = name[:-len("metadata")]
+            phases.append({
+                "prefix": prefix,
+                "completed": f"{prefix}.completed" in names,
+                "metadata": archive.read(name).decode("utf-8"),
+            })
+    return phases
+
+
+class Index:
+    def __init__(self, directory: str):
+        """
+        A persistent index of the phases found in an output directory, saved in the directory as
+        .aggregator_index.json.
+
+        The index records the metadata, completion status and location of each phase, including phases held in .zip
+        archives. On each scan only archives and metadata files which have changed since the last scan are read, so
+        an aggregator can be opened without reading every phase, and archives are never extracted.
+
+        Parameters
+        ----------
+        directory
+            The directory in which the outputs of phases are kept.
+        """
+        self.directory = directory
+        self.zips = dict()
+        self.directories = dict()
+        self.load()
+
+    @property
+    def filename(self) -> str:
+        return path.join(self.directory, INDEX_FILENAME)
+
+    def load(self):
+        try:
+            with open(self.filename) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        if index.get("version") == INDEX_VERSION:
+            self.zips = index["zips"]
+            self.directories = index["directories"]
+
+    def save(self):
+        """
+        Write the index, replacing the previous index atomically. The index is only a cache, so if the directory
+        cannot be written to it is not saved.
+        """
+        temporary = f"{self.filename}.tmp"
+        try:
+            with open(temporary, "w") as f:
+                json.dump({
+                    "version": INDEX_VERSION,
+                    "zips": self.zips,
+                    "directories": self.directories,
+                }, f)
+            os.replace(temporary, self.filename)
+        except OSError:
+            pass
+
+    def _zip_entry(self, key: str, zip_path: str) -> Optional[dict]:
+        try:
+            stat = os.stat(zip_path)
+        except OSError:
+            return None
+        entry = self.zips.get(key)
+        if entry is None or (entry["mtime"], entry["size"]) != (stat.st_mtime, stat.st_size):
+            try:
+                phases = _zip_phases(zip_path)
+            except (OSError, zipfile.BadZipFile):
+                return None
+            entry = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "phases": phases,
+            }
+        return entry
+
+    def _directory_entry(self, key: str, directory: str) -> Optional[dict]:
+        file_path = path.join(directory, "metadata")
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
+            return None
+        entry = self.directories.get(key)
+        if entry is None or entry["mtime"] != mtime:
+            with open(file_path) as f:
+                entry = {
+                    "mtime": mtime,
+                    "metadata": f.read(),
+                }
+        return entry
+
+    def scan(self, completed_only: bool = False) -> List[PhaseOutput]:
+        """
+        Walk the directory once, refreshing the index, and create a lazily loading output for each phase.
+
+        A phase which is held both in an archive and in the folder it would be extracted to is read from the folder.
+
+        Parameters
+        ----------
+        completed_only
+            If `True` only phases which were completed are included. This is determined from the index.
+
+        Returns
+        -------
+        The output of each phase, in the order they were found
+        """
+        zips: Dict[str, dict] = dict()
+        directories: Dict[str, dict] = dict()
+        phases = []
+
+        for root, _, filenames in os.walk(self.directory):
+            relative_root = path.relpath(root, self.directory)
+
+            if "metadata" in filenames:
+                entry = self._directory_entry(relative_root, root)
+                if entry is not None:
+                    directories[relative_root] = entry
+                    if not completed_only or ".completed" in filenames:
+                        phases.append(PhaseOutput(root, text=entry["metadata"]))
+
+            for filename in filenames:
+                zip_path = path.join(root, filename)
+                if not filename.endswith(".zip") or path.isdir(zip_path[:-4]):
+                    continue
+                key = path.join(relative_root, filename)
+                entry = self._zip_entry(key, zip_path)
+                if entry is None:
+                    continue
+                zips[key] = entry
+                for phase in entry["phases"]:
+                    if completed_only and not phase["completed"]:
+                        continue
+                    phases.append(PhaseOutput(
+                        path.normpath(path.join(zip_path[:-4], phase["prefix"])),
+                        zip_path=zip_path,
+                        prefix=phase["prefix"],
+                        text=phase["metadata"],
+                    ))
+
+        self.zips = zips
+        self.directories = directories
+        self.save()
+        return phases
@@ -1,10 +1,17 @@
+import io
+import json
 import os
-from os import path
 import pickle
+import zipfile
+from contextlib import contextmanager
+from os import path
+from typing import Optional
 
 import dill
 
 from autofit.non_linear import abstract_search
+from .cache import PickleCache
+from autofit.non_linear.samples import load_from_hdf5
 
 
 class PhaseOutput:
@@ -12,28 +19,131 @@ class PhaseOutput:
     @DynamicAttrs
     """
 
-    def __init__(self, directory: str):
+    # Pickles loaded by any phase output. The memory it uses may be limited by setting cache.max_bytes.
+    cache = PickleCache()
+
+    def __init__(
+            self,
+            directory: str,
+            zip_path: Optional[str] = None,
+            prefix: str = "",
+            text: Optional[str] = None,
+    ):
         """
         Represents the output of a single phase. Comprises a metadata file and other dataset files.
 
+        The output may be held in a .zip archive, in which case files are read directly from the archive. Files,
+        including the metadata file, are only read when they are first needed.
+
         Parameters
         ----------
         directory
-            The directory of the phase
+            The directory of the phase, or the directory it would be extracted to if it is held in an archive
+        zip_path
+            The path of the .zip archive holding the phase
+        prefix
+            The folder of the phase within the archive
+        text
+            The text of the metadata file, if it is already known (e.g. from the aggregator's index)
         """
         self.directory = directory
-        self.__search = None
-        self.__model = None
+        self.zip_path = zip_path
+        self.prefix = prefix
+        self.__text = text
+        self.__metadata = None
         self.file_path = os.path.join(directory, "metadata")
-        with open(self.file_path) as f:
-            self.text = f.read()
+
+    @contextmanager
+    def open(self, name: str):
+        """
+        Open a file of the phase output for reading in binary mode.
+
+        Parameters
+        ----------
+        name
+            The path of the file relative to the phase directory, separated by forward slashes (e.g.
+            pickles/model.pickle)
+
+        Raises
+        ------
+        FileNotFoundError
+            If the phase output does not include the file
+        """
+        if self.zip_path is None:
+            with open(os.path.join(self.directory, *name.split("/")), "rb") as f:
+                yield f
+        else:
+            with zipfile.ZipFile(self.zip_path, "r") as archive:
+                try:
+                    f = archive.open(f"{self.prefix}{name}")
+                except KeyError:
+                    raise FileNotFoundError(
+                        f"{name} not found in {self.zip_path}"
+                    )
+                with f:
+                    yield f
+
+    def read(self, name: str) -> bytes:
+        with self.open(name) as f:
+            return f.read()
+
+    def load_pickle(self, name: str, loads=pickle.loads):
+        """
+        Load a pickled file of the phase output.
+
+        Loaded objects are kept in a cache shared by every phase output, so the same object is returned each time a
+        pickle is loaded until the pickle is modified or the object is evicted from the cache.
+
+        Parameters
+        ----------
+        name
+            The path of the file relative to the phase directory (e.g. pickles/model.pickle)
+        loads
+            The function used to load the pickle
+
+        Raises
+        ------
+        FileNotFoundError
+            If the phase output does not include the file
+        """
+        return self.cache.load(
+            self._cache_key(name),
+            lambda: self.read(name),
+            loads
+        )
+
+    def _cache_key(self, name: str) -> tuple:
+        """
+        The key of a pickle in the cache, which is its location and modification time
+        """
+        if self.zip_path is None:
+            location = os.path.join(self.directory, *name.split("/"))
+            mtime = os.stat(location).st_mtime
+        else:
+            location = (self.zip_path, f"{self.prefix}{name}")
+            mtime = os.stat(self.zip_path).st_mtime
+        return location, mtime
+
+    @property
+    def text(self) -> str:
+        """
+        The text of the metadata file
+        """
+        if self.__text is None:
+            self.__text = self.read("metadata").decode("utf-8")
+        return self.__text
+
+    @property
+    def metadata(self) -> dict:
+        if self.__metadata is None:
             pairs = [
                 line.split("=")
                 for line
                 in self.text.split("\n")
                 if "=" in line
             ]
-            self.__dict__.update({pair[0]: pair[1] for pair in pairs})
+            self.__metadata = {pair[0]: pair[1] for pair in pairs}
+        return self.__metadata
 
     @property
     def pickle_path(self):
@@ -44,33 +154,61 @@ class PhaseOutput:
         """
         Reads the model.results file
         """
-        with open(os.path.join(self.directory, "model.results")) as f:
-            return f.read()
+        return self.read("model.results").decode("utf-8")
 
     @property
     def mask(self):
         """
         A pickled mask object
         """
-        with open(
-                os.path.join(self.pickle_path, "mask.pickle"), "rb"
-        ) as f:
-            return dill.load(f)
+        return self.load_pickle("pickles/mask.pickle", loads=dill.loads)
 
     def __getattr__(self, item):
         """
-        Attempt to load a pickle by the same name from the phase output directory.
+        Get a value from the metadata file or otherwise attempt to load a pickle by the same name from the phase
+        output directory.
 
         dataset.pickle, meta_dataset.pickle etc.
         """
+        if item.startswith("_"):
+            raise AttributeError(item)
+        try:
+            return self.metadata[item]
+        except KeyError:
+            pass
         try:
-            with open(
-                    os.path.join(self.pickle_path, f"{item}.pickle"), "rb"
-            ) as f:
-                return pickle.load(f)
+            return self.load_pickle(f"pickles/{item}.pickle")
         except FileNotFoundError:
             pass
 
+    @property
+    def samples(self):
+        """
+        The samples of the search. If the sample columns were stored in the binary samples file rather than the
+        samples pickle they are loaded from that file.
+        """
+        samples = self.__getattr__("samples")
+        # the columns are added to the cached samples, so they are only read once, and counted in their size
+        if samples is not None and samples.samples is None:
+            samples.samples = load_from_hdf5(
+                io.BytesIO(self.read("samples/samples.h5"))
+            )
+            self.cache.grow(
+                self._cache_key("pickles/samples.pickle"),
+                samples.samples.nbytes
+            )
+        return samples
+
+    @property
+    def profiling(self) -> dict:
+        """
+        The timings of the search recorded in profiling.json, or None if they were not output.
+        """
+        try:
+            return json.loads(self.read("profiling.json"))
+        except FileNotFoundError:
+            return None
+
     @property
     def header(self) -> str:
         """
@@ -86,23 +224,17 @@ class PhaseOutput:
         """
         The search object that was used in this phase
         """
-        if self.__search is None:
-            try:
-                with open(os.path.join(self.pickle_path, "search.pickle"), "r+b") as f:
-                    self.__search = pickle.loads(f.read())
-            except FileNotFoundError:
-                pass
-        return self.__search
+        try:
+            return self.load_pickle("pickles/search.pickle")
+        except FileNotFoundError:
+            return None
 
     @property
     def model(self):
         """
         The model that was used in this phase
         """
-        if self.__model is None:
-            with open(os.path.join(self.pickle_path, "model.pickle"), "r+b") as f:
-                self.__model = pickle.loads(f.read())
-        return self.__model
+        return self.load_pickle("pickles/model.pickle")
 
     def __str__(self):
         return self.text
@@ -1,4 +1,6 @@
 from .aggregator import *
+from .bulk import *
 from .instance import *
+from .migration import *
 from .model import *
 from .prior import *
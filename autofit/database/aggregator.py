@@ -1,26 +1,31 @@
+from sqlalchemy import Integer, column, text
+
 from autofit.database import query_model as q
+from .migration import assert_current
 from .model import Object
 
 
 class Aggregator:
     def __init__(self, session):
+        assert_current(session.get_bind())
         self.session = session
 
     def __getattr__(self, name):
         return q.Q(name)
 
     def filter(self, predicate):
-        objects_ids = {
-            row[0]
-            for row
-            in self.session.execute(
-                predicate.query
-            )
-        }
+        """
+        Find the objects matching a query, in a single statement which selects the
+        objects whose ids are selected by the query.
+        """
         return self.session.query(
             Object
         ).filter(
             Object.id.in_(
-                objects_ids
+                text(
+                    predicate.query
+                ).columns(
+                    column("parent_id", Integer)
+                )
             )
         ).all()
@@ -0,0 +1,129 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, inspect
+from sqlalchemy.orm import Session
+
+from .model import Object, child_path
+
+# For each class, the tables it is stored in and, for each column, the attribute it is taken from
+_columns_cache: Dict[type, List[Tuple[object, List[Tuple[str, Optional[str]]]]]] = dict()
+
+
+def _columns(cls: type):
+    try:
+        return _columns_cache[cls]
+    except KeyError:
+        pass
+
+    mapper = inspect(cls)
+    tables = []
+    for table in mapper.tables:
+        columns = []
+        for column in table.columns:
+            if column is mapper.polymorphic_on:
+                # the type is set by the mapper when an object is flushed
+                columns.append((column.key, None))
+            else:
+                columns.append((column.key, mapper.get_property_by_column(column).key))
+        tables.append((table, columns))
+
+    _columns_cache[cls] = tables
+    return tables
+
+
+def _flatten(
+        obj: Object,
+        parent_id: Optional[int],
+        root_id: Optional[int],
+        path: str,
+        next_id: int,
+        rows: Dict[object, List[dict]]
+) -> int:
+    """
+    Assign ids and paths to an object and its descendants and add a row for each to the rows of each table they are
+    stored in.
+
+    Returns
+    -------
+    The next id which has not been assigned
+    """
+    obj.id = next_id
+    obj.parent_id = parent_id
+    obj.root_id = root_id
+    obj.path = path
+    identity = inspect(type(obj)).polymorphic_identity
+
+    for table, columns in _columns(type(obj)):
+        rows[table].append({
+            key: identity if attribute is None else getattr(obj, attribute)
+            for key, attribute in columns
+        })
+
+    next_id += 1
+    for child in obj.children:
+        next_id = _flatten(
+            child,
+            parent_id=obj.id,
+            root_id=obj.id if root_id is None else root_id,
+            path=child_path(path, child.name),
+            next_id=next_id,
+            rows=rows,
+        )
+    return next_id
+
+
+def bulk_add(
+        session: Session,
+        sources: Iterable,
+        names: Optional[Iterable[Optional[str]]] = None,
+        commit: bool = True,
+) -> List[int]:
+    """
+    Add many models or instances to the database at once.
+
+    Each object is converted as by `Object.from_object`, but rather than adding the resulting database objects to
+    the session, which inserts them one at a time, ids are assigned in advance and each table is written with a
+    single executemany insert within one transaction.
+
+    Parameters
+    ----------
+    session
+        A session connected to the database
+    sources
+        Models or instances to be stored
+    names
+        A name for each object
+    commit
+        If `True` the transaction is committed once every object has been written
+
+    Returns
+    -------
+    The id of each object in the database, which can be used to retrieve it with session.query(Object).get(id)
+    """
+    sources = list(sources)
+    if names is None:
+        names = [None] * len(sources)
+
+    next_id = (session.query(func.max(Object.id)).scalar() or 0) + 1
+
+    ids = []
+    rows = defaultdict(list)
+    for source, name in zip(sources, names):
+        ids.append(next_id)
+        next_id = _flatten(
+            Object.from_object(source, name=name),
+            parent_id=None,
+            root_id=None,
+            path="",
+            next_id=next_id,
+            rows=rows,
+        )
+
+    # rows of the object table must be written before the rows of the tables which reference it
+    for table in sorted(rows, key=lambda table: table is not Object.__table__):
+        session.execute(table.insert(), rows[table])
+
+    if commit:
+        session.commit()
+    return ids
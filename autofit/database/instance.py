@@ -71,7 +71,7 @@ class Value(Object):
         primary_key=True,
     )
 
-    value = Column(Float)
+    value = Column(Float, index=True)
 
     @classmethod
     def _from_object(
@@ -105,7 +105,7 @@ class StringValue(Object):
         primary_key=True,
     )
 
-    value = Column(String)
+    value = Column(String, index=True)
 
     @classmethod
     def _from_object(
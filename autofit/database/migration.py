@@ -0,0 +1,127 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from autofit import exc
+from .model import Base, child_path
+
+
+def _missing_columns(bind) -> List[Tuple[object, object]]:
+    """
+    The columns of the schema which are missing from the tables of a database, as
+    (table, column) pairs. Tables which are missing entirely are not included.
+    """
+    inspector = inspect(bind)
+    table_names = set(inspector.get_table_names())
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in table_names:
+            continue
+        existing = {
+            column["name"]
+            for column in inspector.get_columns(table.name)
+        }
+        missing.extend(
+            (table, column)
+            for column in table.columns
+            if column.name not in existing
+        )
+    return missing
+
+
+def is_current(bind) -> bool:
+    """
+    Whether a database has every column of the current schema. A database written by
+    an earlier version of autofit can be brought up to date by *migrate*.
+    """
+    return len(_missing_columns(bind)) == 0
+
+
+def assert_current(bind):
+    """
+    Raise an error explaining how to migrate a database which is missing columns of the
+    current schema, rather than letting the first query fail.
+    """
+    missing = _missing_columns(bind)
+    if len(missing) > 0:
+        columns = ", ".join(
+            f"{table.name}.{column.name}"
+            for table, column in missing
+        )
+        raise exc.AggregatorException(
+            f"The database was written by an earlier version of autofit and is missing the "
+            f"columns {columns}. Call autofit.database.migrate(engine) to update it."
+        )
+
+
+def _backfill_paths(connection: Connection):
+    """
+    Set the path and root of every object which does not have them, from the names and
+    parents of the objects.
+    """
+    objects: Dict[int, Tuple[Optional[int], str, Optional[str], Optional[int]]] = {
+        row.id: (row.parent_id, row.name, row.path, row.root_id)
+        for row in connection.execute(text(
+            "SELECT id, parent_id, name, path, root_id FROM object"
+        ))
+    }
+    located = dict()
+
+    def locate(id_: int) -> Tuple[str, Optional[int]]:
+        try:
+            return located[id_]
+        except KeyError:
+            pass
+        parent_id, name, path, root_id = objects[id_]
+        if path is not None:
+            result = (path, root_id)
+        elif parent_id is None:
+            result = ("", None)
+        else:
+            parent_path, parent_root_id = locate(parent_id)
+            result = (
+                child_path(parent_path, name),
+                parent_id if parent_root_id is None else parent_root_id
+            )
+        located[id_] = result
+        return result
+
+    rows = []
+    for id_, (_, _, path, _) in objects.items():
+        if path is None:
+            path, root_id = locate(id_)
+            rows.append({"id": id_, "path": path, "root_id": root_id})
+
+    if len(rows) > 0:
+        connection.execute(
+            text("UPDATE object SET path = :path, root_id = :root_id WHERE id = :id"),
+            rows
+        )
+
+
+def migrate(engine: Engine):
+    """
+    Update a database written by an earlier version of autofit to the current schema.
+
+    Missing tables and indexes are created and missing columns are added. The path and
+    root of each object, which earlier versions did not store, are derived from the
+    names and parents of the objects. Migrating a database which is up to date does
+    nothing.
+
+    Parameters
+    ----------
+    engine
+        An engine connected to the database
+    """
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for table, column in _missing_columns(connection):
+            connection.execute(text(
+                f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+                f"{column.type.compile(dialect=engine.dialect)}"
+            ))
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+        _backfill_paths(connection)
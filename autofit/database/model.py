@@ -1,16 +1,20 @@
 import importlib
 import re
-from typing import List, Tuple, Any, Iterable, Union, ItemsView
+from collections import defaultdict
+from typing import List, Optional, Tuple, Any, Iterable, Union, ItemsView
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import (
+    Session, object_session, relationship, with_polymorphic
+)
+from sqlalchemy.orm.attributes import set_committed_value
 
 import autofit as af
 
 Base = declarative_base()
 
-_schema_version = 1
+_schema_version = 3
 
 
 class Object(Base):
@@ -29,25 +33,67 @@ class Object(Base):
         Integer,
         ForeignKey(
             "object.id"
-        )
+        ),
+        index=True
     )
     parent = relationship(
         "Object",
         uselist=False,
-        remote_side=[id]
+        remote_side=[id],
+        foreign_keys=[parent_id]
     )
     children: List["Object"] = relationship(
         "Object",
         uselist=True,
+        foreign_keys=[parent_id]
     )
 
     name = Column(String)
 
+    # The root of the tree containing this object, or None if this object is a root
+    root_id = Column(
+        Integer,
+        ForeignKey(
+            "object.id"
+        )
+    )
+    root = relationship(
+        "Object",
+        uselist=False,
+        remote_side=[id],
+        foreign_keys=[root_id]
+    )
+
+    # The names of the objects from the root to this object, e.g. galaxies.lens.mass.centre_0,
+    # or an empty string if this object is a root
+    path = Column(String)
+
     __mapper_args__ = {
         'polymorphic_identity': 'object',
         'polymorphic_on': type
     }
 
+    # Each step of a path query matches the name of a child of a given parent. The index
+    # also serves queries on the name alone.
+    __table_args__ = (
+        Index(
+            "ix_object_name_parent_id",
+            "name",
+            "parent_id"
+        ),
+        # A path from the root is matched by the path index, and the descendants of an
+        # object by a range of paths in its tree
+        Index(
+            "ix_object_path",
+            "path"
+        ),
+        Index(
+            "ix_object_root_id_path",
+            "root_id",
+            "path"
+        ),
+    )
+
     # noinspection PyProtectedMember
     @classmethod
     def from_object(
@@ -119,6 +165,9 @@ class Object(Base):
         Create the real instance for this object, with child
         attributes attached
         """
+        if "children" not in self.__dict__:
+            self.load_subtree()
+
         instance = self._make_instance()
         for child in self.children:
             setattr(
@@ -128,6 +177,61 @@ class Object(Base):
             )
         return instance
 
+    def set_path(
+            self,
+            path: str = "",
+            root: Optional["Object"] = None
+    ):
+        """
+        Set the path and root of this object and of its descendants.
+
+        Parameters
+        ----------
+        path
+            The path of this object from the root
+        root
+            The root of the tree, or None if this object is the root
+        """
+        self.path = path
+        self.root = root
+        for child in self.children:
+            child.set_path(
+                child_path(path, child.name),
+                self if root is None else root
+            )
+
+    def load_subtree(self):
+        """
+        Load every descendant of this object with a single query, which selects the objects
+        in its tree whose path starts with its path, and attach the children of each object.
+
+        This replaces loading the children of each object as they are accessed, which
+        issues a query for every object in the tree.
+        """
+        session = object_session(self)
+        if session is None or self.path is None or self.id is None:
+            return
+
+        objects = with_polymorphic(Object, "*")
+        query = session.query(
+            objects
+        ).filter(
+            objects.root_id == (self.id if self.root_id is None else self.root_id)
+        )
+        if self.path:
+            # paths of descendants sort between path + "." and path + "/"
+            query = query.filter(
+                objects.path > f"{self.path}.",
+                objects.path < f"{self.path}/",
+            )
+
+        descendants = query.order_by(objects.id).all()
+        children = defaultdict(list)
+        for obj in descendants:
+            children[obj.parent_id].append(obj)
+        for obj in [self, *descendants]:
+            set_committed_value(obj, "children", children[obj.id])
+
     def _add_children(
             self,
             items: Union[
@@ -154,57 +258,127 @@ class Object(Base):
             )
 
     class_path = Column(
-        String
+        String,
+        index=True
     )
 
     @property
-    def _class_path_array(self) -> List[str]:
+    def cls(self) -> type:
         """
-        A list of strings describing the module and class of the
-        real object represented here
+        The class of the real object
         """
-        return self.class_path.split(".")
+        return class_registry.class_for(
+            self.class_path
+        )
 
-    @property
-    def _class_name(self) -> str:
-        """
-        The name of the real class
-        """
-        return self._class_path_array[-1]
+    @cls.setter
+    def cls(self, cls: type):
+        self.class_path = class_registry.path_for(cls)
 
-    @property
-    def _module_path(self) -> str:
+
+def child_path(path: str, name) -> str:
+    """
+    The path of a child with a given name of an object with a given path
+    """
+    if path == "":
+        return str(name)
+    return f"{path}.{name}"
+
+
+@event.listens_for(Session, "before_flush")
+def _set_paths(session, flush_context, instances):
+    """
+    Set the paths of objects added to a session before they are inserted.
+
+    An object added as a child of an object which is already stored takes its path and
+    root from that object, and any other object added without a parent is a root.
+    """
+    new = [
+        obj for obj in session.new
+        if isinstance(obj, Object) and obj.path is None
+    ]
+    if len(new) == 0:
+        return
+
+    # children appended to objects already stored, whose children collection changed
+    for parent in session.dirty:
+        if isinstance(parent, Object) and parent.path is not None and "children" in parent.__dict__:
+            for child in parent.children:
+                if child.path is None:
+                    child.set_path(
+                        child_path(parent.path, child.name),
+                        parent if parent.root is None else parent.root
+                    )
+
+    children = {
+        id(child)
+        for obj in new
+        for child in obj.children
+    }
+    for obj in new:
+        if obj.path is not None or id(obj) in children:
+            continue
+        parent = obj.parent
+        if parent is not None and parent.path is not None:
+            obj.set_path(
+                child_path(parent.path, obj.name),
+                parent if parent.root is None else parent.root
+            )
+        else:
+            obj.set_path()
+
+
+class ClassRegistry:
+    def __init__(self):
         """
-        The path of the module containing the real class
+        Resolves classes to the import paths stored in the database and back.
+
+        Each class path is computed, and each class imported, once per process. A class whose
+        path has been computed, e.g. when a model is stored, is resolved without an import.
         """
-        return ".".join(self._class_path_array[:-1])
+        self._paths = dict()
+        self._classes = dict()
 
-    @property
-    def _module(self):
+    def path_for(self, cls: type) -> str:
         """
-        The module containing the real class
+        The full import path of the type
         """
-        return importlib.import_module(
-            self._module_path
-        )
+        try:
+            return self._paths[cls]
+        except KeyError:
+            pass
+        class_path = re.search("'(.*)'", str(cls))[1]
+        self._paths[cls] = class_path
+        self._classes.setdefault(class_path, cls)
+        return class_path
 
-    @property
-    def cls(self) -> type:
+    def class_for(self, class_path: str) -> type:
         """
-        The class of the real object
+        The type with the full import path
         """
-        return getattr(
-            self._module,
-            self._class_name
+        try:
+            return self._classes[class_path]
+        except KeyError:
+            pass
+        module_path, class_name = class_path.rsplit(".", 1)
+        cls = getattr(
+            importlib.import_module(
+                module_path
+            ),
+            class_name
         )
+        self._classes[class_path] = cls
+        return cls
 
-    @cls.setter
-    def cls(self, cls: type):
-        self.class_path = get_class_path(cls)
+    def __len__(self):
+        return len(self._classes)
+
+
+class_registry = ClassRegistry()
 
 
 def get_class_path(cls: type) -> str:
     """
     The full import path of the type
     """
-    return re.search("'(.*)'", str(cls))[1]
+    return class_registry.path_for(cls)
@@ -5,4 +5,4 @@ from .condition import (
     TypeCondition as T
 )
 from .junction import And, Or
-from .query import NamedQuery as Q
+from .query import NamedQuery as Q, PathQuery as P
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Set
+from itertools import count
+from typing import Dict, List, Set, Tuple
 
 from autofit.database.model import get_class_path
 
@@ -51,6 +52,73 @@ value_table = Table("value")
 string_value_table = Table("string_value")
 
 
+def quote(value: str) -> str:
+    """
+    A string literal in SQL
+    """
+    value = value.replace("'", "''")
+    return f"'{value}'"
+
+
+class Joins:
+    def __init__(self):
+        """
+        The FROM component of a query, built up as a query is compiled.
+
+        The query selects from an object table aliased o0. Each step of a path query joins
+        another object table, aliased o1, o2..., matching the parent_id of the child to the
+        id of its parent. Value tables are joined to the object table they describe at most
+        once, aliased by their abbreviation and the number of that object table, e.g. v1.
+        """
+        self._count = count()
+        self.root = self._object_alias()
+        self._joins: List[str] = []
+        self._table_aliases: Dict[Tuple[Table, str], str] = dict()
+
+    def _object_alias(self) -> str:
+        return f"{object_table.abbreviation}{next(self._count)}"
+
+    def child(self, parent: str) -> str:
+        """
+        Join a child of the object aliased parent, returning the alias of the child
+        """
+        alias = self._object_alias()
+        self._joins.append(
+            f"JOIN {object_table.name} AS {alias} ON {alias}.parent_id = {parent}.id"
+        )
+        return alias
+
+    def table(
+            self,
+            table: Table,
+            alias: str,
+            outer: bool = False
+    ) -> str:
+        """
+        Join the table holding the values of the object aliased alias, returning the alias
+        of that table.
+
+        If outer is True the table is joined with a LEFT JOIN so that objects without an
+        entry in the table (e.g. in another branch of an OR) are kept.
+        """
+        try:
+            return self._table_aliases[table, alias]
+        except KeyError:
+            pass
+        table_alias = f"{table.abbreviation}{alias[len(object_table.abbreviation):]}"
+        self._joins.append(
+            f"{'LEFT JOIN' if outer else 'JOIN'} {table.name} AS {table_alias} ON {table_alias}.id = {alias}.id"
+        )
+        self._table_aliases[table, alias] = table_alias
+        return table_alias
+
+    def __str__(self):
+        return " ".join([
+            f"{object_table.name} AS {self.root}",
+            *self._joins
+        ])
+
+
 class AbstractCondition(ABC):
     @property
     @abstractmethod
@@ -65,6 +133,27 @@ class AbstractCondition(ABC):
         The condition written as SQL
         """
 
+    @abstractmethod
+    def where(
+            self,
+            joins: Joins,
+            alias: str,
+            outer: bool = False
+    ) -> str:
+        """
+        The condition written as SQL in the WHERE component of a query, applied to the
+        object table aliased alias. Any tables the condition requires are added to the joins.
+
+        Parameters
+        ----------
+        joins
+            The FROM component of the query
+        alias
+            The alias of the object table the condition applies to
+        outer
+            True if the condition is within an OR, in which case tables cannot be inner joined
+        """
+
     def __and__(
             self,
             other:
@@ -146,6 +235,9 @@ class ValueCondition(AbstractValueCondition):
         """
         return f"{value_table.abbreviation}.value {self.symbol} {self.value}"
 
+    def where(self, joins, alias, outer=False):
+        return f"{joins.table(value_table, alias, outer)}.value {self.symbol} {self.value}"
+
 
 class StringValueCondition(AbstractValueCondition):
     @property
@@ -159,7 +251,10 @@ class StringValueCondition(AbstractValueCondition):
         """
         The condition in SQL
         """
-        return f"{string_value_table.abbreviation}.value {self.symbol} '{self.value}'"
+        return f"{string_value_table.abbreviation}.value {self.symbol} {quote(self.value)}"
+
+    def where(self, joins, alias, outer=False):
+        return f"{joins.table(string_value_table, alias, outer)}.value {self.symbol} {quote(self.value)}"
 
 
 class NameCondition(AbstractCondition):
@@ -185,7 +280,10 @@ class NameCondition(AbstractCondition):
         """
         The condition in SQL
         """
-        return f"{object_table.abbreviation}.name = '{self.name}'"
+        return f"{object_table.abbreviation}.name = {quote(self.name)}"
+
+    def where(self, joins, alias, outer=False):
+        return f"{alias}.name = {quote(self.name)}"
 
 
 class TypeCondition(AbstractCondition):
@@ -211,7 +309,10 @@ class TypeCondition(AbstractCondition):
         """
         The condition in SQL
         """
-        return f"{object_table.abbreviation}.class_path = '{self.class_path}'"
+        return f"{object_table.abbreviation}.class_path = {quote(self.class_path)}"
+
+    def where(self, joins, alias, outer=False):
+        return f"{alias}.class_path = {quote(self.class_path)}"
 
     @property
     def class_path(self) -> str:
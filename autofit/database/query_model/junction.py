@@ -3,7 +3,7 @@ from collections import defaultdict
 from functools import wraps
 from typing import Set
 
-from .condition import AbstractCondition, Table
+from .condition import AbstractCondition, Joins, Table
 
 
 def exclude_none(func):
@@ -63,6 +63,10 @@ class AbstractJunction(AbstractCondition, ABC):
         """
         from .query import NamedQuery
 
+        if len(conditions) == 1 and conditions[0] is self:
+            # __new__ returned the only condition, which has already been initialised
+            return
+
         self.conditions = set()
 
         named_query_dict = defaultdict(set)
@@ -106,6 +110,22 @@ class AbstractJunction(AbstractCondition, ABC):
     def __iter__(self):
         return iter(sorted(self.conditions))
 
+    def __len__(self):
+        return len(self.conditions)
+
+    @property
+    def query(self) -> str:
+        """
+        The SQL string selecting the ids of objects matching the combined conditions, e.g.
+        objects with a child matching either of two named queries.
+        """
+        joins = Joins()
+        where = self.where(
+            joins,
+            joins.root
+        )
+        return f"SELECT {joins.root}.id FROM {joins} WHERE {where}"
+
     @property
     def tables(self) -> Set[Table]:
         """
@@ -143,6 +163,19 @@ class AbstractJunction(AbstractCondition, ABC):
             )
         ))
 
+    def where(self, joins: Joins, alias: str, outer: bool = False) -> str:
+        """
+        The combined conditions. Conditions within an OR are compiled as outer conditions,
+        so that they do not exclude objects by inner joining tables.
+        """
+        outer = outer or (isinstance(self, Or) and len(self) > 1)
+        return f" {self.join} ".join(
+            f"({condition.where(joins, alias, outer)})"
+            if isinstance(condition, AbstractJunction)
+            else condition.where(joins, alias, outer)
+            for condition in self
+        )
+
 
 class And(AbstractJunction):
     @property
@@ -3,7 +3,8 @@ from numbers import Real
 from typing import Optional, Set
 
 import autofit.database.query_model.condition as c
-from autofit.database.query_model.junction import AbstractJunction
+from autofit.database.query_model.condition import Joins
+from autofit.database.query_model.junction import AbstractJunction, Or
 
 
 def _make_comparison(
@@ -101,36 +102,64 @@ class NamedQuery(c.AbstractCondition):
     def __repr__(self):
         return self.query
 
-    @property
-    def tables_string(self) -> str:
+    def _where(
+            self,
+            joins: Joins,
+            alias: str
+    ) -> str:
         """
-        A string found in the FROM component. Includes aliasing and join
-        statements if there is more than one table.
-
-        Currently it is assumed that only the object table and up to one
-        further table are required to execute any given query.
+        The condition that the object aliased alias has the name of this query and
+        matches its child condition
         """
-        tables = sorted(self.tables)
-        first = tables[0]
+        where = c.NameCondition(
+            self.name
+        ).where(
+            joins, alias
+        )
+        if not self.other_condition:
+            return where
 
-        string = str(first)
+        other = self.other_condition.where(
+            joins, alias
+        )
+        if isinstance(self.other_condition, Or):
+            other = f"({other})"
+        return f"{where} AND {other}"
 
-        if len(tables) == 2:
-            second = tables[1]
-            string = f"{string} JOIN {second} ON {first.abbreviation}.id = {second.abbreviation}.id"
-        if len(tables) > 2:
-            raise AssertionError(
-                "Currently maximum of 2 tables supported"
-            )
+    def where(
+            self,
+            joins: Joins,
+            alias: str,
+            outer: bool = False
+    ) -> str:
+        """
+        The condition that the object aliased alias has a child matching this query.
 
-        return string
+        The child is joined to its parent, so that a path query compiles to a chain of
+        joins. Within an OR a join would require the child to exist in every branch, so
+        the child is instead matched by a subquery.
+        """
+        if outer:
+            return f"{alias}.id IN ({self.query})"
+        return self._where(
+            joins,
+            joins.child(alias)
+        )
 
     @property
     def query(self) -> str:
         """
         The SQL string produced by this query. This is applied directly to the database.
+
+        The query selects the parent ids of objects matching the query. Each step of a
+        path is joined to the previous step, with as many tables as the path requires.
         """
-        return f"SELECT parent_id FROM {self.tables_string} WHERE {self.condition}"
+        joins = Joins()
+        where = self._where(
+            joins,
+            joins.root
+        )
+        return f"SELECT {joins.root}.parent_id FROM {joins} WHERE {where}"
 
     def __str__(self):
         return f"o.id IN ({self.query})"
@@ -266,7 +295,10 @@ class NamedQuery(c.AbstractCondition):
         ):
             return NamedQuery(
                 self.name,
-                self.other_condition == other
+                self.other_condition._recursive_comparison(
+                    symbol,
+                    other
+                )
             )
 
         if isinstance(
@@ -280,3 +312,124 @@ class NamedQuery(c.AbstractCondition):
         raise AssertionError(
             f"Cannot evaluate equality to type {type(other)}"
         )
+
+
+class PathQuery(c.AbstractCondition):
+    def __init__(
+            self,
+            path: str,
+            condition: Optional[c.AbstractCondition] = None
+    ):
+        """
+        A query on the object at a given path from the root of each model, e.g.
+
+        q.P("galaxies.lens.mass.centre_0") > 1
+
+        which matches the roots of models for which that object satisfies the condition.
+
+        The path of every object is stored in the object table, so the object is found by a
+        single indexed lookup on its path rather than by joining each step of the path as a
+        NamedQuery does. Unlike a NamedQuery the path is always taken from the root.
+
+        Parameters
+        ----------
+        path
+            Names of attributes separated by full stops
+        condition
+            A condition the object at the path must satisfy
+        """
+        self.path = path
+        self.condition = condition
+
+    @property
+    def tables(self) -> Set[c.Table]:
+        tables = {c.object_table}
+        if self.condition is not None:
+            tables |= self.condition.tables
+        return tables
+
+    @property
+    def query(self) -> str:
+        """
+        The SQL string selecting the ids of the roots of matching models
+        """
+        joins = Joins()
+        where = f"{joins.root}.path = {c.quote(self.path)}"
+        if self.condition is not None:
+            other = self.condition.where(
+                joins,
+                joins.root
+            )
+            if isinstance(self.condition, Or):
+                other = f"({other})"
+            where = f"{where} AND {other}"
+        return f"SELECT {joins.root}.root_id FROM {joins} WHERE {where}"
+
+    def where(
+            self,
+            joins: Joins,
+            alias: str,
+            outer: bool = False
+    ) -> str:
+        return f"{alias}.id IN ({self.query})"
+
+    def __str__(self):
+        return f"o.id IN ({self.query})"
+
+    def __repr__(self):
+        return self.query
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __getattr__(self, item: str) -> "PathQuery":
+        """
+        Extend the path, e.g. q.P("galaxies").lens.mass
+        """
+        if item.startswith("_"):
+            raise AttributeError(item)
+        if self.condition is not None:
+            raise AssertionError(
+                "Can only extend a path without a condition"
+            )
+        return PathQuery(
+            f"{self.path}.{item}"
+        )
+
+    def _comparison(
+            self,
+            symbol: str,
+            other
+    ) -> "PathQuery":
+        if self.condition is not None:
+            raise AssertionError(
+                "Cannot compare a path which already has a condition"
+            )
+        return PathQuery(
+            self.path,
+            _make_comparison(
+                symbol,
+                other
+            )
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, c.AbstractCondition):
+            return str(self) == str(other)
+        return self._comparison("=", other)
+
+    def __gt__(self, other):
+        if isinstance(other, c.AbstractCondition):
+            return super().__gt__(other)
+        return self._comparison(">", other)
+
+    def __ge__(self, other):
+        return self._comparison(">=", other)
+
+    def __lt__(self, other):
+        if isinstance(other, c.AbstractCondition):
+            return super().__lt__(other)
+        return self._comparison("<", other)
+
+    def __le__(self, other):
+        return self._comparison("<=", other)
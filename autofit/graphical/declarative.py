@@ -9,6 +9,7 @@ from autofit.graphical.expectation_propagation import EPMeanField
 from autofit.graphical.expectation_propagation import EPOptimiser
 from autofit.graphical.factor_graphs.factor import Factor
 from autofit.graphical.factor_graphs.graph import FactorGraph
+from autofit.graphical.factor_graphs.mapping import AbstractFactorMap
 from autofit.graphical.messages import NormalMessage
 from autofit.mapper.prior.prior import Prior
 from autofit.mapper.prior_model.collection import CollectionPriorModel
@@ -225,12 +226,58 @@ class AbstractModelFactor(Analysis, ABC):
         ])
 
 
+class ModelFactorFunction:
+    def __init__(
+            self,
+            prior_model: AbstractPriorModel,
+            analysis: Analysis
+    ):
+        """
+        The function wrapped by a ModelFactor. This is a class rather than a
+        closure so that it can be pickled and sent to worker processes.
+        """
+        self.prior_model = prior_model
+        self.analysis = analysis
+
+    def __call__(
+            self,
+            **kwargs: np.ndarray
+    ) -> float:
+        """
+        Returns an instance of the prior model and evaluates it, forming
+        a factor.
+
+        Parameters
+        ----------
+        kwargs
+            Arguments with names that are unique for each prior.
+
+        Returns
+        -------
+        Calculated likelihood
+        """
+        arguments = dict()
+        for name, array in kwargs.items():
+            prior_id = int(name.split("_")[1])
+            prior = self.prior_model.prior_with_id(
+                prior_id
+            )
+            arguments[prior] = array
+        instance = self.prior_model.instance_for_arguments(
+            arguments
+        )
+        return self.analysis.log_likelihood_function(
+            instance
+        )
+
+
 class ModelFactor(Factor, AbstractModelFactor):
     def __init__(
             self,
             prior_model: AbstractPriorModel,
             analysis: Analysis,
-            optimiser: Optional[AbstractFactorOptimiser] = None
+            optimiser: Optional[AbstractFactorOptimiser] = None,
+            map_strategy: Optional[AbstractFactorMap] = None
     ):
         """
         A factor in the graph that actually computes the likelihood of a model
@@ -246,6 +293,9 @@ class ModelFactor(Factor, AbstractModelFactor):
         optimiser
             A custom optimiser that will be used to fit this factor specifically
             instead of the default optimiser
+        map_strategy
+            How the likelihood is evaluated for multiple samples at once, e.g.
+            a ThreadMap or ProcessMap to evaluate them in parallel
         """
         self.prior_model = prior_model
         self.analysis = analysis
@@ -257,38 +307,12 @@ class ModelFactor(Factor, AbstractModelFactor):
             in prior_model.priors
         }
 
-        def _factor(
-                **kwargs: np.ndarray
-        ) -> float:
-            """
-            Returns an instance of the prior model and evaluates it, forming
-            a factor.
-
-            Parameters
-            ----------
-            kwargs
-                Arguments with names that are unique for each prior.
-
-            Returns
-            -------
-            Calculated likelihood
-            """
-            arguments = dict()
-            for name, array in kwargs.items():
-                prior_id = int(name.split("_")[1])
-                prior = prior_model.prior_with_id(
-                    prior_id
-                )
-                arguments[prior] = array
-            instance = prior_model.instance_for_arguments(
-                arguments
-            )
-            return analysis.log_likelihood_function(
-                instance
-            )
-
         super().__init__(
-            _factor,
+            ModelFactorFunction(
+                prior_model,
+                analysis
+            ),
+            map_strategy=map_strategy,
             **prior_variable_dict
         )
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import Executor
 from itertools import count
 from typing import (
     Dict, Tuple, Optional, List,
@@ -13,6 +14,7 @@ from autofit.graphical.factor_graphs import (
 )
 from autofit.graphical.mean_field import MeanField, FactorApproximation
 from autofit.graphical.messages.abstract import AbstractMessage
+from autofit.graphical.messages.fixed import FixedMessage
 from autofit.graphical.utils import Status
 from autofit.mapper.variable import Variable
 
@@ -58,6 +60,10 @@ class EPMeanField(FactorGraph):
     project_factor_approx(factor_approximation)
         given the passed FactorApproximation, return a new `EPMeanField`
         object encoding the updated mean-field approximation
+
+    project_factor_dists(factor_dists, delta)
+        return a new `EPMeanField` object with the mean-field approximations
+        of several factors replaced at once, damped by delta
     '''
 
     def __init__(
@@ -143,6 +149,57 @@ class EPMeanField(FactorGraph):
 
     project = project_factor_approx
 
+    def project_factor_dists(
+            self,
+            factor_dists: Dict[Factor, MeanField],
+            delta: float = 1.,
+            status: Optional[Status] = None,
+    ) -> Tuple["EPMeanField", Status]:
+        """
+        Replace the mean-field approximations of several factors in one
+        step, e.g. the projections of a parallel sweep which were each
+        calculated from the cavity distributions of this approximation.
+
+        As the factors are updated simultaneously each new message is
+        damped towards the current message,
+
+        q_f = q_new^δ q_old^(1-δ)
+
+        with messages whose damped update is invalid left unchanged
+        """
+        success, messages = Status() if status is None else status
+        assert 0 < delta <= 1
+
+        factor_mean_field = self.factor_mean_field
+        for factor, factor_dist in factor_dists.items():
+            if delta != 1:
+                last_dist = factor_mean_field[factor]
+                damped = {}
+                for v, q_f1 in factor_dist.items():
+                    q_f0 = last_dist[v]
+                    if isinstance(q_f1, FixedMessage):
+                        damped[v] = q_f1
+                        continue
+
+                    q_f1 = (q_f1 ** delta).sum_natural_parameters(
+                        q_f0 ** (1 - delta))
+                    if not q_f1.is_valid:
+                        q_f1 = q_f1.update_invalid(q_f0)
+                        messages += (
+                            f"damped projection for {v} with {factor} "
+                            "contained invalid values",)
+
+                    damped[v] = q_f1
+
+                factor_dist = MeanField(damped, log_norm=factor_dist.log_norm)
+
+            factor_mean_field[factor] = factor_dist
+
+        new_approx = type(self)(
+            factor_graph=self._factor_graph,
+            factor_mean_field=factor_mean_field)
+        return new_approx, Status(success, messages)
+
     @property
     def mean_field(self) -> MeanField:
         return MeanField.prod(
@@ -240,6 +297,20 @@ class AbstractFactorOptimiser(ABC):
 EPCallBack = Callable[[Factor, EPMeanField, Status], bool]
 
 
+def optimise_factor_dist(
+        optimiser: AbstractFactorOptimiser,
+        factor: Factor,
+        model_approx: EPMeanField,
+) -> Tuple[MeanField, Status]:
+    """
+    Optimise a single factor of model_approx, returning only the new
+    mean-field approximation of that factor so that the factors of a
+    parallel sweep can be merged afterwards
+    """
+    new_approx, status = optimiser.optimise(factor, model_approx)
+    return new_approx.factor_mean_field[factor], status
+
+
 class EPHistory:
     def __init__(
             self,
@@ -312,6 +383,19 @@ class EPHistory:
 
 class EPOptimiser:
     """
+    Runs expectation propagation over the factors of a factor graph.
+
+    By default the factors are updated one after another, each using the
+    approximation produced by the last. If a pool (a
+    `concurrent.futures.Executor`) is passed the factors of each sweep are
+    instead optimised concurrently from the same cavity state and their
+    projections merged into the approximation in one step, damped by delta.
+
+    A `ThreadPoolExecutor` suits factors whose likelihoods release the GIL
+    (e.g. numpy heavy factors). With a `ProcessPoolExecutor` the factors and
+    their optimisers must be picklable and any state an optimiser keeps
+    between updates (e.g. the transforms of the `LaplaceFactorOptimiser`)
+    is not carried back from the worker processes.
     """
 
     def __init__(
@@ -320,7 +404,9 @@ class EPOptimiser:
             default_optimiser: AbstractFactorOptimiser = None,
             factor_optimisers: Dict[Factor, AbstractFactorOptimiser] = None,
             callback: Optional[EPCallBack] = None,
-            factor_order: Optional[List[Factor]] = None
+            factor_order: Optional[List[Factor]] = None,
+            pool: Optional[Executor] = None,
+            delta: float = 0.5,
     ):
         factor_optimisers = factor_optimisers or {}
         self.factor_graph = factor_graph
@@ -340,12 +426,17 @@ class EPOptimiser:
                 for factor in self.factors}
 
         self.callback = callback or EPHistory()
+        self.pool = pool
+        self.delta = delta
 
     def run(
             self,
             model_approx: EPMeanField,
             max_steps=100,
     ) -> EPMeanField:
+        if self.pool is not None:
+            return self._run_parallel(model_approx, max_steps)
+
         for _ in range(max_steps):
             for factor, optimiser in self.factor_optimisers.items():
                 model_approx, status = optimiser.optimise(factor, model_approx)
@@ -356,3 +447,44 @@ class EPOptimiser:
             break  # stop iterations
 
         return model_approx
+
+    def _run_parallel(
+            self,
+            model_approx: EPMeanField,
+            max_steps=100,
+    ) -> EPMeanField:
+        for _ in range(max_steps):
+            model_approx, status = self.parallel_step(model_approx)
+            # every factor is passed to the callback so the history of each
+            # factor is recorded before convergence is decided
+            stops = [
+                self.callback(factor, model_approx, status)
+                for factor in self.factor_optimisers]
+            if any(stops):
+                break
+
+        return model_approx
+
+    def parallel_step(
+            self,
+            model_approx: EPMeanField,
+    ) -> Tuple[EPMeanField, Status]:
+        """
+        Optimise every factor from the cavity distributions of model_approx
+        in the pool and merge the resulting projections
+        """
+        futures = {
+            factor: self.pool.submit(
+                optimise_factor_dist, optimiser, factor, model_approx)
+            for factor, optimiser in self.factor_optimisers.items()}
+
+        success, messages = True, ()
+        factor_dists = {}
+        for factor, future in futures.items():
+            factor_dists[factor], (factor_success, factor_messages) = \
+                future.result()
+            success = success and factor_success
+            messages += factor_messages
+
+        return model_approx.project_factor_dists(
+            factor_dists, delta=self.delta, status=Status(success, messages))
@@ -7,6 +7,11 @@ from .factor import \
 from .jacobians import \
     FactorJacobian, DeterministicFactorJacobian
 from .graph import FactorGraph
+from .differentiation import \
+    AbstractJacobian, NumericalJacobian, BatchedNumericalJacobian, \
+    AnalyticJacobian, JaxJacobian
+from .mapping import \
+    AbstractFactorMap, SerialMap, ThreadMap, ProcessMap
 from .transform import \
     DiagonalTransform, CholeskyTransform, VariableTransform, \
     FullCholeskyTransform, identity_transform, TransformedNode
@@ -26,11 +26,22 @@ class FactorValue(np.ndarray):
         if obj is None: return
         self.deterministic_values = getattr(
             obj, 'deterministic_values', None)
+
+    def __reduce__(self):
+        # include the deterministic values when pickled, e.g. when
+        # returned from a factor evaluated in another process
+        reconstruct, arguments, state = super().__reduce__()
+        return reconstruct, arguments, (state, self.deterministic_values)
+
+    def __setstate__(self, state):
+        state, self.deterministic_values = state
+        super().__setstate__(state)
         
     @property
     def log_value(self) -> np.ndarray:
         if self.shape:
-            return self.base
+            # an unpickled value does not share memory with another array
+            return self.base if self.base is not None else self.view(np.ndarray)
         else:
             return self.item()
         
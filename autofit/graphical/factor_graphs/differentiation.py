@@ -0,0 +1,270 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from autofit.graphical.factor_graphs.abstract import \
+    FactorValue, JacobianValue, HessianValue
+from autofit.graphical.factor_graphs.numerical import \
+    numerical_func_jacobian, numerical_func_jacobian_hessian
+from autofit.graphical.utils import aggregate, Axis
+from autofit.mapper.variable import Variable
+
+
+def _aggregate_batch(array: np.ndarray, axis: Axis) -> np.ndarray:
+    """
+    aggregates each element along the first dimension of array as if
+    it had been aggregated on its own
+    """
+    if axis is False:
+        return array
+    elif axis is None:
+        return np.sum(array, axis=tuple(range(1, np.ndim(array))))
+    elif isinstance(axis, int):
+        return np.sum(array, axis=axis + 1)
+    else:
+        return np.sum(array, axis=tuple(a + 1 for a in axis))
+
+
+def _unbatch(
+        array: np.ndarray,
+        value0: np.ndarray,
+        x_shape: Tuple[int, ...],
+        eps: float
+) -> np.ndarray:
+    """
+    Turns the values for a batch of perturbations, one perturbation for each
+    element of x, into a jacobian of shape value_shape + x_shape
+    """
+    # values which do not depend on the perturbations, e.g. the log value
+    # of a deterministic factor, are not repeated for each sample
+    array = np.broadcast_to(
+        array, (int(np.prod(x_shape)),) + np.shape(value0))
+    grad = (array - np.expand_dims(value0, 0)) / eps
+    return np.moveaxis(grad, 0, -1).reshape(np.shape(value0) + x_shape)
+
+
+class AbstractJacobian(ABC):
+    """
+    Calculates the Jacobian, and Hessian, of the value of a factor
+
+    Methods
+    -------
+    func_jacobian(factor, values, variables=(x,), axis=axis)
+        returns the value of the factor and the jacobian of its value
+        with respect to the variables, in the same form as
+        `numerical_func_jacobian`
+
+    func_jacobian_hessian(factor, values, variables=(x,), axis=axis)
+        returns the value, jacobian and hessian of the factor, by default
+        the hessian is calculated by finite differences of the jacobian
+
+    check(factor, values)
+        checks the jacobian calculated by this backend against the
+        element-wise finite differences of `numerical_func_jacobian`
+    """
+    @abstractmethod
+    def func_jacobian(
+            self,
+            factor: "Factor",
+            values: Dict[Variable, np.ndarray],
+            variables: Optional[Tuple[Variable, ...]] = None,
+            axis: Axis = False,
+            _eps: float = 1e-6,
+            _calc_deterministic: bool = True,
+    ) -> Tuple[FactorValue, JacobianValue]:
+        pass
+
+    def func_jacobian_hessian(
+            self,
+            factor: "Factor",
+            values: Dict[Variable, np.ndarray],
+            variables: Optional[Tuple[Variable, ...]] = None,
+            axis: Axis = False,
+            _eps: float = 1e-6,
+            _calc_deterministic: bool = True,
+    ) -> Tuple[FactorValue, JacobianValue, HessianValue]:
+        # numerical_func_jacobian_hessian differentiates factor.jacobian
+        # which is calculated by this backend
+        return numerical_func_jacobian_hessian(
+            factor, values, variables, axis,
+            _eps=_eps, _calc_deterministic=_calc_deterministic)
+
+    def check(
+            self,
+            factor: "Factor",
+            values: Dict[Variable, np.ndarray],
+            variables: Optional[Tuple[Variable, ...]] = None,
+            axis: Axis = False,
+            rtol: float = 1e-3,
+            atol: float = 1e-3,
+            _eps: float = 1e-6,
+    ) -> bool:
+        """
+        Returns whether the value and jacobian calculated by this backend,
+        including the jacobians of any deterministic variables, match
+        those calculated by `numerical_func_jacobian`
+        """
+        fval, fjac = self.func_jacobian(
+            factor, values, variables, axis, _eps=_eps)
+        fval0, fjac0 = numerical_func_jacobian(
+            factor, values, variables, axis, _eps=_eps)
+
+        def allclose(a, b):
+            return np.allclose(a, b, rtol=rtol, atol=atol)
+
+        return (
+            allclose(fval, fval0)
+            and fjac.keys() == fjac0.keys()
+            and all(
+                allclose(fjac[v], jac0)
+                and all(
+                    allclose(fjac[v].deterministic_values[d], djac0)
+                    for d, djac0 in jac0.deterministic_values.items())
+                for v, jac0 in fjac0.items()
+            )
+        )
+
+
+class NumericalJacobian(AbstractJacobian):
+    """
+    Finite differences perturbing one element of each variable at a time,
+    so that a factor is called once per element
+    """
+    def func_jacobian(
+            self, factor, values, variables=None, axis=False,
+            _eps=1e-6, _calc_deterministic=True):
+        return numerical_func_jacobian(
+            factor, values, variables, axis,
+            _eps=_eps, _calc_deterministic=_calc_deterministic)
+
+
+class BatchedNumericalJacobian(AbstractJacobian):
+    """
+    Finite differences where every perturbation of a variable is passed to
+    the factor as a batch of samples in a single call.
+
+    A vectorised factor evaluates the batch at once, otherwise the factor
+    evaluates the samples using its map_strategy.
+    """
+    def func_jacobian(
+            self, factor, values, variables=None, axis=False,
+            _eps=1e-6, _calc_deterministic=True):
+        if variables is None:
+            variables = factor.variables
+
+        p0 = {v: np.array(x, dtype=float) for v, x in values.items()}
+        f0 = factor(p0, axis=axis)
+        log_f0 = np.asarray(f0)
+        det_vars0 = f0.deterministic_values
+
+        fjac = {}
+        for v in variables:
+            x0 = p0[v]
+            n = x0.size
+            # one perturbed copy of x0 for each of its elements
+            perturbed = np.repeat(x0.reshape(1, n), n, axis=0)
+            perturbed[np.arange(n), np.arange(n)] += _eps
+
+            batch = {u: x[None] for u, x in p0.items()}
+            batch[v] = perturbed.reshape((n,) + x0.shape)
+            f = factor(batch, axis=False)
+
+            grad = FactorValue(_unbatch(
+                _aggregate_batch(np.asarray(f), axis), log_f0,
+                x0.shape, _eps))
+            if _calc_deterministic:
+                grad.deterministic_values = {
+                    det: _unbatch(
+                        f.deterministic_values[det], val, x0.shape, _eps)
+                    for det, val in det_vars0.items()
+                }
+            fjac[v] = grad
+
+        return f0, fjac
+
+
+class AnalyticJacobian(AbstractJacobian):
+    def __init__(self, gradient: Callable):
+        """
+        The jacobian of a factor calculated by a gradient function supplied
+        by the user.
+
+        Parameters
+        ----------
+        gradient
+            Called with the same keyword arguments as the factor's function,
+            returns a dictionary mapping the name of each argument to the
+            gradient of the function's value with respect to that argument,
+            with shape value_shape + argument_shape.
+        """
+        self.gradient = gradient
+
+    def gradients(
+            self,
+            factor: "Factor",
+            kwargs: Dict[str, np.ndarray],
+            names: Tuple[str, ...]
+    ) -> Dict[str, np.ndarray]:
+        return self.gradient(**kwargs)
+
+    def func_jacobian(
+            self, factor, values, variables=None, axis=False,
+            _eps=1e-6, _calc_deterministic=True):
+        if factor.deterministic_variables:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not calculate the jacobians of "
+                "deterministic variables, use a FactorJacobian")
+
+        if variables is None:
+            variables = factor.variables
+
+        f = factor(values, axis=False)
+        log_f = np.asarray(f)
+        fval = FactorValue(aggregate(log_f, axis), {})
+
+        kwargs = factor.resolve_variable_dict(values)
+        names = tuple(factor._variable_name_kw[v.name] for v in variables)
+        gradients = self.gradients(factor, kwargs, names)
+
+        grad_axis = tuple(range(np.ndim(log_f))) if axis is None else axis
+        fjac = {
+            v: FactorValue(aggregate(
+                np.reshape(
+                    gradients[name],
+                    np.shape(log_f) + np.shape(values[v])),
+                grad_axis), {})
+            for v, name in zip(variables, names)
+        }
+        return fval, fjac
+
+
+class JaxJacobian(AnalyticJacobian):
+    def __init__(self):
+        """
+        The jacobian of a factor calculated by automatic differentiation
+        with jax. The factor's function must be written using jax.numpy.
+        """
+        try:
+            import jax
+        except ImportError:
+            raise ImportError(
+                "jax must be installed to use the JaxJacobian")
+
+        self.jax = jax
+        super().__init__(gradient=None)
+
+    def gradients(self, factor, kwargs, names):
+        def func(*args):
+            return factor._factor(**{**kwargs, **dict(zip(names, args))})
+
+        jacobians = self.jax.jacfwd(
+            func, argnums=tuple(range(len(names))))(
+                *(kwargs[name] for name in names))
+        return {
+            name: np.asarray(jacobian)
+            for name, jacobian in zip(names, jacobians)
+        }
+
+
+numerical_jacobian = NumericalJacobian()
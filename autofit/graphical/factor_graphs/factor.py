@@ -10,7 +10,11 @@ import numpy as np
 from autofit.graphical.utils import \
     aggregate, Axis, cached_property
 from autofit.graphical.factor_graphs.abstract import \
-    AbstractNode, FactorValue, JacobianValue
+    AbstractNode, FactorValue, JacobianValue, HessianValue
+from autofit.graphical.factor_graphs.differentiation import \
+    AbstractJacobian, numerical_jacobian
+from autofit.graphical.factor_graphs.mapping import \
+    AbstractFactorMap, serial_map
 from autofit.mapper.variable import Variable
 
 
@@ -124,6 +128,15 @@ class Factor(AbstractFactor):
     is_scalar: optional, bool
         if true the factor returns a scalar value. Note if multiple arguments
         are passed then a vector will still be returned
+
+    map_strategy: optional, AbstractFactorMap
+        how a factor that is not vectorised is evaluated over multiple
+        inputs, e.g. serially (the default) or with a ThreadMap or ProcessMap
+
+    jacobian_backend: optional, AbstractJacobian
+        how the jacobian and hessian of the factor are calculated, by
+        default by finite differences of each element in turn, see
+        BatchedNumericalJacobian, AnalyticJacobian and JaxJacobian
         
     kwargs: Variables
         Variables for each keyword argument for the function
@@ -157,6 +170,8 @@ class Factor(AbstractFactor):
             name=None,
             vectorised=False,
             is_scalar=False,
+            map_strategy: Optional[AbstractFactorMap] = None,
+            jacobian_backend: Optional[AbstractJacobian] = None,
             **kwargs: Variable
     ):
         """
@@ -166,6 +181,10 @@ class Factor(AbstractFactor):
         ----------
         factor
             A wrapper around some callable
+        map_strategy
+            Evaluates the callable over multiple inputs when not vectorised
+        jacobian_backend
+            Calculates the jacobian and hessian of the factor
         args
             Variables representing positional arguments for the function
         kwargs
@@ -173,6 +192,8 @@ class Factor(AbstractFactor):
         """
         self.vectorised = vectorised
         self.is_scalar = is_scalar
+        self.map_strategy = map_strategy or serial_map
+        self.jacobian_backend = jacobian_backend or numerical_jacobian
         self._factor = factor
 
         args = getfullargspec(self._factor).args
@@ -189,10 +210,32 @@ class Factor(AbstractFactor):
 
         super().__init__(
             **kwargs,
-            name=name or factor.__name__
+            name=name or getattr(factor, "__name__", type(factor).__name__)
         )
 
-    # jacobian = numerical_jacobian
+    def func_jacobian(
+            self,
+            values: Dict[Variable, np.array],
+            variables: Optional[Tuple[Variable, ...]] = None,
+            axis: Axis = False,
+            _eps: float = 1e-6,
+            _calc_deterministic: bool = True
+    ) -> Tuple[FactorValue, JacobianValue]:
+        return self.jacobian_backend.func_jacobian(
+            self, values, variables, axis,
+            _eps=_eps, _calc_deterministic=_calc_deterministic)
+
+    def func_jacobian_hessian(
+            self,
+            values: Dict[Variable, np.array],
+            variables: Optional[Tuple[Variable, ...]] = None,
+            axis: Axis = False,
+            _eps: float = 1e-6,
+            _calc_deterministic: bool = True
+    ) -> Tuple[FactorValue, JacobianValue, HessianValue]:
+        return self.jacobian_backend.func_jacobian_hessian(
+            self, values, variables, axis,
+            _eps=_eps, _calc_deterministic=_calc_deterministic)
 
     def __hash__(self) -> int:
         # TODO: might this break factor repetition somewhere?
@@ -352,10 +395,7 @@ class Factor(AbstractFactor):
                 yield {
                     k: next(a) for k, a in iter_kws.items()}
 
-        # TODO this loop can also be parallelised for increased performance
-        res = np.array([
-            self._factor(**kws)
-            for kws in gen_kwargs()])
+        res = np.array(self.map_strategy(self._factor, gen_kwargs()))
 
         return res
 
@@ -449,6 +489,8 @@ class Factor(AbstractFactor):
         return DeterministicFactor(
             self._factor,
             other,
+            map_strategy=self.map_strategy,
+            jacobian_backend=self.jacobian_backend,
             **self._kwargs
         )
 
@@ -1,4 +1,5 @@
 from collections import Counter, defaultdict
+from concurrent.futures import Executor
 from typing import \
     Tuple, Dict, Collection, List, Callable, Optional, Union
 from functools import reduce 
@@ -16,6 +17,7 @@ class FactorGraph(AbstractNode):
     def __init__(
             self,
             factors: Collection[Factor],
+            executor: Optional[Executor] = None,
     ):
         """
         A graph relating factors
@@ -24,10 +26,17 @@ class FactorGraph(AbstractNode):
         ----------
         factors
             Nodes wrapping individual factors in a model
+        executor
+            If passed, the factors of each call set (which do not depend on
+            each other) are evaluated concurrently by this executor. A
+            ThreadPoolExecutor suits factors which release the GIL (e.g.
+            those spending their time in numpy) while a ProcessPoolExecutor
+            suits pure python factors, which must then be picklable.
         """
         self._name = "(%s)" % "*".join(f.name for f in factors)
 
         self._factors = tuple(factors)
+        self.executor = executor
 
         self._factor_all_variables = {
             f: f.all_variables for f in self._factors
@@ -73,6 +82,15 @@ class FactorGraph(AbstractNode):
     def name(self):
         return self._name
 
+    def with_executor(
+            self,
+            executor: Optional[Executor]
+    ) -> "FactorGraph":
+        """
+        A copy of this graph which evaluates its factors using executor
+        """
+        return FactorGraph(self.factors, executor=executor)
+
     def _validate(self):
         """
         Raises
@@ -184,9 +202,7 @@ class FactorGraph(AbstractNode):
             )
 
         for calls in self._call_sequence:
-            # TODO parallelise this part?
-            for factor in calls:
-                ret = factor(variables)
+            for factor, ret in zip(calls, self._call_factors(calls, variables)):
                 ret_value = self.broadcast_plates(factor.plates, ret.log_value)
                 log_value = add_arrays(log_value, aggregate(ret_value, axis))
                 det_values.update(ret.deterministic_values)
@@ -194,6 +210,25 @@ class FactorGraph(AbstractNode):
 
         return FactorValue(log_value, det_values)
 
+    def _call_factors(
+            self,
+            calls: List[Factor],
+            variables: Dict[Variable, np.ndarray],
+    ) -> List[FactorValue]:
+        """
+        Evaluate the factors of a call set, concurrently if this graph has an
+        executor. The values are returned in the order of the factors so the
+        result does not depend on the order in which the calls complete.
+        """
+        if self.executor is None or len(calls) == 1:
+            return [factor(variables) for factor in calls]
+
+        futures = [
+            self.executor.submit(factor, variables)
+            for factor in calls
+        ]
+        return [future.result() for future in futures]
+
     def __mul__(self, other: AbstractNode) -> "FactorGraph":
         """
         Combine this object with another factor node or graph, creating
@@ -210,7 +245,7 @@ class FactorGraph(AbstractNode):
                 f"type of passed element {(type(other))} "
                 "does not match required types, (`FactorGraph`, `FactorNode`)")
 
-        return type(self)(factors)
+        return type(self)(factors, executor=self.executor)
 
     def __repr__(self) -> str:
         factors_str = " * ".join(map(repr, self.factors))
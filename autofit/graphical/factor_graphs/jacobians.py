@@ -9,8 +9,11 @@ import numpy as np
 from autofit.mapper.variable import Variable
 from autofit.graphical.factor_graphs.abstract import \
     FactorValue, JacobianValue
+from autofit.graphical.factor_graphs.differentiation import \
+    AbstractJacobian, numerical_jacobian
 from autofit.graphical.factor_graphs.factor import \
     AbstractFactor, Factor, DeterministicFactor
+from autofit.graphical.factor_graphs.mapping import serial_map
 from autofit.graphical.utils import \
     aggregate, Axis, cached_property
 
@@ -48,6 +51,10 @@ class FactorJacobian(Factor):
         if true the factor returns a scalar value. Note if multiple arguments
         are passed then a vector will still be returned
 
+    jacobian_backend: optional, AbstractJacobian
+        calculates the hessian of the factor from its analytic jacobian,
+        e.g. BatchedNumericalJacobian
+
     kwargs: Variables
         Variables for each keyword argument for the function
     """
@@ -58,10 +65,14 @@ class FactorJacobian(Factor):
             name=None,
             vectorised=False,
             is_scalar=False, 
+            jacobian_backend: Optional[AbstractJacobian] = None,
             **kwargs: Variable
     ):
         self.vectorised = vectorised
         self.is_scalar = is_scalar
+        self.map_strategy = serial_map
+        # the jacobian is analytic, the backend calculates the hessian
+        self.jacobian_backend = jacobian_backend or numerical_jacobian
         self._factor = factor_jacobian
         AbstractFactor.__init__(
             self, 
@@ -244,6 +255,7 @@ class FactorJacobian(Factor):
         return DeterministicFactorJacobian(
             self._factor,
             other,
+            jacobian_backend=self.jacobian_backend,
             **self._kwargs
         )
 
@@ -0,0 +1,176 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+Kwargs = Dict[str, np.ndarray]
+
+
+def _call_with_kwargs(args):
+    factor, kwargs = args
+    return factor(**kwargs)
+
+
+def _call_chunk(factor: Callable, chunk: List[Kwargs]) -> list:
+    return [factor(**kwargs) for kwargs in chunk]
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class AbstractFactorMap(ABC):
+    """
+    Strategy used by a non-vectorised `Factor` to evaluate its function over
+    the samples it is passed, e.g. the draws of an `ImportanceSampler`.
+
+    Strategies holding workers can be used as context managers, which close
+    the workers on exit.
+    """
+
+    @abstractmethod
+    def __call__(
+            self,
+            factor: Callable,
+            kwargs: Iterable[Kwargs]
+    ) -> list:
+        """
+        Call factor with each set of keyword arguments, returning the values
+        in the same order as the arguments
+        """
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SerialMap(AbstractFactorMap):
+    """
+    Evaluate the samples one after another in this process
+    """
+
+    def __call__(self, factor, kwargs):
+        return [factor(**kws) for kws in kwargs]
+
+
+serial_map = SerialMap()
+
+
+class ThreadMap(AbstractFactorMap):
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            chunksize: int = 1
+    ):
+        """
+        Evaluate the samples in a pool of threads. This suits factors which
+        release the GIL, e.g. those spending most of their time in numpy.
+
+        Parameters
+        ----------
+        max_workers
+            The number of threads, see `ThreadPoolExecutor`
+        chunksize
+            The number of samples submitted to a thread at once
+        """
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers)
+        return self._executor
+
+    def __call__(self, factor, kwargs):
+        futures = [
+            self.executor.submit(_call_chunk, factor, chunk)
+            for chunk in _chunks(kwargs, self.chunksize)
+        ]
+        return [
+            value
+            for future in futures
+            for value in future.result()
+        ]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self):
+        return {**self.__dict__, "_executor": None}
+
+
+class ProcessMap(AbstractFactorMap):
+    def __init__(
+            self,
+            processes: int,
+            chunksize: int = 1
+    ):
+        """
+        Evaluate the samples in a pool of processes. This suits factors
+        written in pure python, which must be picklable.
+
+        The factor function (e.g. the analysis and model of a `ModelFactor`)
+        is sent to each worker once, when it is first evaluated, after which
+        only the samples and values pass between processes.
+
+        Parameters
+        ----------
+        processes
+            The number of worker processes
+        chunksize
+            The number of samples sent to a worker at once
+        """
+        self.processes = processes
+        self.chunksize = chunksize
+        self._pool = None
+        self._factor = None
+        self._worker_factor = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            from autofit.non_linear.pool import SearchPool
+            self._pool = SearchPool(self.processes)
+        return self._pool
+
+    def __call__(self, factor, kwargs):
+        if factor is not self._factor:
+            self._worker_factor = self.pool.install(factor)
+            self._factor = factor
+
+        return self.pool.map(
+            _call_with_kwargs,
+            [(self._worker_factor, kws) for kws in kwargs],
+            self.chunksize
+        )
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            self._factor = None
+            self._worker_factor = None
+
+    def __getstate__(self):
+        return {
+            **self.__dict__,
+            "_pool": None,
+            "_factor": None,
+            "_worker_factor": None,
+        }
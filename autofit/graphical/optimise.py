@@ -275,6 +275,109 @@ def update_det_cov(
     return res
 
 
+class BroydenJacobianCache:
+    def __init__(
+            self,
+            refresh_every: int = 10,
+            max_step: float = 0.5,
+    ):
+        """
+        Caches the Jacobian of the deterministic variables of each factor
+        with respect to its free variables between EP iterations.
+
+        When a factor is optimised again the cached Jacobian is updated
+        with a Broyden rank-one update,
+
+        J₁ = J₀ + (Δy - J₀ Δx) Δxᵀ / (Δxᵀ Δx)
+
+        where Δx is the change in the mode of the free variables and Δy the
+        change in the deterministic values, which are known without further
+        factor evaluations. The Jacobian is recomputed in full every
+        refresh_every iterations, or when the mode moves far enough for the
+        update to be unreliable.
+
+        Parameters
+        ----------
+        refresh_every
+            The number of Broyden updates after which the Jacobian is
+            recomputed
+        max_step
+            The Jacobian is recomputed if the step in the free variables is
+            larger than this fraction of their norm (or of 1 if larger)
+        """
+        self.refresh_every = refresh_every
+        self.max_step = max_step
+        self._cache = {}
+        self.n_refresh = 0
+        self.n_update = 0
+
+    def __call__(
+            self,
+            factor: Factor,
+            mode: ArraysDict,
+            free_vars: Tuple[Variable, ...],
+    ) -> Dict[Variable, Dict[Variable, np.ndarray]]:
+        """
+        The Jacobian of each deterministic variable of factor with respect
+        to each free variable, at mode, which must include the values of
+        the deterministic variables
+        """
+        det_vars = tuple(factor.deterministic_variables)
+        if not det_vars:
+            return {}
+
+        x = {v: np.asarray(mode[v], dtype=float) for v in free_vars}
+        y = {d: np.asarray(mode[d], dtype=float) for d in det_vars}
+
+        cached = self._cache.get(factor)
+        if cached is not None:
+            x0, y0, jacobian, n_updates = cached
+            if x0.keys() == x.keys() and n_updates < self.refresh_every:
+                dx = {v: (x[v] - x0[v]).ravel() for v in x}
+                step2 = sum(np.dot(d, d) for d in dx.values())
+                norm2 = sum(np.sum(np.square(x0[v])) for v in x)
+                if step2 <= self.max_step ** 2 * max(norm2, 1.):
+                    jacobian = self._update(jacobian, dx, step2, y0, y)
+                    self._cache[factor] = x, y, jacobian, n_updates + 1
+                    self.n_update += 1
+                    return jacobian
+
+        jacobian = {
+            v: dict(grad.items())
+            for v, grad in factor.jacobian(mode, free_vars, axis=None).items()
+        }
+        self._cache[factor] = x, y, jacobian, 0
+        self.n_refresh += 1
+        return jacobian
+
+    @staticmethod
+    def _update(
+            jacobian: Dict[Variable, Dict[Variable, np.ndarray]],
+            dx: Dict[Variable, np.ndarray],
+            step2: float,
+            y0: ArraysDict,
+            y: ArraysDict,
+    ) -> Dict[Variable, Dict[Variable, np.ndarray]]:
+        if step2 == 0:
+            return jacobian
+
+        new_jacobian = {v: {} for v in jacobian}
+        for d in y:
+            # residual of the linear prediction of the change in d
+            residual = (y[d] - y0[d]).ravel()
+            for v, grads in jacobian.items():
+                residual -= grads[d].reshape(residual.size, -1).dot(dx[v])
+
+            for v, grads in jacobian.items():
+                jac = grads[d]
+                new_jacobian[v][d] = (
+                        jac.reshape(residual.size, -1)
+                        + np.outer(residual, dx[v]) / step2
+                ).reshape(jac.shape)
+
+        return new_jacobian
+
+
 class LaplaceFactorOptimiser(AbstractFactorOptimiser):
 
     def __init__(
@@ -285,7 +388,16 @@ class LaplaceFactorOptimiser(AbstractFactorOptimiser):
             initial_values=None,
             opt_kws=None,
             default_opt_kws=None,
+            jacobian_cache: Optional[BroydenJacobianCache] = None,
     ):
+        """
+        Optimises each factor to find its mode and projects Laplace's
+        approximation about the mode on to the mean-field approximation.
+
+        If a jacobian_cache is passed the Jacobians of the deterministic
+        variables, needed for their covariances, are updated between
+        iterations by Broyden's method rather than recomputed each time.
+        """
 
         self.whiten_optimiser = whiten_optimiser
         self.initial_values = {}
@@ -300,6 +412,8 @@ class LaplaceFactorOptimiser(AbstractFactorOptimiser):
         if deltas:
             self.deltas.update(deltas)
 
+        self.jacobian_cache = jacobian_cache
+
         self.default_opt_kws = default_opt_kws or {}
         self.opt_kws = defaultdict(self.default_opt_kws.copy)
         if opt_kws:
@@ -322,12 +436,14 @@ class LaplaceFactorOptimiser(AbstractFactorOptimiser):
         res = opt.maximise(start, status=status, **opt_kws)
 
         # Calculate covariance of deterministic values
-        # TODO: estimate this Jacobian using Broyden's method
-        # https://en.wikipedia.org/wiki/Broyden%27s_method
         value = factor_approx.factor(res.mode)
         res.mode.update(value.deterministic_values)
-        jacobian = factor_approx.factor.jacobian(
-            res.mode, opt.free_vars, axis=None)
+        if self.jacobian_cache is None:
+            jacobian = factor_approx.factor.jacobian(
+                res.mode, opt.free_vars, axis=None)
+        else:
+            jacobian = self.jacobian_cache(
+                factor_approx.factor, res.mode, opt.free_vars)
         update_det_cov(res, jacobian)
 
         self.transforms[factor] = CovarianceTransform.from_dense(
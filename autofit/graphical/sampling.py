@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from collections import defaultdict
 from itertools import chain
-from typing import NamedTuple, Tuple, Dict, Optional, List
+from typing import NamedTuple, Tuple, Dict, Optional, List, Union
 
 import numpy as np
 
@@ -27,6 +27,9 @@ class SamplingResult(NamedTuple):
     log_measure: np.ndarray
     log_propose: np.ndarray
     n_samples: int
+    # the distribution the samples were drawn from, if they were all drawn
+    # from the same distribution
+    proposal_dist: Optional[MeanField] = None
 
     def __add__(self, other: 'SamplingResult') -> 'SamplingResult':
         return merge_sampling_results(self, other)
@@ -60,15 +63,30 @@ def merge_sampling_results(*results: SamplingResult) -> SamplingResult:
     log_propose = np.concatenate([r.log_propose for r in results])
 
     n_samples = sum(r.n_samples for r in results)
+    proposal_dist = results[0].proposal_dist
+    if any(r.proposal_dist is not proposal_dist for r in results):
+        proposal_dist = None
+
     return SamplingResult(
         samples, det_variables, log_weights, log_factor,
-        log_measure, log_propose, n_samples)
+        log_measure, log_propose, n_samples, proposal_dist)
 
 
 def effective_sample_size(weights: np.ndarray, axis=None) -> np.ndarray:
     return np.sum(weights, axis=axis) ** 2 / np.square(weights).sum(axis=axis)
 
 
+def log_effective_sample_size(
+        log_weights: np.ndarray, axis: int = 0) -> np.ndarray:
+    """
+    The effective sample size of the weights, calculated from the log
+    weights without overflow
+    """
+    log_weights = np.asanyarray(log_weights)
+    return effective_sample_size(
+        np.exp(log_weights - log_weights.max(axis, keepdims=True)), axis)
+
+
 class SamplingHistory(NamedTuple):
     n_samples: int = 0
     samples: List[SamplingResult] = list()
@@ -122,12 +140,29 @@ class ImportanceSampler(AbstractSampler):
             delta: float = 1.,
             deltas=None,
             sample_kws=None,
+            max_history: int = 10,
+            adaptive: bool = True,
     ):
-
+        """
+        Approximates each factor by importance sampling from the model
+        approximation.
+
+        Samples are drawn in batches until the effective sample size exceeds
+        min_n_eff or more than max_samples have been drawn. The first batch
+        has n_samples draws, and if adaptive is True the size of each
+        further batch is predicted from the effective sample size of the
+        draws so far.
+
+        Unless force_sample is True, the last max_history batches drawn for
+        a factor are reused, reweighted for the current approximation, and
+        only if their effective sample size is too small are new samples
+        drawn.
+        """
         self.params = dict(
             n_samples=n_samples, n_resample=n_resample,
             min_n_eff=min_n_eff, max_samples=max_samples,
-            force_sample=force_sample)
+            force_sample=force_sample, adaptive=adaptive)
+        self.max_history = max_history
         self._history = defaultdict(SamplingHistory)
 
         super().__init__(
@@ -160,10 +195,31 @@ class ImportanceSampler(AbstractSampler):
             log_factor, cavity_dist,
             deterministic_dist, proposal_dist, n_samples=n_samples)
 
-        self._history[factor] += SamplingHistory(n_samples, [sample], messages)
+        self._record(factor, sample, messages)
 
         return sample
 
+    def _record(
+            self,
+            factor: Factor,
+            sample: SamplingResult,
+            messages: tuple = ()
+    ):
+        """
+        Add a sample to the history of the factor, evicting the oldest
+        samples beyond the last max_history
+        """
+        history = self._history[factor] + SamplingHistory(
+            sample.n_samples, [sample], messages)
+        if self.max_history is not None:
+            history = history._replace(
+                samples=history.samples[-self.max_history:],
+                messages=history.messages[-self.max_history:])
+        self._history[factor] = history
+
+    def history_samples(self, factor: Factor) -> List[SamplingResult]:
+        return self._history[factor].samples
+
     def last_samples(self, factor):
         samples = self._history[factor].samples
         if samples:
@@ -171,7 +227,20 @@ class ImportanceSampler(AbstractSampler):
         return None
 
     @staticmethod
+    def _log_density(
+            factor: "Factor",
+            dist: Dict[str, AbstractMessage],
+            samples: Dict[str, np.ndarray],
+    ) -> np.ndarray:
+        log_density = 0.
+        for res in map_dists(dist, samples):
+            log_density = add_arrays(
+                log_density, factor.broadcast_variable(*res))
+        return log_density
+
+    @classmethod
     def _weight_samples(
+            cls,
             factor: "Factor",
             samples: Dict[str, np.ndarray],
             det_vars: Dict[str, np.ndarray],
@@ -179,7 +248,8 @@ class ImportanceSampler(AbstractSampler):
             cavity_dist: Dict[str, AbstractMessage],
             deterministic_dist: Dict[str, AbstractMessage],
             proposal_dist: Dict[str, AbstractMessage],
-            n_samples: int
+            n_samples: int,
+            log_propose: Optional[np.ndarray] = None,
     ) -> SamplingResult:
 
         log_measure = 0.
@@ -189,10 +259,11 @@ class ImportanceSampler(AbstractSampler):
             log_measure = add_arrays(
                 log_measure, factor.broadcast_variable(*res))
 
-        log_propose = 0.
-        for res in map_dists(proposal_dist, samples):
-            log_propose = add_arrays(
-                log_propose, factor.broadcast_variable(*res))
+        if log_propose is None:
+            log_propose = cls._log_density(factor, proposal_dist, samples)
+        else:
+            # the samples were drawn from a mixture of past proposals
+            proposal_dist = None
 
         log_weights = log_factor + log_measure - log_propose
 
@@ -205,31 +276,90 @@ class ImportanceSampler(AbstractSampler):
             log_factor=log_factor,
             log_measure=log_measure,
             log_propose=log_propose,
-            n_samples=n_samples
+            n_samples=n_samples,
+            proposal_dist=proposal_dist,
         )
 
     def reweight_sample(
             self,
             factor_approx: "FactorApproximation",
-            sampling_result: SamplingResult
+            sampling_result: Union[SamplingResult, List[SamplingResult]]
     ) -> SamplingResult:
+        """
+        Weight samples drawn for past approximations of the factor for the
+        current approximation, without evaluating the factor again.
+
+        Samples from several past iterations are pooled and weighted as
+        draws from the mixture of the proposals they were drawn from, in
+        proportion to the number drawn from each.
+        """
+        if isinstance(sampling_result, SamplingResult):
+            results = [sampling_result]
+        else:
+            results = list(sampling_result)
+
+        factor = factor_approx.factor
+        pooled = merge_sampling_results(*results)
+
+        # group the samples by the proposal they were drawn from
+        proposal_counts = {}
+        for result in results:
+            proposal = result.proposal_dist
+            if proposal is None:
+                proposal = factor_approx.model_dist
+            _, count = proposal_counts.get(id(proposal), (proposal, 0))
+            proposal_counts[id(proposal)] = proposal, count + result.n_samples
+
+        log_propose = None
+        for proposal, count in proposal_counts.values():
+            log_density = self._log_density(
+                factor, proposal, pooled.samples
+            ) + np.log(count / pooled.n_samples)
+            log_propose = (
+                log_density if log_propose is None
+                else np.logaddexp(log_propose, log_density))
+
         return self._weight_samples(
-            factor=factor_approx.factor,
-            samples=sampling_result.samples,
-            det_vars=sampling_result.det_variables,
-            log_factor=sampling_result.log_factor,
+            factor=factor,
+            samples=pooled.samples,
+            det_vars=pooled.det_variables,
+            log_factor=pooled.log_factor,
             cavity_dist=factor_approx.cavity_dist,
             deterministic_dist=factor_approx.deterministic_dist,
-            proposal_dist=factor_approx.model_dist,
-            n_samples=sampling_result.n_samples)
+            proposal_dist=(
+                None if len(proposal_counts) > 1 else proposal),
+            n_samples=pooled.n_samples,
+            log_propose=(
+                log_propose if len(proposal_counts) > 1 else None))
 
     def stop_criterion(self, sample: SamplingResult, **kwargs) -> bool:
-        params = {**self.params, **kwargs}
-        ess = effective_sample_size(sample.weights, 0).mean()
-        n = len(sample.weights)
+        return self._stop(
+            log_effective_sample_size(sample.log_weights, 0).mean(),
+            sample.n_samples,
+            **kwargs)
 
+    def _stop(self, ess: float, n: int, **kwargs) -> bool:
+        params = {**self.params, **kwargs}
         return ess > params['min_n_eff'] or n > params['max_samples']
 
+    def next_batch_size(self, ess: float, n: int, **kwargs) -> int:
+        """
+        Predict the number of draws needed to reach min_n_eff assuming each
+        draw adds to the effective sample size as the draws so far have
+        """
+        params = {**self.params, **kwargs}
+        if not params['adaptive']:
+            return params['n_samples']
+
+        remaining = params['max_samples'] + 1 - n
+        min_batch = max(2, params['n_samples'] // 10)
+        if ess <= 0:
+            return max(min(params['n_samples'], remaining), 1)
+
+        needed = int(np.ceil(
+            1.1 * (params['min_n_eff'] - ess) * n / ess))
+        return max(min(needed, remaining), min_batch, 1)
+
     def __call__(
             self,
             factor_approx: "FactorApproximation",
@@ -238,34 +368,34 @@ class ImportanceSampler(AbstractSampler):
         """
         """
         params = {**self.params, **kwargs}
-        samples = None
-        if params['force_sample']:
-            last_samples = None
-        else:
-            last_samples = self.last_samples(factor_approx.factor)
-
+        if not params['force_sample']:
+            history = self.history_samples(factor_approx.factor)
+            if history:
+                # update weights of the past samples for the new
+                # factor approximation
+                samples = self.reweight_sample(factor_approx, history)
+
+                # test whether the updated weights satisfy the stopping
+                # criterion, if not then resample
+                if self.stop_criterion(samples, **kwargs):
+                    return samples
+
+        batches = []
+        n_draw = params['n_samples']
         while True:
-            if samples is None:
-                if last_samples is None:
-                    samples = self.sample(factor_approx)
-                else:
-                    # update weights of the sample for the new 
-                    # factor approximation
-                    samples = self.reweight_sample(factor_approx, last_samples)
-
-                    # test whether the updated weights satisfy the stopping
-                    # criterion
-                    if self.stop_criterion(samples):
-                        break
-                    else:
-                        # if not then resample
-                        last_samples = None
-            else:
-                samples = samples + self.sample(factor_approx)
-                if self.stop_criterion(samples):
-                    break
-
-        return samples
+            batches.append(
+                self.sample(factor_approx, **{**kwargs, 'n_samples': n_draw}))
+
+            n = sum(batch.n_samples for batch in batches)
+            ess = log_effective_sample_size(np.concatenate(
+                [batch.log_weights for batch in batches]), 0).mean()
+            if self._stop(ess, n, **kwargs):
+                break
+
+            n_draw = self.next_batch_size(ess, n, **kwargs)
+
+        # the batches are merged once, rather than after every batch
+        return merge_sampling_results(*batches)
 
 
 def project_factor_approx_sample(
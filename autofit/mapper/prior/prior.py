@@ -5,13 +5,13 @@ from abc import ABC, abstractmethod
 from typing import Union, Tuple
 
 import numpy as np
-from scipy import stats
 from scipy.special import erfcinv
 
 from autoconf import conf
 from autofit import exc
 from autofit.mapper.prior.arithmetic import ArithmeticMixin
 from autofit.mapper.prior.deferred import DeferredArgument
+from autofit.mapper.prior_model.plan import invalidate
 from autofit.mapper.prior_model.attribute_pair import (
     cast_collection,
     PriorNameValue,
@@ -76,6 +76,10 @@ class TuplePrior:
     A prior comprising one or more priors in a tuple
     """
 
+    def __setattr__(self, key, value):
+        invalidate()
+        super().__setattr__(key, value)
+
     @property
     @cast_collection(PriorNameValue)
     def prior_tuples(self):
@@ -212,6 +216,67 @@ class Prior(Variable, ABC, ArithmeticMixin):
         A physical value.
         """
 
+    @classmethod
+    def batch_value_for(cls, priors: Tuple["Prior", ...], unit: np.ndarray) -> np.ndarray:
+        """
+        Return physical values for many points of several priors of this class at
+        once.
+
+        Subclasses override this to evaluate all of their priors in a single set of
+        NumPy ufunc calls; by default each column is passed to the prior's own
+        value_for.
+
+        Parameters
+        ----------
+        priors
+            Priors of this class, one for each column of unit
+        unit
+            An (N, len(priors)) array of hypercube values between 0 and 1.
+
+        Returns
+        -------
+        An (N, len(priors)) array of physical values.
+        """
+        return np.stack(
+            [
+                prior.value_for(unit[:, i])
+                for i, prior in enumerate(priors)
+            ],
+            axis=-1
+        ).reshape(unit.shape)
+
+    @classmethod
+    def batch_log_prior_from_value(
+            cls,
+            priors: Tuple["Prior", ...],
+            value: np.ndarray
+    ) -> np.ndarray:
+        """
+        Return the log priors of many physical values of several priors of this
+        class at once.
+
+        Parameters
+        ----------
+        priors
+            Priors of this class, one for each column of value
+        value
+            An (N, len(priors)) array of physical values.
+
+        Returns
+        -------
+        An (N, len(priors)) array of log prior values.
+        """
+        return np.stack(
+            [
+                np.broadcast_to(
+                    prior.log_prior_from_value(value[:, i]),
+                    value.shape[:1]
+                )
+                for i, prior in enumerate(priors)
+            ],
+            axis=-1
+        ).reshape(value.shape)
+
     def instance_for_arguments(self, arguments):
         return arguments[self]
 
@@ -296,6 +361,8 @@ class GaussianPrior(Prior):
 
     @property
     def norm(self):
+        from scipy import stats
+
         return stats.norm(loc=self.mean, scale=self.sigma)
 
     @property
@@ -310,8 +377,8 @@ class GaussianPrior(Prior):
 
         Parameters
         ----------
-        unit: Float
-            A unit hypercube value between 0 and 1
+        unit: Float or ndarray
+            A unit hypercube value between 0 and 1, or an array of such values
         Returns
         -------
         value: Float
@@ -319,6 +386,12 @@ class GaussianPrior(Prior):
         """
         return self.mean + (self.sigma * math.sqrt(2) * erfcinv(2.0 * (1.0 - unit)))
 
+    @classmethod
+    def batch_value_for(cls, priors, unit):
+        mean = np.array([prior.mean for prior in priors])
+        sigma = np.array([prior.sigma for prior in priors])
+        return mean + (sigma * math.sqrt(2) * erfcinv(2.0 * (1.0 - unit)))
+
     def log_prior_from_value(self, value):
         """
     Returns the log prior of a physical value, so the log likelihood of a model evaluation can be converted to a
@@ -332,6 +405,12 @@ class GaussianPrior(Prior):
             The physical value of this prior's corresponding parameter in a `NonLinearSearch` sample."""
         return (value - self.mean) ** 2.0 / (2 * self.sigma ** 2.0)
 
+    @classmethod
+    def batch_log_prior_from_value(cls, priors, value):
+        mean = np.array([prior.mean for prior in priors])
+        sigma = np.array([prior.sigma for prior in priors])
+        return (value - mean) ** 2.0 / (2 * sigma ** 2.0)
+
     def __str__(self):
         """The line of text describing this prior for the model_mapper.info file"""
         return (
@@ -363,8 +442,8 @@ class UniformPrior(Prior):
 
         Parameters
         ----------
-        unit: Float
-            A unit hypercube value between 0 and 1
+        unit: Float or ndarray
+            A unit hypercube value between 0 and 1, or an array of such values
         Returns
         -------
         value: Float
@@ -372,6 +451,12 @@ class UniformPrior(Prior):
         """
         return self.lower_limit + unit * (self.upper_limit - self.lower_limit)
 
+    @classmethod
+    def batch_value_for(cls, priors, unit):
+        lower_limit = np.array([prior.lower_limit for prior in priors])
+        upper_limit = np.array([prior.upper_limit for prior in priors])
+        return lower_limit + unit * (upper_limit - lower_limit)
+
     def log_prior_from_value(self, value):
         """
     Returns the log prior of a physical value, so the log likelihood of a model evaluation can be converted to a
@@ -387,8 +472,14 @@ class UniformPrior(Prior):
         ----------
         value : float
             The physical value of this prior's corresponding parameter in a `NonLinearSearch` sample."""
+        if np.ndim(value) > 0:
+            return np.zeros(np.shape(value))
         return 0.0
 
+    @classmethod
+    def batch_log_prior_from_value(cls, priors, value):
+        return np.zeros(np.shape(value))
+
     @property
     def mean(self):
         return self.lower_limit + (self.upper_limit - self.lower_limit) / 2
@@ -435,8 +526,8 @@ class LogUniformPrior(UniformPrior):
 
         Parameters
         ----------
-        unit: Float
-            A unit hypercube value between 0 and 1
+        unit: Float or ndarray
+            A unit hypercube value between 0 and 1, or an array of such values
         Returns
         -------
         value: Float
@@ -447,6 +538,15 @@ class LogUniformPrior(UniformPrior):
                 + unit * (np.log10(self.upper_limit) - np.log10(self.lower_limit))
         )
 
+    @classmethod
+    def batch_value_for(cls, priors, unit):
+        log_lower_limit = np.log10([prior.lower_limit for prior in priors])
+        log_upper_limit = np.log10([prior.upper_limit for prior in priors])
+        return 10.0 ** (
+                log_lower_limit
+                + unit * (log_upper_limit - log_lower_limit)
+        )
+
     def log_prior_from_value(self, value):
         """
     Returns the log prior of a physical value, so the log likelihood of a model evaluation can be converted to a
@@ -460,6 +560,10 @@ class LogUniformPrior(UniformPrior):
             The physical value of this prior's corresponding parameter in a `NonLinearSearch` sample."""
         return 1.0 / value
 
+    @classmethod
+    def batch_log_prior_from_value(cls, priors, value):
+        return 1.0 / value
+
     def __str__(self):
         """The line of text describing this prior for the model_mapper.info file"""
         return (
@@ -16,6 +16,7 @@ from autofit.mapper.prior.prior import GaussianPrior
 from autofit.mapper.prior.prior import TuplePrior, Prior, WidthModifier, Limits
 from autofit.mapper.prior_model.attribute_pair import DeferredNameValue
 from autofit.mapper.prior_model.attribute_pair import cast_collection, PriorNameValue, InstanceNameValue
+from autofit.mapper.prior_model.plan import ModelPlan, invalidate, plan_for
 from autofit.mapper.prior_model.recursion import DynamicRecursionCache
 from autofit.mapper.prior_model.util import PriorModelNameValue
 from autofit.text import formatter as frm
@@ -63,6 +64,25 @@ class AbstractPriorModel(AbstractModel):
         super().__init__()
         self._assertions = list()
 
+    def __setattr__(self, key, value):
+        invalidate()
+        super().__setattr__(key, value)
+
+    def __delattr__(self, item):
+        invalidate()
+        super().__delattr__(item)
+
+    @property
+    def plan(self) -> ModelPlan:
+        """
+        A compiled description of the structure of this model. The plan is built
+        the first time it is requested and rebuilt after any model is modified.
+        """
+        return plan_for(self)
+
+    def _make_plan(self) -> ModelPlan:
+        return ModelPlan(self)
+
     def add_assertion(self, assertion, name=None):
         """
         Assert that some relationship holds between physical values associated with
@@ -82,6 +102,7 @@ class AbstractPriorModel(AbstractModel):
         except AttributeError:
             pass
         self._assertions.append(assertion)
+        invalidate()
 
     @property
     def name(self):
@@ -183,11 +204,11 @@ class AbstractPriorModel(AbstractModel):
         """
         arguments = dict(
             map(
-                lambda prior_tuple, unit: (
-                    prior_tuple.prior,
-                    prior_tuple.prior.value_for(unit),
+                lambda prior, unit: (
+                    prior,
+                    prior.value_for(unit),
                 ),
-                self.prior_tuples_ordered_by_id,
+                self.plan.priors_ordered_by_id,
                 unit_vector,
             )
         )
@@ -218,7 +239,6 @@ class AbstractPriorModel(AbstractModel):
         }.values()
 
     @property
-    @cast_collection(PriorNameValue)
     def prior_tuples_ordered_by_id(self):
         """
         Returns
@@ -226,6 +246,11 @@ class AbstractPriorModel(AbstractModel):
         priors: [Prior]
             An ordered list of unique priors associated with this mapper
         """
+        return list(self.plan.prior_tuples_ordered_by_id)
+
+    @property
+    @cast_collection(PriorNameValue)
+    def _prior_tuples_ordered_by_id(self):
         return sorted(
             list(self.unique_prior_tuples), key=lambda prior_tuple: prior_tuple.prior.id
         )
@@ -243,12 +268,49 @@ class AbstractPriorModel(AbstractModel):
         """
         return list(
             map(
-                lambda prior_tuple, unit: prior_tuple.prior.value_for(unit),
-                self.prior_tuples_ordered_by_id,
+                lambda prior, unit: prior.value_for(unit),
+                self.plan.priors_ordered_by_id,
                 unit_vector,
             )
         )
 
+    def vectors_from_unit_vectors(self, unit_vectors) -> np.ndarray:
+        """
+        Map many points in the unit hypercube to physical values at once.
+
+        The priors are grouped by class and each group is evaluated with one set of
+        NumPy operations over every point.
+
+        Parameters
+        ----------
+        unit_vectors: [[float]]
+            An (N, D) array of unit hypercube vectors, where D is the prior count
+        Returns
+        -------
+        values: np.ndarray
+            An (N, D) array of values output by priors
+        """
+        unit_vectors = np.asarray(unit_vectors, dtype=float).reshape(-1, self.prior_count)
+        vectors = np.empty(unit_vectors.shape)
+        for cls, indices, priors in self.plan.prior_groups:
+            vectors[:, indices] = cls.batch_value_for(priors, unit_vectors[:, indices])
+        return vectors
+
+    def random_unit_vectors_within_limits(
+            self,
+            total_points,
+            lower_limit=0.0,
+            upper_limit=1.0
+    ) -> np.ndarray:
+        """ Generate many random vectors of unit values by drawing uniform random values between a lower and upper
+        limit.
+        Returns
+        -------
+        unit_values: np.ndarray
+            A (total_points, D) array of unit values.
+        """
+        return np.random.uniform(low=lower_limit, high=upper_limit, size=(total_points, self.prior_count))
+
     def random_unit_vector_within_limits(self, lower_limit=0.0, upper_limit=1.0):
         """ Generate a random vector of unit values by drawing uniform random values between 0 and 1.
         Returns
@@ -326,9 +388,8 @@ class AbstractPriorModel(AbstractModel):
             An object containing reconstructed model_mapper instances
         """
         arguments = dict(
-            map(
-                lambda prior_tuple, physical_unit: (prior_tuple.prior, physical_unit),
-                self.prior_tuples_ordered_by_id,
+            zip(
+                self.plan.priors_ordered_by_id,
                 vector,
             )
         )
@@ -507,12 +568,55 @@ class AbstractPriorModel(AbstractModel):
         """
         return list(
             map(
-                lambda prior_tuple, value: prior_tuple.prior.log_prior_from_value(value=value),
-                self.prior_tuples_ordered_by_id,
+                lambda prior, value: prior.log_prior_from_value(value=value),
+                self.plan.priors_ordered_by_id,
                 vector,
             )
         )
 
+    def log_priors_from_vectors(self, vectors) -> np.ndarray:
+        """
+        Compute the log priors of every parameter for many vectors at once.
+
+        Parameters
+        ----------
+        vectors : [[float]]
+            An (N, D) array of physical parameter values.
+        Returns
+        -------
+        log_priors : np.ndarray
+            An (N, D) array of the log prior value of every parameter.
+        """
+        vectors = np.asarray(vectors, dtype=float).reshape(-1, self.prior_count)
+        log_priors = np.empty(vectors.shape)
+        for cls, indices, priors in self.plan.prior_groups:
+            log_priors[:, indices] = cls.batch_log_prior_from_value(priors, vectors[:, indices])
+        return log_priors
+
+    def vectors_within_limits(self, vectors) -> np.ndarray:
+        """
+        Determine which of many vectors have every physical value within the limits of
+        its prior, as checked by *instance_for_arguments* when an instance is created.
+
+        If ignore_prior_limits is true in configuration every vector is within limits.
+
+        Parameters
+        ----------
+        vectors : [[float]]
+            An (N, D) array of physical parameter values.
+        Returns
+        -------
+        within_limits : np.ndarray
+            A boolean array of length N which is True for each vector within the limits.
+        """
+        vectors = np.asarray(vectors, dtype=float).reshape(-1, self.prior_count)
+        if conf.instance["general"]["model"]["ignore_prior_limits"]:
+            return np.ones(len(vectors), dtype=bool)
+        priors = self.plan.priors_ordered_by_id
+        lower_limits = np.array([prior.lower_limit for prior in priors], dtype=float)
+        upper_limits = np.array([prior.upper_limit for prior in priors], dtype=float)
+        return np.all((lower_limits <= vectors) & (vectors <= upper_limits), axis=1)
+
     def random_instance(self):
         """
         Returns a random instance of the model.
@@ -708,11 +812,11 @@ class AbstractPriorModel(AbstractModel):
 
     @property
     def prior_count(self):
-        return len(self.unique_prior_tuples)
+        return len(self.plan.priors_ordered_by_id)
 
     @property
     def promise_count(self):
-        return len(self.unique_promise_tuples)
+        return self.plan.promise_count
 
     @property
     def variable_promise_count(self):
@@ -3,6 +3,7 @@ from autofit.mapper.model import ModelInstance
 from autofit.mapper.prior.prior import Prior
 from autofit.mapper.prior_model.abstract import AbstractPriorModel
 from autofit.mapper.prior_model.abstract import check_assertions
+from autofit.mapper.prior_model.plan import CollectionPlan, invalidate
 
 
 class CollectionPriorModel(AbstractPriorModel):
@@ -125,6 +126,10 @@ class CollectionPriorModel(AbstractPriorModel):
         for key, value in self.__dict__.copy().items():
             if value == item:
                 del self.__dict__[key]
+        invalidate()
+
+    def _make_plan(self) -> CollectionPlan:
+        return CollectionPlan(self)
 
     @check_assertions
     def _instance_for_arguments(self, arguments):
@@ -139,14 +144,18 @@ class CollectionPriorModel(AbstractPriorModel):
         model_instances: [object]
             A list of instances constructed from the list of prior models.
         """
-        if self.promise_count > 0:
+        plan = self.plan
+        if plan.promise_count > 0:
             raise exc.PriorException(
                 "All promises must be populated prior to instantiation"
             )
         result = ModelInstance()
-        for key, value in self.__dict__.items():
+        for key, value in plan.items:
             if isinstance(value, AbstractPriorModel):
-                value = value.instance_for_arguments(arguments)
+                value = value.instance_for_arguments(
+                    arguments,
+                    assert_priors_in_limits=False
+                )
             if isinstance(value, Prior):
                 value = value.value_for(arguments[value])
             setattr(result, key, value)
@@ -0,0 +1,180 @@
+import weakref
+
+import numpy as np
+
+_version = 0
+_plans = dict()
+
+
+def invalidate():
+    """
+    Mark every compiled model plan as stale.
+
+    This is called whenever the structure of any model changes (an attribute is set
+    or removed, or an assertion is added). Plans are rebuilt lazily the next time
+    they are requested.
+    """
+    global _version
+    _version += 1
+
+
+def plan_for(model) -> "ModelPlan":
+    """
+    Retrieve the compiled plan for a model, building it if no plan exists or the
+    existing plan is stale.
+
+    Plans are kept in a registry keyed by the id of the model rather than as an
+    attribute so that they are never copied, pickled or treated as part of the
+    model tree.
+
+    Parameters
+    ----------
+    model
+        An AbstractPriorModel
+
+    Returns
+    -------
+    The up to date plan for the model
+    """
+    key = id(model)
+    try:
+        reference, plan = _plans[key]
+        if reference() is model and plan.version == _version:
+            return plan
+    except KeyError:
+        pass
+
+    plan = model._make_plan()
+
+    def remove(ref, key=key):
+        entry = _plans.get(key)
+        if entry is not None and entry[0] is ref:
+            del _plans[key]
+
+    _plans[key] = (weakref.ref(model, remove), plan)
+    return plan
+
+
+class ModelPlan:
+    def __init__(self, model):
+        """
+        A compiled description of a model which is built once and reused each time
+        the model is instantiated, saving repeated traversal of the model tree.
+
+        Parameters
+        ----------
+        model
+            The model for which the plan is compiled
+        """
+        self.version = _version
+        self._model = weakref.ref(model)
+        self._prior_tuples_ordered_by_id = None
+        self._priors_ordered_by_id = None
+        self._prior_groups = None
+        self.promise_count = len(model.unique_promise_tuples)
+
+    @property
+    def prior_tuples_ordered_by_id(self) -> tuple:
+        """
+        Every unique prior in the model and its name, ordered by prior id
+        """
+        if self._prior_tuples_ordered_by_id is None:
+            self._prior_tuples_ordered_by_id = tuple(
+                self._model()._prior_tuples_ordered_by_id
+            )
+        return self._prior_tuples_ordered_by_id
+
+    @property
+    def priors_ordered_by_id(self) -> tuple:
+        """
+        Every unique prior in the model, ordered by prior id. This is the order of
+        the parameters in a vector.
+        """
+        if self._priors_ordered_by_id is None:
+            self._priors_ordered_by_id = tuple(
+                prior_tuple.prior
+                for prior_tuple
+                in self.prior_tuples_ordered_by_id
+            )
+        return self._priors_ordered_by_id
+
+    @property
+    def prior_groups(self) -> list:
+        """
+        The priors of the model grouped by their class, so that every prior of a
+        class can be evaluated for many points with one set of NumPy operations.
+
+        Returns
+        -------
+        A list of tuples, each containing a prior class, an array of the indices
+        of the priors of that class in a vector and the priors themselves.
+        """
+        if self._prior_groups is None:
+            groups = dict()
+            for index, prior in enumerate(self.priors_ordered_by_id):
+                indices, priors = groups.setdefault(type(prior), ([], []))
+                indices.append(index)
+                priors.append(prior)
+            self._prior_groups = [
+                (cls, np.array(indices, dtype=int), tuple(priors))
+                for cls, (indices, priors) in groups.items()
+            ]
+        return self._prior_groups
+
+
+class PriorModelPlan(ModelPlan):
+    def __init__(self, model):
+        """
+        A compiled description of a PriorModel including the slots in which each
+        constructor argument is found.
+
+        Parameters
+        ----------
+        model
+            A PriorModel
+        """
+        from autofit.mapper.prior.prior import Prior
+        from autofit.mapper.prior.promise import Promise
+
+        super().__init__(model)
+        self.constructor_argument_names = model.constructor_argument_names
+        self.attribute_arguments = {
+            key: value
+            for key, value in model.__dict__.items()
+            if key in self.constructor_argument_names
+        }
+        self.tuple_priors = [
+            (
+                name,
+                [
+                    (hasattr(item, "prior"), item.value)
+                    for item in sorted(
+                        tuple_prior.prior_tuples + tuple_prior.instance_tuples,
+                        key=lambda tup: tup.name
+                    )
+                ]
+            )
+            for name, tuple_prior in model.tuple_prior_tuples
+        ]
+        self.prior_models = list(map(tuple, model.direct_prior_model_tuples))
+        self.direct_priors = list(map(tuple, model.direct_prior_tuples))
+        self.is_deferred_arguments = model.is_deferred_arguments
+        self.other_attributes = [
+            (key, value)
+            for key, value in model.__dict__.items()
+            if not isinstance(value, (Prior, Promise))
+        ]
+
+
+class CollectionPlan(ModelPlan):
+    def __init__(self, model):
+        """
+        A compiled description of a CollectionPriorModel.
+
+        Parameters
+        ----------
+        model
+            A CollectionPriorModel
+        """
+        super().__init__(model)
+        self.items = list(model.__dict__.items())
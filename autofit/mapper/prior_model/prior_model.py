@@ -5,9 +5,9 @@ import logging
 from autofit.mapper.model_object import ModelObject
 from autofit.mapper.prior.prior import TuplePrior, Prior
 from autofit.mapper.prior.deferred import DeferredInstance
-from autofit.mapper.prior.promise import Promise
 from autofit.mapper.prior_model.abstract import AbstractPriorModel
 from autofit.mapper.prior_model.abstract import check_assertions
+from autofit.mapper.prior_model.plan import PriorModelPlan
 
 logger = logging.getLogger(__name__)
 
@@ -205,6 +205,9 @@ class PriorModel(AbstractPriorModel):
             pass
         self.__getattribute__(item)
 
+    def _make_plan(self) -> PriorModelPlan:
+        return PriorModelPlan(self)
+
     @property
     def is_deferred_arguments(self):
         return len(self.direct_deferred_tuples) > 0
@@ -224,26 +227,24 @@ class PriorModel(AbstractPriorModel):
         -------
             An instance of the class
         """
+        plan = self.plan
+
         model_arguments = dict()
-        attribute_arguments = {
-            key: value
-            for key, value in self.__dict__.items()
-            if key in self.constructor_argument_names
-        }
 
-        for tuple_prior in self.tuple_prior_tuples:
-            model_arguments[tuple_prior.name] = tuple_prior.prior.value_for_arguments(
-                arguments
+        for name, items in plan.tuple_priors:
+            model_arguments[name] = tuple(
+                arguments[value] if is_prior else value
+                for is_prior, value in items
+            )
+        for name, prior_model in plan.prior_models:
+            model_arguments[name] = prior_model.instance_for_arguments(
+                arguments,
+                assert_priors_in_limits=False
             )
-        for prior_model_tuple in self.direct_prior_model_tuples:
-            prior_model = prior_model_tuple.prior_model
-            model_arguments[
-                prior_model_tuple.name
-            ] = prior_model.instance_for_arguments(arguments)
 
         prior_arguments = dict()
 
-        for name, prior in self.direct_prior_tuples:
+        for name, prior in plan.direct_priors:
             try:
                 prior_arguments[name] = arguments[prior]
             except KeyError as e:
@@ -252,12 +253,12 @@ class PriorModel(AbstractPriorModel):
                 ) from e
 
         constructor_arguments = {
-            **attribute_arguments,
+            **plan.attribute_arguments,
             **model_arguments,
             **prior_arguments,
         }
 
-        if self.is_deferred_arguments:
+        if plan.is_deferred_arguments:
             return DeferredInstance(self.cls, constructor_arguments)
 
         if not inspect.isclass(self.cls):
@@ -267,16 +268,13 @@ class PriorModel(AbstractPriorModel):
         else:
             result = self.cls(**constructor_arguments)
 
-        for key, value in self.__dict__.items():
-            if (
-                    not hasattr(result, key)
-                    and not isinstance(value, Prior)
-                    and not isinstance(value, Promise)
-            ):
+        for key, value in plan.other_attributes:
+            if not hasattr(result, key):
                 if isinstance(value, PriorModel):
-                    value = value.instance_for_arguments(arguments)
-                elif isinstance(value, Prior):
-                    value = arguments[value]
+                    value = value.instance_for_arguments(
+                        arguments,
+                        assert_priors_in_limits=False
+                    )
                 try:
                     setattr(result, key, value)
                 except AttributeError:
@@ -319,7 +319,7 @@ class Tracer:
 
 # noinspection PyAbstractClass
 class GalaxyModel(af.AbstractPriorModel):
-    def instance_for_arguments(self, arguments):
+    def instance_for_arguments(self, arguments, assert_priors_in_limits=True):
         try:
             return Galaxy(redshift=self.redshift.instance_for_arguments(arguments))
         except AttributeError:
@@ -5,8 +5,8 @@ from os import path
 import os
 import pickle
 import shutil
+import time
 from abc import ABC, abstractmethod
-from time import sleep
 from typing import Dict
 
 import numpy as np
@@ -17,6 +17,8 @@ from autofit.mapper import model_mapper as mm
 from autofit.non_linear.initializer import Initializer
 from autofit.non_linear.log import logger
 from autofit.non_linear.paths import Paths, convert_paths
+from autofit.non_linear.pool import pool_for, shared_pools
+from autofit.non_linear.profiling import Profiler
 from autofit.non_linear import samples as samps
 from autofit.non_linear.timer import Timer
 from autofit.text import formatter
@@ -61,8 +63,10 @@ class NonLinearSearch(ABC):
             self.prior_passer = prior_passer
 
         self.timer = Timer(paths=paths)
+        self.profiler = Profiler()
 
         self.force_pickle_overwrite = conf.instance["general"]["output"]["force_pickle_overwrite"]
+        self.samples_to_csv = conf.instance["general"]["output"]["samples_to_csv"]
 
         self.log_file = conf.instance["general"]["output"]["log_file"].replace(
             " ", ""
@@ -119,7 +123,9 @@ class NonLinearSearch(ABC):
         return search_instance
 
     class Fitness:
-        def __init__(self, paths, model, analysis, samples_from_model, log_likelihood_cap=None, pool_ids=None):
+        def __init__(
+                self, paths, model, analysis, samples_from_model, log_likelihood_cap=None, pool_ids=None, profiler=None
+        ):
 
             self.paths = paths
             self.max_log_likelihood = -np.inf
@@ -131,9 +137,18 @@ class NonLinearSearch(ABC):
             self.log_likelihood_cap = log_likelihood_cap
             self.pool_ids = pool_ids
 
+            # the analysis fits batches if it overrides the default log_likelihood_function_batch of Analysis
+            self.batch = getattr(
+                type(analysis), "log_likelihood_function_batch", Analysis.log_likelihood_function_batch
+            ) is not Analysis.log_likelihood_function_batch
+
+            self.profiler = profiler or Profiler()
+
         def fit_instance(self, instance):
 
+            start = time.perf_counter()
             log_likelihood = self.analysis.log_likelihood_function(instance=instance)
+            self.profiler.add("log_likelihood", time.perf_counter() - start)
 
             if self.log_likelihood_cap is not None:
                 if log_likelihood > self.log_likelihood_cap:
@@ -150,15 +165,88 @@ class NonLinearSearch(ABC):
             return log_likelihood
 
         def log_likelihood_from_parameters(self, parameters):
+            start = time.perf_counter()
             instance = self.model.instance_from_vector(vector=parameters)
+            self.profiler.add("instance", time.perf_counter() - start)
             log_likelihood = self.fit_instance(instance)
             return log_likelihood
 
         def log_posterior_from_parameters(self, parameters):
             log_likelihood = self.log_likelihood_from_parameters(parameters=parameters)
+            start = time.perf_counter()
             log_priors = self.model.log_priors_from_vector(vector=parameters)
+            self.profiler.add("log_prior", time.perf_counter() - start)
             return log_likelihood + sum(log_priors)
 
+        def log_likelihoods_from_parameters(self, parameters) -> np.ndarray:
+            """
+            Compute the log likelihoods of a batch of points in parameter space.
+
+            If the analysis overrides *log_likelihood_function_batch* the points within the limits of the priors are
+            fitted in a single call, otherwise every point is fitted by *log_likelihood_function*. Points outside the
+            limits of the priors and points which raise a FitException (or are returned as NaN by the batch method) are
+            given a log likelihood of NaN. If the batch method raises a FitException every point in the batch is given
+            a log likelihood of NaN.
+
+            Parameters
+            ----------
+            parameters : np.ndarray
+                An (N, D) array of physical parameter values.
+            """
+            parameters = np.asarray(parameters, dtype=float).reshape(-1, self.model.prior_count)
+
+            if not self.batch:
+                return np.array([
+                    self._log_likelihood_or_nan(parameters=vector)
+                    for vector in parameters
+                ])
+
+            log_likelihoods = np.full(len(parameters), np.nan)
+            within_limits = self.model.vectors_within_limits(vectors=parameters)
+
+            if np.any(within_limits):
+                start = time.perf_counter()
+                try:
+                    log_likelihoods[within_limits] = np.asarray(
+                        self.analysis.log_likelihood_function_batch(
+                            parameters=parameters[within_limits], model=self.model
+                        ),
+                        dtype=float,
+                    )
+                except exc.FitException:
+                    pass
+                self.profiler.add(
+                    "log_likelihood", time.perf_counter() - start, count=int(np.sum(within_limits))
+                )
+
+            if self.log_likelihood_cap is not None:
+                log_likelihoods = np.minimum(log_likelihoods, self.log_likelihood_cap)
+
+            if len(log_likelihoods) > 0 and not np.all(np.isnan(log_likelihoods)):
+
+                log_likelihood = np.nanmax(log_likelihoods)
+
+                if log_likelihood > self.max_log_likelihood:
+
+                    if self.pool_ids is None or mp.current_process().pid == min(self.pool_ids):
+                        self.max_log_likelihood = log_likelihood
+
+            return log_likelihoods
+
+        def _log_likelihood_or_nan(self, parameters):
+            try:
+                return self.log_likelihood_from_parameters(parameters=parameters)
+            except exc.FitException:
+                return np.nan
+
+        def log_posteriors_from_parameters(self, parameters) -> np.ndarray:
+            parameters = np.asarray(parameters, dtype=float).reshape(-1, self.model.prior_count)
+            log_likelihoods = self.log_likelihoods_from_parameters(parameters=parameters)
+            start = time.perf_counter()
+            log_priors = self.model.log_priors_from_vectors(vectors=parameters)
+            self.profiler.add("log_prior", time.perf_counter() - start, count=len(parameters))
+            return log_likelihoods + np.sum(log_priors, axis=1)
+
         def figure_of_merit_from_parameters(self, parameters):
             """The figure of merit is the value that the `NonLinearSearch` uses to sample parameter space. This varies
             between different `NonLinearSearch`s, for example:
@@ -169,6 +257,21 @@ class NonLinearSearch(ABC):
             """
             raise NotImplementedError()
 
+        def figures_of_merit_from_parameters(self, parameters) -> np.ndarray:
+            """The figures of merit of a batch of points in parameter space, computed in a single call to the
+            analysis's *log_likelihood_function_batch* where a `NonLinearSearch` supports it. Points which require
+            resampling are given a figure of merit of NaN.
+            """
+            figures_of_merit = []
+
+            for vector in parameters:
+                try:
+                    figures_of_merit.append(self.figure_of_merit_from_parameters(parameters=vector))
+                except exc.FitException:
+                    figures_of_merit.append(np.nan)
+
+            return np.asarray(figures_of_merit, dtype=float)
+
         @staticmethod
         def prior(cube, model):
 
@@ -251,8 +354,10 @@ class NonLinearSearch(ABC):
             # TODO : Better way to handle?
             self.timer.paths = self.paths
             self.timer.start()
+            self.profiler.start(parallel=self.number_of_cores > 1)
 
-            self._fit(model=model, analysis=analysis, log_likelihood_cap=log_likelihood_cap)
+            with shared_pools():
+                self._fit(model=model, analysis=analysis, log_likelihood_cap=log_likelihood_cap)
             open(self.paths.has_completed_path, "w+").close()
 
             samples = self.perform_update(
@@ -352,11 +457,23 @@ class NonLinearSearch(ABC):
 
         self.timer.update()
 
-        samples = self.samples_via_sampler_from_model(model=model)
-        samples.write_table(filename=self.paths.samples_file)
-        samples.info_to_json(filename=self.paths.info_file)
+        try:
+            with self.profiler("update"):
+                return self._perform_update(model=model, analysis=analysis, during_analysis=during_analysis)
+        finally:
+            self.profiler.output_to_json(filename=self.paths.file_profiling)
+
+    def _perform_update(self, model, analysis, during_analysis):
+
+        with self.profiler("update.samples"):
+            samples = self.samples_via_sampler_from_model(model=model)
 
-        self.save_samples(samples=samples)
+        with self.profiler("update.samples_write"):
+            self.write_samples_table(samples=samples)
+            samples.info_to_json(filename=self.paths.info_file)
+
+        with self.profiler("update.pickle"):
+            self.save_samples(samples=samples)
 
         try:
             instance = samples.max_log_likelihood_instance
@@ -364,17 +481,19 @@ class NonLinearSearch(ABC):
             return samples
 
         if self.should_visualize() or not during_analysis:
-            analysis.visualize(paths=self.paths, instance=instance, during_analysis=during_analysis)
+            with self.profiler("update.visualize"):
+                analysis.visualize(paths=self.paths, instance=instance, during_analysis=during_analysis)
 
         if self.should_output_model_results() or not during_analysis:
 
-            text_util.results_to_file(
-                samples=samples,
-                filename=self.paths.file_results,
-                during_analysis=during_analysis,
-            )
+            with self.profiler("update.results"):
+                text_util.results_to_file(
+                    samples=samples,
+                    filename=self.paths.file_results,
+                    during_analysis=during_analysis,
+                )
 
-            text_util.search_summary_to_file(samples=samples, filename=self.paths.file_search_summary)
+                text_util.search_summary_to_file(samples=samples, filename=self.paths.file_search_summary)
 
         if not during_analysis and self.remove_state_files_at_end:
             try:
@@ -453,12 +572,56 @@ class NonLinearSearch(ABC):
 
     def save_samples(self, samples):
         """
-        Save the final-result samples associated with the phase as a pickle
+        Save the final-result samples associated with the phase as a pickle.
+
+        The sample columns are read from the binary samples file when it exists, so they are not pickled a second
+        time.
         """
+        if path.exists(self.paths.samples_hdf5_file):
+            samples = samples.without_sample_list()
 
         with open(self.paths.make_samples_pickle_path(), "w+b") as f:
             f.write(pickle.dumps(samples))
 
+    def write_samples_table(self, samples):
+        """
+        Write the samples to the binary samples file and, if samples_to_csv is set in the general config, to
+        samples.csv.
+
+        Only samples after the final samples of the previous update are written (see *final_sample_count*).
+        """
+        from autofit.non_linear.samples_writer import SamplesWriter
+
+        SamplesWriter(
+            hdf5_file=self.paths.samples_hdf5_file,
+            csv_file=self.paths.samples_file if self.samples_to_csv else None,
+        ).write(
+            samples=samples,
+            final_samples=self.final_sample_count(samples=samples),
+            rewrite_weights=self.rewrite_sample_weights,
+        )
+
+    # If True the weights of every sample may change between updates and are rewritten in full on every update.
+    rewrite_sample_weights = False
+
+    def final_sample_count(self, samples) -> int:
+        """
+        The number of leading samples which will not change as the search continues, and are therefore not written
+        again on the next update.
+
+        By default no samples are final, so the samples files are rewritten in full on every update. Searches whose
+        sample history is append-only override this.
+        """
+        return 0
+
+    def load_sample_list(self) -> samps.SampleList:
+        """
+        Load the samples written by a previous run, preferring the binary samples file over samples.csv.
+        """
+        if path.exists(self.paths.samples_hdf5_file):
+            return samps.load_from_hdf5(filename=self.paths.samples_hdf5_file)
+        return samps.load_from_table(filename=self.paths.samples_file)
+
     def save_metadata(self):
         """
         Save metadata associated with the phase, such as the name of the pipeline, the
@@ -506,7 +669,10 @@ class NonLinearSearch(ABC):
         process in the pool. If the specified number of cores is 1, a pool instance is not made and None is returned.
 
         The pool cannot be set as an attribute of the class itself because this prevents pickling, thus it is generated
-        via this function before calling the non-linear search.
+        via this function before calling the non-linear search. The pool persists for the duration of the fit, or of
+        the whole `Pipeline` if the search is run as part of one, so that its workers are reused. If this is called
+        outside of a fit (i.e. outside a *shared_pools* context) the pool is not shared and must be closed by the
+        caller. The fitness function should be sent to the workers using *SearchPool.install*.
 
         The pool instance is also set up with a list of unique pool ids, which are used during model-fitting to
         identify a 'master core' (the one whose id value is lowest) which handles model result output, visualization,
@@ -518,17 +684,9 @@ class NonLinearSearch(ABC):
 
         else:
 
-            manager = mp.Manager()
-            idQueue = manager.Queue()
+            pool = pool_for(number_of_cores=self.number_of_cores)
 
-            [idQueue.put(i) for i in range(self.number_of_cores)]
-
-            pool = mp.Pool(
-                processes=self.number_of_cores, initializer=init, initargs=(idQueue,)
-            )
-            ids = pool.map(f, range(self.number_of_cores))
-
-            return pool, [id[1] for id in ids]
+            return pool, pool.ids
 
     def __eq__(self, other):
         return isinstance(other, NonLinearSearch) and self.__dict__ == other.__dict__
@@ -543,6 +701,26 @@ class Analysis(ABC):
     def log_likelihood_function(self, instance):
         raise NotImplementedError()
 
+    def log_likelihood_function_batch(self, parameters, model):
+        """
+        Optionally compute the log likelihoods of a batch of points in parameter space in a single call, for example
+        by fitting all points with NumPy array operations.
+
+        Unless this method is overridden every point is fitted by *log_likelihood_function*.
+
+        Parameters
+        ----------
+        parameters : np.ndarray
+            An (N, D) array of physical parameter values, ordered as the priors of the model.
+        model : ModelMapper
+            The model, whose *instance_from_vector* method gives the instance of any point in the batch.
+
+        Returns
+        -------
+        An array of the N log likelihoods, where a point which should be resampled has a log likelihood of NaN.
+        """
+        raise NotImplementedError()
+
     def visualize(self, paths : Paths, instance, during_analysis):
         pass
 
@@ -755,15 +933,3 @@ class PriorPasser:
         use_errors = config("prior_passer", "use_errors")
         use_widths = config("prior_passer", "use_widths")
         return PriorPasser(sigma=sigma, use_errors=use_errors, use_widths=use_widths)
-
-
-def init(queue):
-    global idx
-    idx = queue.get()
-
-
-def f(x):
-    global idx
-    process = mp.current_process()
-    sleep(1)
-    return idx, process.pid, x * x
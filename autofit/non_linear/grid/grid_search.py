@@ -1,4 +1,3 @@
-import copy
 from os import path
 from typing import List, Tuple, Union
 
@@ -11,6 +10,7 @@ from autofit.mapper.prior import prior as p
 from autofit.non_linear.abstract_search import Result
 from autofit.non_linear.parallel import AbstractJob, Process, AbstractJobResult
 from autofit.non_linear.paths import Paths
+from autofit.non_linear.shared import shared_arrays
 
 
 class GridSearchResult:
@@ -224,11 +224,11 @@ class GridSearch:
         return 1 / self.number_of_steps
 
     def make_physical_lists(self, grid_priors) -> List[List[float]]:
-        lists = self.make_lists(grid_priors)
-        return [
-            [prior.value_for(value) for prior, value in zip(grid_priors, l)]
-            for l in lists
-        ]
+        lists = np.array(self.make_lists(grid_priors))
+        return np.stack(
+            [prior.value_for(lists[:, i]) for i, prior in enumerate(grid_priors)],
+            axis=-1
+        ).tolist()
 
     def make_lists(self, grid_priors):
         """
@@ -328,27 +328,28 @@ class GridSearch:
             + ["likelihood_merit"]
         ]
 
-        jobs = list()
-
-        for index, values in enumerate(lists):
-            jobs.append(
-                self.job_for_analysis_grid_priors_and_values(
-                    analysis=copy.deepcopy(analysis),
-                    model=model,
-                    grid_priors=grid_priors,
-                    values=values,
-                    index=index,
-                )
+        jobs = (
+            self.job_for_analysis_grid_priors_and_values(
+                analysis=analysis,
+                model=model,
+                grid_priors=grid_priors,
+                values=values,
+                index=index,
             )
+            for index, values in enumerate(lists)
+        )
 
-        for result in Process.run_jobs(
-                jobs,
-                self.number_of_cores
-        ):
-            results.append(result)
-            results = sorted(results)
-            results_list.append(result.result_list_row)
-            self.write_results(results_list)
+        # each job is pickled when it is sent to a process, so the processes do not share the analysis, but large
+        # arrays are placed in shared memory so that they are not copied for every job
+        with shared_arrays(analysis):
+            for result in Process.run_jobs(
+                    jobs,
+                    self.number_of_cores
+            ):
+                results.append(result)
+                results = sorted(results)
+                results_list.append(result.result_list_row)
+                self.write_results(results_list)
 
         return GridSearchResult(
             [
@@ -1,5 +1,4 @@
 from autoconf import conf
-from autofit import exc
 
 from autofit.non_linear.log import logger
 
@@ -73,25 +72,23 @@ class Initializer:
 
         while point_index < total_points:
 
-            unit_parameters = model.random_unit_vector_within_limits(
-                lower_limit=self.lower_limit, upper_limit=self.upper_limit
+            unit_parameters_batch = model.random_unit_vectors_within_limits(
+                total_points=total_points - point_index,
+                lower_limit=self.lower_limit,
+                upper_limit=self.upper_limit
             )
-            parameters = model.vector_from_unit_vector(unit_vector=unit_parameters)
+            parameters_batch = model.vectors_from_unit_vectors(unit_vectors=unit_parameters_batch)
 
-            try:
-                figure_of_merit = fitness_function.figure_of_merit_from_parameters(
-                    parameters=parameters
-                )
+            figures_of_merit_batch = fitness_function.figures_of_merit_from_parameters(
+                parameters=parameters_batch
+            )
 
-                if np.isnan(figure_of_merit):
-                    raise exc.FitException
+            accepted = ~np.isnan(figures_of_merit_batch)
 
-                initial_unit_parameters.append(unit_parameters)
-                initial_parameters.append(parameters)
-                initial_figures_of_merit.append(figure_of_merit)
-                point_index += 1
-            except exc.FitException:
-                pass
+            initial_unit_parameters += unit_parameters_batch[accepted].tolist()
+            initial_parameters += parameters_batch[accepted].tolist()
+            initial_figures_of_merit += figures_of_merit_batch[accepted].tolist()
+            point_index += int(np.sum(accepted))
 
         return initial_unit_parameters, initial_parameters, initial_figures_of_merit
 
@@ -114,24 +111,15 @@ class Initializer:
             of free dimensions of the model.
         """
 
-        initial_unit_parameters = []
-        initial_parameters = []
-        initial_figures_of_merit = []
-
-        point_index = 0
+        initial_unit_parameters = model.random_unit_vectors_within_limits(
+            total_points=total_points,
+            lower_limit=self.lower_limit,
+            upper_limit=self.upper_limit
+        )
+        initial_parameters = model.vectors_from_unit_vectors(unit_vectors=initial_unit_parameters)
+        initial_figures_of_merit = [-1.0e99] * total_points
 
-        while point_index < total_points:
-
-            unit_parameters = model.random_unit_vector_within_limits(
-                lower_limit=self.lower_limit, upper_limit=self.upper_limit
-            )
-            parameters = model.vector_from_unit_vector(unit_vector=unit_parameters)
-            initial_unit_parameters.append(unit_parameters)
-            initial_parameters.append(parameters)
-            initial_figures_of_merit.append(-1.0e99)
-            point_index += 1
-
-        return initial_unit_parameters, initial_parameters, initial_figures_of_merit
+        return initial_unit_parameters.tolist(), initial_parameters.tolist(), initial_figures_of_merit
 
 class InitializerPrior(Initializer):
     def __init__(self):
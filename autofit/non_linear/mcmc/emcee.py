@@ -8,7 +8,6 @@ import numpy as np
 from autofit import exc
 from autofit.mapper.model_mapper import ModelMapper
 from autofit.mapper.prior_model.abstract import AbstractPriorModel
-from autofit.non_linear import samples as samp
 from autofit.non_linear.log import logger
 from autofit.non_linear.mcmc.abstract_mcmc import AbstractMCMC
 from autofit.non_linear.paths import convert_paths
@@ -148,6 +147,15 @@ class Emcee(AbstractMCMC):
             except exc.FitException:
                 raise exc.FitException
 
+        def figures_of_merit_from_parameters(self, parameters):
+            return self.log_posteriors_from_parameters(parameters=parameters)
+
+        def call_batch(self, parameters):
+            """Compute the log posteriors of every walker in one call, as used by Emcee when it is vectorized."""
+            figures_of_merit = self.figures_of_merit_from_parameters(parameters=parameters)
+            figures_of_merit[np.isnan(figures_of_merit)] = self.resample_figure_of_merit
+            return figures_of_merit
+
     def _fit(self, model: AbstractPriorModel, analysis, log_likelihood_cap=None):
         """
         Fit a model using Emcee and the Analysis class which contains the data and returns the log likelihood from
@@ -173,10 +181,19 @@ class Emcee(AbstractMCMC):
             model=model, analysis=analysis, pool_ids=pool_ids
         )
 
+        # Without a pool the walkers are evaluated together, so that an analysis which implements
+        # log_likelihood_function_batch fits them in a single call.
+
+        log_prob_fn = fitness_function.call_batch
+
+        if pool is not None:
+            log_prob_fn = pool.install(fitness_function)
+
         emcee_sampler = emcee.EnsembleSampler(
             nwalkers=self.nwalkers,
             ndim=model.prior_count,
-            log_prob_fn=fitness_function.__call__,
+            log_prob_fn=log_prob_fn,
+            vectorize=pool is None,
             backend=emcee.backends.HDFBackend(
                 filename=self.paths.samples_path + "/emcee.hdf"
             ),
@@ -289,6 +306,7 @@ class Emcee(AbstractMCMC):
             samples_from_model=self.samples_via_sampler_from_model,
             log_likelihood_cap=log_likelihood_cap,
             pool_ids=pool_ids,
+            profiler=self.profiler,
         )
 
     def samples_via_sampler_from_model(self, model):
@@ -306,12 +324,12 @@ class Emcee(AbstractMCMC):
             etc.
         """
 
-        parameters = self.backend.get_chain(flat=True).tolist()
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
-        log_likelihoods = self.backend.get_log_prob(flat=True).tolist()
-        weights = len(log_likelihoods) * [1.0]
+        parameters = self.backend.get_chain(flat=True)
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        )
+        log_likelihoods = self.backend.get_log_prob(flat=True)
+        weights = np.ones(len(log_likelihoods))
         auto_correlation_time = self.backend.get_autocorr_time(tol=0)
         total_walkers = len(self.backend.get_chain()[0, :, 0])
         total_steps = len(self.backend.get_log_prob())
@@ -335,13 +353,17 @@ class Emcee(AbstractMCMC):
             time=self.timer.time,
         )
 
+    def final_sample_count(self, samples) -> int:
+        """
+        The Emcee chain is only ever extended, so every sample is final.
+        """
+        return len(samples.samples)
+
     def samples_via_csv_json_from_model(self, model):
 
         # TODO : Better design to remove repetition.
 
-        samples = samp.load_from_table(
-            filename=self.paths.samples_file
-        )
+        samples = self.load_sample_list()
 
         with open(self.paths.info_file) as infile:
             samples_info = json.load(infile)
@@ -85,7 +85,8 @@ class AbstractNest(NonLinearSearch):
             terminate_at_acceptance_ratio,
             acceptance_ratio_threshold,
             log_likelihood_cap=None,
-            pool_ids=None
+            pool_ids=None,
+            profiler=None,
         ):
 
             super().__init__(
@@ -94,7 +95,8 @@ class AbstractNest(NonLinearSearch):
                 model=model,
                 samples_from_model=samples_from_model,
                 log_likelihood_cap=log_likelihood_cap,
-                pool_ids=pool_ids
+                pool_ids=pool_ids,
+                profiler=profiler,
             )
 
             self.stagger_resampling_likelihood = stagger_resampling_likelihood
@@ -124,6 +126,20 @@ class AbstractNest(NonLinearSearch):
             except exc.FitException:
                 raise exc.FitException
 
+        def figures_of_merit_from_parameters(self, parameters):
+            return self.log_likelihoods_from_parameters(parameters=parameters)
+
+        def call_batch(self, parameters):
+            """Compute the log likelihoods of a batch of points in one call, resampling any which raise a
+            FitException."""
+
+            self.check_terminate_sampling()
+
+            return [
+                self.stagger_resampling_figure_of_merit() if np.isnan(figure_of_merit) else figure_of_merit
+                for figure_of_merit in self.figures_of_merit_from_parameters(parameters=parameters)
+            ]
+
         def stagger_resampling_figure_of_merit(self):
             """By default, when a fit raises an exception a log likelihood of -np.inf is returned, which leads the
             sampler to discard the sample.
@@ -208,14 +224,13 @@ class AbstractNest(NonLinearSearch):
             terminate_at_acceptance_ratio=self.terminate_at_acceptance_ratio,
             acceptance_ratio_threshold=self.acceptance_ratio_threshold,
             log_likelihood_cap=log_likelihood_cap,
-            pool_ids=pool_ids
+            pool_ids=pool_ids,
+            profiler=self.profiler,
         )
 
     def samples_via_csv_json_from_model(self, model):
 
-        samples = samp.load_from_table(
-            filename=self.paths.samples_file
-        )
+        samples = self.load_sample_list()
 
         with open(self.paths.info_file) as infile:
             samples_info = json.load(infile)
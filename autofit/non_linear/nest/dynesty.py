@@ -11,10 +11,35 @@ from autofit.non_linear.abstract_search import Result
 from autofit.non_linear.log import logger
 from autofit.non_linear.nest.abstract_nest import AbstractNest
 from autofit.non_linear.paths import convert_paths
+from autofit.non_linear.pool import shared_pools
 from autofit.non_linear.samples import NestSamples, Sample
 from autofit.text import samples_text
 
 
+class BatchMap:
+    def __init__(self, sampler, fitness_function):
+        """
+        Used in place of the map function of a serial Dynesty sampler, so that when the sampler evaluates the log
+        likelihoods of a set of new live points they are fitted in a single batch.
+
+        Every other function the sampler maps (e.g. its prior transform) is mapped one point at a time as normal.
+
+        Parameters
+        ----------
+        sampler
+            The Dynesty sampler whose log likelihood function is batched.
+        fitness_function : AbstractNest.Fitness
+            The fitness function which fits a batch of points.
+        """
+        self.sampler = sampler
+        self.fitness_function = fitness_function
+
+    def __call__(self, function, iterable):
+        if function is self.sampler.loglikelihood:
+            return self.fitness_function.call_batch(parameters=np.asarray(list(iterable)))
+        return map(function, iterable)
+
+
 class AbstractDynesty(AbstractNest):
     def __init__(
             self,
@@ -303,9 +328,10 @@ class AbstractDynesty(AbstractNest):
         sampler.pool = pool
 
         if self.number_of_cores == 1:
-            sampler.M = map
+            sampler.M = BatchMap(sampler=sampler, fitness_function=fitness_function)
         else:
             sampler.M = pool.map
+            sampler.loglikelihood = pool.install(fitness_function)
 
         finished = False
 
@@ -344,12 +370,16 @@ class AbstractDynesty(AbstractNest):
                         continue
 
             sampler_pickle = sampler
+            loglikelihood = sampler_pickle.loglikelihood
+            M = sampler_pickle.M
             sampler_pickle.loglikelihood = None
+            sampler_pickle.M = map
 
             with open(f"{self.paths.samples_path}/dynesty.pickle", "wb") as f:
                 pickle.dump(sampler_pickle, f)
 
-            sampler_pickle.loglikelihood = fitness_function
+            sampler_pickle.loglikelihood = loglikelihood
+            sampler_pickle.M = M
 
             self.perform_update(model=model, analysis=analysis, during_analysis=True)
 
@@ -414,16 +444,14 @@ class AbstractDynesty(AbstractNest):
             Manages all paths, e.g. where the search outputs are stored, the samples, etc.
         """
         sampler = self.load_sampler
-        parameters = sampler.results.samples.tolist()
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
-        log_likelihoods = list(sampler.results.logl)
+        parameters = sampler.results.samples
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        )
+        log_likelihoods = sampler.results.logl
 
         try:
-            weights = list(
-                np.exp(np.asarray(sampler.results.logwt) - sampler.results.logz[-1])
-            )
+            weights = np.exp(np.asarray(sampler.results.logwt) - sampler.results.logz[-1])
         except:
             weights = sampler.results["weights"]
 
@@ -724,6 +752,16 @@ class DynestyStatic(AbstractDynesty):
             live_points=live_points,
         )
 
+    # The weights of the dead points depend on the current evidence estimate.
+    rewrite_sample_weights = True
+
+    def final_sample_count(self, samples) -> int:
+        """
+        The dead points of the static sampler are final, whereas the live points which follow them are replaced as the
+        search continues.
+        """
+        return len(samples.samples) - samples.number_live_points
+
 
 class DynestyDynamic(AbstractDynesty):
     def __init__(
@@ -991,10 +1029,14 @@ class DynestyDynamic(AbstractDynesty):
         # TODO : Better way to handle?
         self.timer.paths = self.paths
         self.timer.start()
+        self.profiler.start(parallel=self.number_of_cores > 1)
 
-        samples = self._fit(model=model, analysis=analysis)
+        with shared_pools():
+            samples = self._fit(model=model, analysis=analysis)
         open(self.paths.has_completed_path, "w+").close()
 
+        self.profiler.output_to_json(filename=self.paths.file_profiling)
+
         return Result(samples=samples, previous_model=model, search=self)
 
     def _fit(self, model: AbstractPriorModel, analysis, log_likelihood_cap=None) -> NestSamples:
@@ -1036,9 +1078,10 @@ class DynestyDynamic(AbstractDynesty):
         sampler.pool = pool
 
         if self.number_of_cores == 1:
-            sampler.M = map
+            sampler.M = BatchMap(sampler=sampler, fitness_function=fitness_function)
         else:
             sampler.M = pool.map
+            sampler.loglikelihood = pool.install(fitness_function)
 
         finished = False
 
@@ -1078,7 +1121,7 @@ class DynestyDynamic(AbstractDynesty):
         self.timer.update()
 
         samples = self.samples_via_sampler_from_model(model=model, sampler=sampler)
-        samples.write_table(filename=self.paths.samples_file)
+        self.write_samples_table(samples=samples)
         self.save_samples(samples=samples)
 
         instance = samples.max_log_likelihood_instance
@@ -1116,16 +1159,14 @@ class DynestyDynamic(AbstractDynesty):
             Manages all paths, e.g. where the search outputs are stored, the samples, etc.
         """
 
-        parameters = sampler.results.samples.tolist()
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
-        log_likelihoods = list(sampler.results.logl)
+        parameters = sampler.results.samples
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        )
+        log_likelihoods = sampler.results.logl
 
         try:
-            weights = list(
-                np.exp(np.asarray(sampler.results.logwt) - sampler.results.logz[-1])
-            )
+            weights = np.exp(np.asarray(sampler.results.logwt) - sampler.results.logz[-1])
         except:
             weights = sampler.results["weights"]
 
@@ -1138,7 +1179,8 @@ class DynestyDynamic(AbstractDynesty):
                 log_likelihoods=log_likelihoods,
                 log_priors=log_priors,
                 weights=weights,
-                model=model
+                model=model,
+                parameters=parameters
             ),
             total_samples=total_samples,
             log_evidence=log_evidence,
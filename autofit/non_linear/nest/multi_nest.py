@@ -1,3 +1,8 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+
 from autoconf import conf
 from autofit.mapper.prior_model.abstract import AbstractPriorModel
 from autofit.non_linear import abstract_search
@@ -379,22 +384,19 @@ class MultiNest(abstract_nest.AbstractNest):
             cube values to physical values via the priors.
         """
 
-        parameters = parameters_from_file_weighted_samples(
-            file_weighted_samples=self.paths.file_weighted_samples,
-            prior_count=model.prior_count,
+        weighted_samples = weighted_samples_from_file(
+            file_weighted_samples=self.paths.file_weighted_samples
         )
 
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
+        parameters = weighted_samples[:, 2:2 + model.prior_count].tolist()
 
-        log_likelihoods = log_likelihoods_from_file_weighted_samples(
-            file_weighted_samples=self.paths.file_weighted_samples
-        )
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        ).tolist()
 
-        weights = weights_from_file_weighted_samples(
-            file_weighted_samples=self.paths.file_weighted_samples
-        )
+        log_likelihoods = (-0.5 * weighted_samples[:, 1]).tolist()
+
+        weights = weighted_samples[:, 0].tolist()
 
         total_samples = total_samples_from_file_resume(
             file_resume=self.paths.file_resume
@@ -420,76 +422,67 @@ class MultiNest(abstract_nest.AbstractNest):
         )
 
 
-def parameters_from_file_weighted_samples(
-        file_weighted_samples, prior_count
-) -> [[float]]:
-    """Open the file "multinest.txt" and extract the parameter values of every accepted live point as a list
-    of lists."""
-    weighted_samples = open(file_weighted_samples)
-
-    total_samples = 0
-    for line in weighted_samples:
-        total_samples += 1
-
-    weighted_samples.seek(0)
+# The width of each field of the multinest.txt file, which is written by Fortran.
+FIELD_WIDTH = 28
 
-    parameters = []
+def weighted_samples_from_file(file_weighted_samples) -> np.ndarray:
+    """Open the file "multinest.txt" and load it as an array with a row for every accepted live point, whose columns
+    are its weight, -2 times its log likelihood and its parameters.
 
-    for line in range(total_samples):
-        vector = []
-        weighted_samples.read(56)
-        for param in range(prior_count):
-            vector.append(float(weighted_samples.read(28)))
-        weighted_samples.readline()
-        parameters.append(vector)
+    The file is read in one pass and its fixed width fields are converted to floats by NumPy. As values written by
+    Fortran may not be separated by whitespace the fields are split by their width rather than by whitespace.
 
-    weighted_samples.close()
+    The arrays of the few most recently loaded files are cached against their size and modification time, so that
+    a file is not parsed again each time the samples are updated whilst it is unchanged. The cached array is read
+    only.
+    """
+    stat = os.stat(file_weighted_samples)
+    return _weighted_samples_from_file(
+        file_weighted_samples, stat.st_size, stat.st_mtime_ns
+    )
 
-    return parameters
 
+@lru_cache(maxsize=4)
+def _weighted_samples_from_file(file_weighted_samples, size, mtime_ns) -> np.ndarray:
+    """
+    Parse a multinest.txt file. The size and modification time of the file are arguments so that the cache is keyed
+    on them.
+    """
+    with open(file_weighted_samples, "rb") as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
 
-def log_likelihoods_from_file_weighted_samples(file_weighted_samples) -> [float]:
-    """Open the file "multinest.txt" and extract the log likelihood values of every accepted live point as a list."""
-    weighted_samples = open(file_weighted_samples)
+    if len(lines) == 0:
+        weighted_samples = np.zeros((0, 0))
+    else:
+        columns = len(lines[0]) // FIELD_WIDTH
+        weighted_samples = np.array(
+            lines, dtype=f"S{columns * FIELD_WIDTH}"
+        ).view(f"S{FIELD_WIDTH}").reshape(len(lines), columns).astype(float)
 
-    total_samples = 0
-    for line in weighted_samples:
-        total_samples += 1
+    weighted_samples.flags.writeable = False
 
-    weighted_samples.seek(0)
+    return weighted_samples
 
-    log_likelihoods = []
 
-    for line in range(total_samples):
-        weighted_samples.read(28)
-        log_likelihoods.append(-0.5 * float(weighted_samples.read(28)))
-        weighted_samples.readline()
+def parameters_from_file_weighted_samples(
+        file_weighted_samples, prior_count
+) -> [[float]]:
+    """Open the file "multinest.txt" and extract the parameter values of every accepted live point as a list
+    of lists."""
+    weighted_samples = weighted_samples_from_file(file_weighted_samples)
+    return weighted_samples[:, 2:2 + prior_count].tolist()
 
-    weighted_samples.close()
 
-    return log_likelihoods
+def log_likelihoods_from_file_weighted_samples(file_weighted_samples) -> [float]:
+    """Open the file "multinest.txt" and extract the log likelihood values of every accepted live point as a list."""
+    weighted_samples = weighted_samples_from_file(file_weighted_samples)
+    return (-0.5 * weighted_samples[:, 1]).tolist()
 
 
 def weights_from_file_weighted_samples(file_weighted_samples) -> [float]:
     """Open the file "multinest.txt" and extract the weight values of every accepted live point as a list."""
-    weighted_samples = open(file_weighted_samples)
-
-    total_samples = 0
-    for line in weighted_samples:
-        total_samples += 1
-
-    weighted_samples.seek(0)
-
-    log_likelihoods = []
-
-    for line in range(total_samples):
-        weighted_samples.read(4)
-        log_likelihoods.append(float(weighted_samples.read(24)))
-        weighted_samples.readline()
-
-    weighted_samples.close()
-
-    return log_likelihoods
+    weighted_samples = weighted_samples_from_file(file_weighted_samples)
+    return weighted_samples[:, 0].tolist()
 
 
 def total_samples_from_file_resume(file_resume):
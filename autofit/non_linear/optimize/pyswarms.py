@@ -132,20 +132,10 @@ class AbstractPySwarms(AbstractOptimizer):
     class Fitness(AbstractOptimizer.Fitness):
         def __call__(self, parameters):
 
-            figures_of_merit = []
+            figures_of_merit = self.figures_of_merit_from_parameters(parameters=parameters)
+            figures_of_merit[np.isnan(figures_of_merit)] = -2.0 * self.resample_figure_of_merit
 
-            for params_of_particle in parameters:
-
-                try:
-                    figure_of_merit = self.figure_of_merit_from_parameters(
-                        parameters=params_of_particle
-                    )
-                except exc.FitException:
-                    figure_of_merit = -2.0 * self.resample_figure_of_merit
-
-                figures_of_merit.append(figure_of_merit)
-
-            return np.asarray(figures_of_merit)
+            return figures_of_merit
 
         def figure_of_merit_from_parameters(self, parameters):
             """The figure of merit is the value that the `NonLinearSearch` uses to sample parameter space. *PySwarms*
@@ -155,6 +145,9 @@ class AbstractPySwarms(AbstractOptimizer):
             except exc.FitException:
                 raise exc.FitException
 
+        def figures_of_merit_from_parameters(self, parameters):
+            return -2.0 * self.log_posteriors_from_parameters(parameters=parameters)
+
     def _fit(self, model: AbstractPriorModel, analysis, log_likelihood_cap=None):
         """
         Fit a model using PySwarms and the Analysis class which contains the data and returns the log likelihood from
@@ -300,6 +293,7 @@ class AbstractPySwarms(AbstractOptimizer):
             samples_from_model=self.samples_via_sampler_from_model,
             log_likelihood_cap=log_likelihood_cap,
             pool_ids=pool_ids,
+            profiler=self.profiler,
         )
 
     def sampler_fom_model_and_fitness(self, model, fitness_function):
@@ -317,20 +311,18 @@ class AbstractPySwarms(AbstractOptimizer):
             cube values to physical values via the priors.
         """
 
-        parameters = [
-            param.tolist() for parameters in self.load_points for param in parameters
-        ]
-        log_priors = [
-            sum(model.log_priors_from_vector(vector=vector)) for vector in parameters
-        ]
-        log_posteriors = self.load_log_posteriors
-        log_likelihoods = [lp - prior for lp, prior in zip(log_posteriors, log_priors)]
-        weights = len(log_likelihoods) * [1.0]
+        parameters = np.asarray([parameters[0] for parameters in self.load_points])
+        log_priors = np.sum(
+            model.log_priors_from_vectors(vectors=parameters), axis=1
+        )
+        log_posteriors = np.asarray(self.load_log_posteriors)
+        log_likelihoods = log_posteriors - log_priors
+        weights = np.ones(len(log_likelihoods))
 
         return OptimizerSamples(
             model=model,
             samples=Sample.from_lists(
-                parameters=[parameters.tolist()[0] for parameters in self.load_points],
+                parameters=parameters,
                 log_likelihoods=log_likelihoods,
                 log_priors=log_priors,
                 weights=weights,
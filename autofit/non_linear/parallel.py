@@ -1,8 +1,10 @@
 import multiprocessing
+import pickle
+import queue
+import traceback
 from abc import ABC, abstractmethod
 from itertools import count
-from time import sleep
-from typing import Iterable
+from typing import Iterable, Optional
 
 from autofit.non_linear.log import logger
 
@@ -38,9 +40,17 @@ class AbstractJob(ABC):
 
 
 class Process(multiprocessing.Process):
-    def __init__(self, name: str, job_queue: multiprocessing.Queue):
+    def __init__(
+            self,
+            name: str,
+            job_queue: multiprocessing.Queue,
+            result_queue: multiprocessing.Queue,
+    ):
         """
-        A parallel process that consumes Jobs through the job queue and outputs results through its own queue.
+        A parallel process that consumes Jobs through the job queue and outputs results through the result queue.
+
+        The process blocks until a job is available and terminates when it receives a sentinel (None) from the job
+        queue.
 
         Parameters
         ----------
@@ -48,42 +58,44 @@ class Process(multiprocessing.Process):
             The name of the process
         job_queue: multiprocessing.Queue
             The queue through which jobs are submitted
+        result_queue: multiprocessing.Queue
+            The queue, shared by all processes, through which results are returned
         """
         super().__init__(name=name)
         logger.info("created process {}".format(name))
 
         self.job_queue = job_queue
-        self.queue = multiprocessing.Queue()
-        self.count = 0
-        self.max_count = 250
+        self.result_queue = result_queue
 
     def run(self):
         """
-        Run this process, completing each job in the job_queue and
-        passing the result to the queue.
+        Run this process, completing each job in the job_queue and passing the result to the result queue. If a job
+        raises an exception the exception is passed to the result queue in place of the result.
         """
         logger.info("starting process {}".format(self.name))
         while True:
-            sleep(0.025)
-            if self.count >= self.max_count:
+            job = self.job_queue.get()
+            if job is None:
                 break
-            if self.job_queue.empty():
-                self.count += 1
-            else:
-                self.count = 0
-                job = self.job_queue.get()
-                self.queue.put(job.perform())
+            try:
+                self.result_queue.put((job.perform(), None))
+            except Exception as e:
+                self.result_queue.put((None, _picklable(e)))
         logger.info("terminating process {}".format(self.name))
-        self.job_queue.close()
 
     @classmethod
     def run_jobs(
             cls,
             jobs: Iterable[AbstractJob],
-            number_of_cores: int
+            number_of_cores: int,
+            max_in_flight: Optional[int] = None,
     ):
         """
-        Run the collection of jobs across n - 1 other cores.
+        Run the collection of jobs across n - 1 other cores, yielding each result as soon as it is complete.
+
+        Jobs are taken from the iterable only as processes become free, so that no more than max_in_flight jobs
+        have been submitted without their result having been yielded. A generator of jobs is therefore not
+        consumed (nor are its jobs created) ahead of the processes.
 
         Parameters
         ----------
@@ -91,37 +103,102 @@ class Process(multiprocessing.Process):
             Serializable concrete children of the AbstractJob class
         number_of_cores
             The number of cores this computer has. Must be at least 2.
+        max_in_flight
+            The maximum number of jobs submitted but not yet returned. Defaults to twice the number of processes.
+
+        Raises
+        ------
+        Exception
+            The exception raised by a job, after which the remaining jobs are abandoned
         """
         if number_of_cores < 2:
             raise AssertionError(
                 "The number of cores available must be at least 2 for parallel to run"
             )
 
+        number_of_processes = number_of_cores - 1
+        max_in_flight = max_in_flight or 2 * number_of_processes
+
         job_queue = multiprocessing.Queue()
+        result_queue = multiprocessing.Queue()
 
         processes = [
-            Process(str(number), job_queue)
-            for number in range(number_of_cores - 1)
+            Process(str(number), job_queue, result_queue)
+            for number in range(number_of_processes)
         ]
 
-        total = 0
-        for job in jobs:
-            job_queue.put(job)
-            total += 1
-
         for process in processes:
             process.start()
 
-        count = 0
-
-        while count < total:
-            for process in processes:
-                while not process.queue.empty():
-                    result = process.queue.get()
-                    count += 1
-                    yield result
+        jobs = iter(jobs)
+        in_flight = 0
+        completed = False
+
+        try:
+            while True:
+                while in_flight < max_in_flight:
+                    job = next(jobs, None)
+                    if job is None:
+                        break
+                    job_queue.put(job)
+                    in_flight += 1
+
+                if in_flight == 0:
+                    break
+
+                result, exception = cls._get_result(result_queue, processes)
+                in_flight -= 1
+
+                if exception is not None:
+                    raise exception
+
+                yield result
+
+            completed = True
+        finally:
+            if completed:
+                for _ in processes:
+                    job_queue.put(None)
+                for process in processes:
+                    process.join()
+            else:
+                for process in processes:
+                    process.terminate()
+                    process.join()
 
-        job_queue.close()
+            job_queue.close()
+            result_queue.close()
 
-        for process in processes:
-            process.join(timeout=1.0)
+    @staticmethod
+    def _get_result(result_queue, processes):
+        """
+        Block until a result is available, checking periodically that no process has died without returning its
+        result.
+        """
+        while True:
+            try:
+                return result_queue.get(timeout=1.0)
+            except queue.Empty:
+                for process in processes:
+                    if process.exitcode is not None:
+                        raise RuntimeError(
+                            "Process {} exited unexpectedly with exit code {}".format(
+                                process.name,
+                                process.exitcode
+                            )
+                        )
+
+
+def _picklable(exception: Exception) -> Exception:
+    """
+    The exception if it can be passed between processes, otherwise a RuntimeError with its traceback.
+    """
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        return RuntimeError(
+            "".join(traceback.format_exception(
+                type(exception), exception, exception.__traceback__
+            ))
+        )
@@ -175,6 +175,10 @@ class Paths:
     def samples_file(self) -> str:
         return path.join(self.samples_path, "samples.csv")
 
+    @property
+    def samples_hdf5_file(self) -> str:
+        return path.join(self.samples_path, "samples.h5")
+
     @property
     def info_file(self) -> str:
         return path.join(self.samples_path, "info.json")
@@ -262,6 +266,10 @@ class Paths:
     def file_results(self):
         return path.join(self.output_path, "model.results")
 
+    @property
+    def file_profiling(self) -> str:
+        return path.join(self.output_path, "profiling.json")
+
     @property
     @make_path
     def pdf_path(self) -> str:
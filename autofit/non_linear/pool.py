@@ -0,0 +1,162 @@
+import multiprocessing as mp
+import os
+import uuid
+from contextlib import contextmanager
+
+from autofit.non_linear.shared import shared_arrays
+
+_pools = dict()
+_shared = 0
+
+# The fitness function installed in a worker process, and the token identifying it.
+_token = None
+_fitness = None
+_barrier = None
+
+
+def _initialize(barrier):
+    """
+    Run once when each worker process starts.
+    """
+    global _barrier
+    _barrier = barrier
+
+
+def _install(args):
+    """
+    Install a fitness function in a worker. Every worker is sent exactly one install task because each waits at the
+    barrier until all workers hold one.
+    """
+    global _token, _fitness
+    _token, _fitness = args
+    _barrier.wait()
+    return os.getpid()
+
+
+class WorkerFitness:
+    def __init__(self, fitness, token):
+        """
+        Stands in for a fitness function which has been installed in the workers of a `SearchPool`.
+
+        Only the token is pickled when this is sent to a worker, so that calls made in a worker send nothing but the
+        parameters and use the copy of the fitness function (with its model and analysis) installed in that worker.
+
+        Parameters
+        ----------
+        fitness
+            The fitness function, which is called directly in the process which installed it
+        token
+            Identifies the installed fitness function
+        """
+        self.fitness = fitness
+        self.token = token
+
+    def __call__(self, *args, **kwargs):
+        if self.fitness is not None:
+            return self.fitness(*args, **kwargs)
+        if self.token != _token:
+            raise RuntimeError(
+                "The fitness function has not been installed in this worker process"
+            )
+        return _fitness(*args, **kwargs)
+
+    def __getstate__(self):
+        return {"fitness": None, "token": self.token}
+
+
+class SearchPool:
+    def __init__(self, number_of_cores: int):
+        """
+        A pool of worker processes used to parallelize a `NonLinearSearch`.
+
+        The pool persists between fits so that consecutive phases (e.g. of a `Pipeline`) reuse the same workers. The
+        fitness function of each fit, including its model and analysis, is sent to each worker once by *install*,
+        after which only parameters and figures of merit are passed between processes.
+
+        Parameters
+        ----------
+        number_of_cores
+            The number of worker processes
+        """
+        self.number_of_cores = number_of_cores
+        self._barrier = mp.Barrier(number_of_cores)
+        self._pool = mp.Pool(
+            processes=number_of_cores,
+            initializer=_initialize,
+            initargs=(self._barrier,),
+        )
+        self.ids = self._broadcast(None, None)
+
+    @property
+    def size(self) -> int:
+        return self.number_of_cores
+
+    def _broadcast(self, token, fitness):
+        return self._pool.map(
+            _install,
+            [(token, fitness)] * self.number_of_cores,
+            chunksize=1,
+        )
+
+    def install(self, fitness) -> WorkerFitness:
+        """
+        Send a fitness function to every worker.
+
+        Large arrays held by the fitness function (e.g. the data of its analysis) are placed in shared memory while
+        it is sent, so that every worker maps the same copy of the data.
+
+        Returns
+        -------
+        A callable to pass to the sampler in place of the fitness function
+        """
+        token = uuid.uuid4().hex
+        with shared_arrays(fitness):
+            self.ids = self._broadcast(token, fitness)
+        return WorkerFitness(fitness=fitness, token=token)
+
+    def map(self, func, iterable, chunksize=None):
+        return self._pool.map(func, iterable, chunksize)
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+
+def pool_for(number_of_cores: int) -> SearchPool:
+    """
+    Retrieve a pool with the given number of workers.
+
+    While pools are shared (see *shared_pools*) an existing pool is reused, and a new pool is kept to be reused and
+    closed when the outermost context exits. Otherwise a new pool is created which belongs to the caller, who must
+    close it.
+    """
+    if _shared == 0:
+        return SearchPool(number_of_cores=number_of_cores)
+
+    try:
+        return _pools[number_of_cores]
+    except KeyError:
+        pool = SearchPool(number_of_cores=number_of_cores)
+        _pools[number_of_cores] = pool
+        return pool
+
+
+@contextmanager
+def shared_pools():
+    """
+    Keep every pool created inside this context alive until the outermost such context exits, at which point the
+    pools are closed.
+
+    Each `NonLinearSearch` fit runs inside this context, and a `Pipeline` runs all of its phases inside it so that
+    its phases share the same workers.
+    """
+    global _shared
+    _shared += 1
+    try:
+        yield
+    finally:
+        _shared -= 1
+        if _shared == 0:
+            for pool in _pools.values():
+                pool.close()
+            _pools.clear()
@@ -0,0 +1,175 @@
+import json
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Dict
+
+
+class Histogram:
+
+    # Bucket edges spaced by 10% from 100 nanoseconds to about 20 minutes.
+    edges = [1.0e-7 * 1.1 ** i for i in range(245)]
+
+    def __init__(self):
+        """A histogram of the durations of a repeated task, stored as counts in logarithmically spaced buckets so that
+        quantiles (e.g. the 99th percentile latency) can be estimated without storing every duration.
+        """
+        self.counts = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float, count: int = 1):
+        """
+        Record the duration of a task, or of *count* tasks performed together which are each recorded as taking an
+        equal share of the duration.
+        """
+        if count < 1:
+            return
+
+        self.counts[bisect_right(self.edges, seconds / count)] += count
+        self.count += count
+        self.total += seconds
+        self.max = max(self.max, seconds / count)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the durations as the upper edge of the bucket it falls in.
+        """
+        if self.count == 0:
+            return 0.0
+
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= q * self.count:
+                if index < len(self.edges):
+                    return min(self.edges[index], self.max)
+                return self.max
+
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class Profiler:
+
+    def __init__(self):
+        """Records how long a `NonLinearSearch` spends in each of its tasks, for example calls to the
+        `log_likelihood_function`, the construction of model instances and the steps of each update.
+
+        Timings are only recorded in the process running the search, so likelihood evaluations performed by the
+        worker processes of a parallel search are not included. The summary of a parallel search therefore omits the
+        rate and latency of likelihood evaluations rather than reporting those of the main process.
+        """
+        self.histograms = dict()
+        self.start_time = time.time()
+        self.parallel = False
+
+    def start(self, parallel: bool = False):
+        """
+        Reset the profiler at the start of a `NonLinearSearch`.
+
+        Parameters
+        ----------
+        parallel
+            Whether the likelihood is evaluated by worker processes, in which case those evaluations are not timed
+        """
+        self.histograms = dict()
+        self.start_time = time.time()
+        self.parallel = parallel
+
+    def add(self, name: str, seconds: float, count: int = 1):
+        """
+        Record the duration of a task.
+
+        Parameters
+        ----------
+        name
+            The name of the task, e.g. "log_likelihood"
+        seconds
+            How long the task took
+        count
+            The number of tasks performed in this duration, e.g. the size of a batch of likelihood evaluations
+        """
+        try:
+            histogram = self.histograms[name]
+        except KeyError:
+            histogram = Histogram()
+            self.histograms[name] = histogram
+
+        histogram.add(seconds, count=count)
+
+    @contextmanager
+    def __call__(self, name: str):
+        """
+        Time the body of a with block as the task *name*.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    @property
+    def elapsed_time(self) -> float:
+        return time.time() - self.start_time
+
+    def to_dict(self) -> dict:
+        """
+        A summary of the timings, including the rate and latency of likelihood evaluations, the fraction of the run
+        not spent evaluating the likelihood and the cost of each step of the updates.
+
+        For a parallel search the likelihood evaluations are not timed, so the statistics of the likelihood are None.
+        """
+        elapsed_time = self.elapsed_time
+
+        log_likelihood = self.histograms.get("log_likelihood", Histogram())
+
+        if self.parallel:
+            likelihood = dict.fromkeys([
+                "log_likelihood_calls",
+                "calls_per_second",
+                "log_likelihood_mean",
+                "log_likelihood_p99",
+                "overhead_fraction",
+            ])
+        else:
+            likelihood = {
+                "log_likelihood_calls": log_likelihood.count,
+                "calls_per_second": log_likelihood.count / elapsed_time if elapsed_time > 0 else 0.0,
+                "log_likelihood_mean": log_likelihood.mean,
+                "log_likelihood_p99": log_likelihood.quantile(0.99),
+                "overhead_fraction": 1.0 - log_likelihood.total / elapsed_time if elapsed_time > 0 else 0.0,
+            }
+
+        return {
+            "elapsed_time": elapsed_time,
+            "parallel": self.parallel,
+            **likelihood,
+            "update": {
+                name[len("update."):]: histogram.total
+                for name, histogram in self.histograms.items()
+                if name.startswith("update.")
+            },
+            "timings": {
+                name: histogram.to_dict()
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+
+    def output_to_json(self, filename: str):
+        with open(filename, "w") as outfile:
+            json.dump(self.to_dict(), outfile, indent=4)
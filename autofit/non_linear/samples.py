@@ -1,3 +1,4 @@
+import copy
 import csv
 import json
 import math
@@ -104,7 +105,7 @@ class Sample:
             log_likelihoods: List[float],
             log_priors: List[float],
             weights: List[float]
-    ) -> List["Sample"]:
+    ) -> "SampleList":
         """
         Convenience method to create a list of samples
         from lists of contained values
@@ -119,37 +120,17 @@ class Sample:
 
         Returns
         -------
-        A list of samples
-        """
-        samples = list()
-
-        # Another speed up.
-        model_component_and_parameter_names = model.model_component_and_parameter_names
-
-        for params, log_likelihood, log_prior, weight in zip(
-                parameters,
-                log_likelihoods,
-                log_priors,
-                weights
-        ):
-            arg_dict = {
-                t: param
-                for t, param
-                in zip(
-                    model_component_and_parameter_names,
-                    params
-                )
-            }
-
-            samples.append(
-                cls(
-                    log_likelihood=log_likelihood,
-                    log_prior=log_prior,
-                    weights=weight,
-                    **arg_dict
-                )
-            )
-        return samples
+        A list of samples, stored as arrays
+        """
+        total_samples = min(map(len, (parameters, log_likelihoods, log_priors, weights)))
+
+        return SampleList(
+            names=model.model_component_and_parameter_names,
+            parameters=parameters[:total_samples],
+            log_likelihoods=log_likelihoods[:total_samples],
+            log_priors=log_priors[:total_samples],
+            weights=weights[:total_samples]
+        )
 
     def instance_for_model(self, model: AbstractPriorModel):
         """
@@ -176,7 +157,140 @@ class Sample:
             )
 
 
-def load_from_table(filename: str) -> List[Sample]:
+class SampleList:
+    def __init__(
+            self,
+            names: List[str],
+            parameters,
+            log_likelihoods,
+            log_priors,
+            weights
+    ):
+        """
+        The samples taken during a search, stored column-wise as arrays rather than
+        as one `Sample` object per sample.
+
+        A `Sample` is only created when an individual sample is indexed or iterated.
+
+        Parameters
+        ----------
+        names
+            The model path of each parameter column
+        parameters
+            The parameter values of every sample, with shape (total_samples, len(names))
+        log_likelihoods
+            The log likelihood of every sample
+        log_priors
+            The log prior of every sample
+        weights
+            The weight of every sample
+        """
+        self.log_likelihoods = np.asarray(log_likelihoods, dtype=float).ravel()
+        self.log_priors = np.asarray(log_priors, dtype=float).ravel()
+        self.weights = np.asarray(weights, dtype=float).ravel()
+
+        if len(self.log_likelihoods) > 0:
+            self.parameters = np.asarray(parameters, dtype=float).reshape(
+                len(self.log_likelihoods), -1
+            )
+        else:
+            self.parameters = np.zeros((0, len(names)))
+
+        # samples may be stored without their parameters (e.g. only their likelihoods and weights)
+        self.names = list(names) if self.parameters.shape[1] > 0 else []
+
+        if self.parameters.shape[1] != len(self.names):
+            raise ValueError(
+                f"{len(self.names)} parameter names were given for {self.parameters.shape[1]} parameter columns"
+            )
+
+        self._indices = None
+
+    @classmethod
+    def from_samples(cls, samples: List[Sample]) -> "SampleList":
+        """
+        Create a list of samples from `Sample` objects. The parameter names are taken
+        from the first sample.
+        """
+        samples = list(samples)
+        names = list(samples[0].kwargs) if len(samples) > 0 else []
+        return SampleList(
+            names=names,
+            parameters=[
+                [sample.kwargs[name] for name in names]
+                for sample in samples
+            ],
+            log_likelihoods=[sample.log_likelihood for sample in samples],
+            log_priors=[sample.log_prior for sample in samples],
+            weights=[sample.weights for sample in samples],
+        )
+
+    @property
+    def indices(self) -> dict:
+        """
+        A dictionary mapping each parameter name to the index of its column
+        """
+        if self._indices is None:
+            self._indices = {
+                name: index
+                for index, name
+                in enumerate(self.names)
+            }
+        return self._indices
+
+    @property
+    def log_posteriors(self) -> np.ndarray:
+        return self.log_likelihoods + self.log_priors
+
+    def columns(self, paths: List[str]) -> np.ndarray:
+        """
+        The parameter values of every sample for the given paths, with shape
+        (total_samples, len(paths)).
+
+        Raises
+        ------
+        KeyError
+            If any path is not a parameter of these samples
+        """
+        if list(paths) == self.names:
+            return self.parameters
+        return self.parameters[:, [self.indices[path] for path in paths]]
+
+    def __len__(self):
+        return len(self.log_likelihoods)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the columns of the samples
+        """
+        return sum(
+            array.nbytes
+            for array in (self.parameters, self.log_likelihoods, self.log_priors, self.weights)
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return SampleList(
+                names=self.names,
+                parameters=self.parameters[item],
+                log_likelihoods=self.log_likelihoods[item],
+                log_priors=self.log_priors[item],
+                weights=self.weights[item],
+            )
+        return Sample(
+            log_likelihood=float(self.log_likelihoods[item]),
+            log_prior=float(self.log_priors[item]),
+            weights=float(self.weights[item]),
+            **dict(zip(self.names, self.parameters[item].tolist()))
+        )
+
+
+def load_from_table(filename: str) -> SampleList:
     """
     Load samples from a table
 
@@ -189,26 +303,55 @@ def load_from_table(filename: str) -> List[Sample]:
     -------
     A list of samples, one for each row in the CSV
     """
-    samples = list()
-
     with open(filename, "r+", newline="") as f:
-        reader = csv.reader(f)
-        headers = next(reader)
-        for row in reader:
-            samples.append(
-                Sample(
-                    **{
-                        header: float(value)
-                        for header, value
-                        in zip(
-                            headers,
-                            row
-                        )
-                    }
-                )
-            )
+        headers = next(csv.reader(f))
+
+    table = np.loadtxt(
+        filename, delimiter=",", skiprows=1, ndmin=2
+    ).reshape(-1, len(headers))
+
+    columns = {
+        header: index
+        for index, header
+        in enumerate(headers)
+    }
+    names = [
+        header for header in headers
+        if header not in ("log_likelihood", "log_prior", "log_posterior", "weights")
+    ]
+
+    return SampleList(
+        names=names,
+        parameters=table[:, [columns[name] for name in names]],
+        log_likelihoods=table[:, columns["log_likelihood"]],
+        log_priors=table[:, columns["log_prior"]],
+        weights=table[:, columns["weights"]],
+    )
+
+
+def load_from_hdf5(filename: str) -> SampleList:
+    """
+    Load samples from a binary HDF5 samples file written by `OptimizerSamples.write_hdf5`
 
-    return samples
+    Parameters
+    ----------
+    filename
+        The path to an HDF5 file, or a binary file object holding its contents
+
+    Returns
+    -------
+    A list of samples
+    """
+    import h5py
+
+    with h5py.File(filename, "r") as f:
+        return SampleList(
+            names=json.loads(f.attrs["names"]),
+            parameters=f["parameters"][()],
+            log_likelihoods=f["log_likelihood"][()],
+            log_priors=f["log_prior"][()],
+            weights=f["weights"][()],
+        )
 
 
 class OptimizerSamples:
@@ -226,31 +369,62 @@ class OptimizerSamples:
         ----------
         model : af.ModelMapper
             Maps input vectors of unit parameter values to physical values and model instances via priors.
+        samples
+            The samples of the search, either as a `SampleList` or a list of `Sample` objects which is converted to
+            a `SampleList`.
         """
         self.model = model
         self.samples = samples
         self.time = time
 
     @property
-    def parameters(self):
+    def samples(self) -> SampleList:
+        return self._samples
+
+    @samples.setter
+    def samples(self, samples):
+        if samples is not None and not isinstance(samples, SampleList):
+            samples = SampleList.from_samples(samples)
+        self._samples = samples
+        self._parameter_array = None
+        self._column_quantiles = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_parameter_array"] = None
+        state["_column_quantiles"] = None
+        return state
+
+    def __setstate__(self, state):
+        samples = state.pop("samples", None)
+        state.setdefault("_column_quantiles", None)
+        self.__dict__.update(state)
+        if samples is not None:
+            self.samples = samples
 
-        paths = self.model.model_component_and_parameter_names
+    @property
+    def parameter_array(self) -> np.ndarray:
+        """
+        The parameters of every sample as an array of shape (total_samples, prior_count), with columns in the same
+        order as the priors of the model.
+        """
+        if self._parameter_array is None:
+            if self.model is None:
+                return self.samples.parameters
 
-        try:
-            return [
-                sample.parameters_for_model(
-                    self.model, paths
-                )
-                for sample in self.samples
-            ]
-        except KeyError:
-            paths = util.convert_paths_for_backwards_compatibility(paths=paths, kwargs=self.samples[0].kwargs)
-            return [
-                sample.parameters_for_model(
-                    self.model, paths
-                )
-                for sample in self.samples
-            ]
+            paths = self.model.model_component_and_parameter_names
+
+            try:
+                self._parameter_array = self.samples.columns(paths)
+            except KeyError:
+                paths = util.convert_paths_for_backwards_compatibility(paths=paths, kwargs=self.samples.indices)
+                self._parameter_array = self.samples.columns(paths)
+
+        return self._parameter_array
+
+    @property
+    def parameters(self):
+        return self.parameter_array.tolist()
 
     @property
     def total_samples(self):
@@ -258,42 +432,23 @@ class OptimizerSamples:
 
     @property
     def weights(self):
-        return [
-            sample.weights
-            for sample
-            in self.samples
-        ]
+        return self.samples.weights.tolist()
 
     @property
     def log_likelihoods(self):
-        return [
-            sample.log_likelihood
-            for sample
-            in self.samples
-        ]
+        return self.samples.log_likelihoods.tolist()
 
     @property
     def log_posteriors(self):
-        return [
-            sample.log_posterior
-            for sample
-            in self.samples
-        ]
+        return self.samples.log_posteriors.tolist()
 
     @property
     def log_priors(self):
-        return [
-            sample.log_prior
-            for sample
-            in self.samples
-        ]
+        return self.samples.log_priors.tolist()
 
     @property
     def parameters_extract(self):
-        return [
-            [params[i] for params in self.parameters]
-            for i in range(self.model.prior_count)
-        ]
+        return self.parameter_array.T.tolist()
 
     @property
     def _headers(self) -> List[str]:
@@ -313,19 +468,22 @@ class OptimizerSamples:
         """
         Rows in the samples table
         """
+        yield from self._rows_between(start=0, stop=len(self.samples))
 
-        log_likelihoods = self.log_likelihoods
-        log_priors = self.log_priors
-        log_posteriors = self.log_posteriors
-        weights = self.weights
+    def _rows_between(self, start: int, stop: int) -> List[List[float]]:
+        """
+        Rows in the samples table for the samples with indexes from start up to stop
+        """
+        log_likelihoods = self.samples.log_likelihoods[start:stop]
+        log_priors = self.samples.log_priors[start:stop]
 
-        for index, row in enumerate(self.parameters):
-            yield row + [
-                log_likelihoods[index],
-                log_priors[index],
-                log_posteriors[index],
-                weights[index],
-            ]
+        return np.column_stack((
+            self.parameter_array[start:stop],
+            log_likelihoods,
+            log_priors,
+            log_likelihoods + log_priors,
+            self.samples.weights[start:stop],
+        )).tolist()
 
     def write_table(self, filename: str):
         """
@@ -340,8 +498,63 @@ class OptimizerSamples:
         with open(filename, "w+", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(self._headers)
-            for row in self._rows:
-                writer.writerow(row)
+            writer.writerows(self._rows)
+
+    @property
+    def parameter_names(self) -> List[str]:
+        """
+        The path of each parameter column
+        """
+        if self.model is None:
+            return self.samples.names
+        return self.model.model_component_and_parameter_names
+
+    def write_hdf5(self, filename: str):
+        """
+        Write the parameters, likelihoods, priors and weights to a binary HDF5 file, with the parameter names stored
+        as metadata.
+
+        The datasets are chunked and resizable so that further samples can be appended.
+
+        Parameters
+        ----------
+        filename
+            Where the file is to be written
+        """
+        import h5py
+
+        parameter_array = self.parameter_array
+
+        with h5py.File(filename, "w") as f:
+            f.attrs["names"] = json.dumps(self.parameter_names)
+            f.create_dataset(
+                "parameters",
+                data=parameter_array,
+                maxshape=(None, None),
+                chunks=(1024, max(parameter_array.shape[1], 1)),
+            )
+            for name, values in (
+                    ("log_likelihood", self.samples.log_likelihoods),
+                    ("log_prior", self.samples.log_priors),
+                    ("weights", self.samples.weights),
+            ):
+                f.create_dataset(
+                    name,
+                    data=values,
+                    maxshape=(None,),
+                    chunks=(1024,),
+                )
+
+    def without_sample_list(self) -> "OptimizerSamples":
+        """
+        A copy of these samples with the sample columns removed, used to pickle the samples when their columns are
+        stored in a binary samples file.
+        """
+        samples = copy.copy(self)
+        samples._samples = None
+        samples._parameter_array = None
+        samples._column_quantiles = None
+        return samples
 
     def info_to_json(self, filename):
 
@@ -351,37 +564,34 @@ class OptimizerSamples:
             json.dump(info, outfile)
 
     @property
-    def max_log_likelihood_sample(self) -> Sample:
+    def max_log_likelihood_index(self) -> int:
         """The index of the sample with the highest log likelihood."""
-        most_likely_sample = None
-        for sample in self.samples:
-            if most_likely_sample is None or sample.log_likelihood > most_likely_sample.log_likelihood:
-                most_likely_sample = sample
-        return most_likely_sample
+        return int(np.nanargmax(self.samples.log_likelihoods))
+
+    @property
+    def max_log_likelihood_sample(self) -> Sample:
+        """The sample with the highest log likelihood."""
+        return self.samples[self.max_log_likelihood_index]
 
     @property
     def max_log_likelihood_vector(self) -> [float]:
         """ The parameters of the maximum log likelihood sample of the `NonLinearSearch` returned as a list of values."""
-        return self.max_log_likelihood_sample.parameters_for_model(
-            self.model
-        )
+        return self.parameter_array[self.max_log_likelihood_index].tolist()
 
     @property
     def max_log_likelihood_instance(self) -> ModelInstance:
         """  The parameters of the maximum log likelihood sample of the `NonLinearSearch` returned as a model instance."""
-        return self.max_log_likelihood_sample.instance_for_model(
-            self.model
-        )
+        return self.model.instance_from_vector(vector=self.max_log_likelihood_vector)
 
     @property
     def max_log_posterior_index(self) -> int:
         """The index of the sample with the highest log posterior."""
-        return int(np.argmax(self.log_posteriors))
+        return int(np.argmax(self.samples.log_posteriors))
 
     @property
     def max_log_posterior_vector(self) -> [float]:
         """ The parameters of the maximum log posterior sample of the `NonLinearSearch` returned as a list of values."""
-        return self.parameters[self.max_log_posterior_index]
+        return self.parameter_array[self.max_log_posterior_index].tolist()
 
     @property
     def max_log_posterior_instance(self) -> ModelInstance:
@@ -412,7 +622,7 @@ class OptimizerSamples:
         sample_index : int
             The sample index of the weighted sample to return.
         """
-        return self.model.instance_from_vector(vector=self.parameters[sample_index])
+        return self.model.instance_from_vector(vector=self.parameter_array[sample_index].tolist())
 
 
 class PDFSamples(OptimizerSamples):
@@ -483,7 +693,7 @@ class PDFSamples(OptimizerSamples):
 
         This does not necessarily imply the `NonLinearSearch` has converged overall, only that errors and visualization
         can be performed numerically.."""
-        if np.max(self.weights) > 0.99:
+        if np.max(self.samples.weights) > 0.99:
             return False
         return True
 
@@ -492,10 +702,7 @@ class PDFSamples(OptimizerSamples):
         """ The median of the probability density function (PDF) of every parameter marginalized in 1D, returned
         as a list of values."""
         if self.pdf_converged:
-            return [
-                quantile(x=params, q=0.5, weights=self.weights)[0]
-                for params in self.parameters_extract
-            ]
+            return self._quantiles(q=0.5)[0].tolist()
         return self.max_log_likelihood_vector
 
     @property
@@ -527,29 +734,42 @@ class PDFSamples(OptimizerSamples):
         if self.pdf_converged:
             limit = math.erf(0.5 * sigma * math.sqrt(2))
 
-            lower_errors = [
-                quantile(x=params, q=1.0 - limit, weights=self.weights)[0]
-                for params in self.parameters_extract
-            ]
+            lower_errors, upper_errors = self._quantiles(q=[1.0 - limit, limit]).tolist()
 
-            upper_errors = [
-                quantile(x=params, q=limit, weights=self.weights)[0]
-                for params in self.parameters_extract
-            ]
+            return list(zip(lower_errors, upper_errors))
 
-            return [(lower, upper) for lower, upper in zip(lower_errors, upper_errors)]
+        return self._unconverged_vector_at_sigma()
 
-        parameters_min = list(
-            np.min(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
-        parameters_max = list(
-            np.max(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
+    @property
+    def column_quantiles(self) -> "ColumnQuantiles":
+        """
+        The weighted quantiles of every parameter, which sorts each parameter once so that any number of quantiles
+        (e.g. the median and the limits at every sigma of the model.results file) are computed without sorting the
+        samples again. It is recreated when the samples change.
+        """
+        if self._column_quantiles is None:
+            self._column_quantiles = ColumnQuantiles(
+                x=self.parameter_array, weights=self.samples.weights
+            )
+        return self._column_quantiles
 
-        return [
-            (parameters_min[index], parameters_max[index])
-            for index in range(len(parameters_min))
-        ]
+    def _quantiles(self, q) -> np.ndarray:
+        """
+        The weighted quantiles of every parameter marginalized in 1D, as an array of shape (len(q), prior_count).
+        """
+        return self.column_quantiles(q=q)
+
+    def _unconverged_vector_at_sigma(self) -> [(float, float)]:
+        """
+        A crude estimate of the range of every parameter for unconverged samples, given by the minimum and maximum
+        value of that parameter over the most recent samples.
+        """
+        parameters = self.parameter_array[-self.unconverged_sample_size:]
+
+        return list(zip(
+            np.min(parameters, axis=0).tolist(),
+            np.max(parameters, axis=0).tolist()
+        ))
 
     def vector_at_upper_sigma(self, sigma) -> [float]:
         """The upper value of every parameter marginalized in 1D at an input sigma value of its probability density
@@ -1004,10 +1224,7 @@ class MCMCSamples(PDFSamples):
 
         This is computed by binning all sampls after burn-in into a histogram and take its median (e.g. 50%) value. """
         if self.pdf_converged:
-            return [
-                float(np.percentile(self.samples_after_burn_in[:, i], [50]))
-                for i in range(self.model.prior_count)
-            ]
+            return np.percentile(self.samples_after_burn_in, 50, axis=0).tolist()
 
         return self.max_log_likelihood_vector
 
@@ -1032,26 +1249,13 @@ class MCMCSamples(PDFSamples):
         limit = math.erf(0.5 * sigma * math.sqrt(2))
 
         if self.pdf_converged:
-            samples = self.samples_after_burn_in
+            lower_errors, upper_errors = np.percentile(
+                self.samples_after_burn_in, [100.0 * (1.0 - limit), 100.0 * limit], axis=0
+            ).tolist()
 
-            return [
-                tuple(
-                    np.percentile(samples[:, i], [100.0 * (1.0 - limit), 100.0 * limit])
-                )
-                for i in range(self.model.prior_count)
-            ]
+            return list(zip(lower_errors, upper_errors))
 
-        parameters_min = list(
-            np.min(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
-        parameters_max = list(
-            np.max(self.parameters[-self.unconverged_sample_size:], axis=0)
-        )
-
-        return [
-            (parameters_min[index], parameters_max[index])
-            for index in range(len(parameters_min))
-        ]
+        return self._unconverged_vector_at_sigma()
 
 
 class NestSamples(PDFSamples):
@@ -1149,28 +1353,15 @@ class NestSamples(PDFSamples):
             to be kept.
         """
 
-        parameter_list = []
-        log_likelihoods = []
-        log_priors = []
-        weights = []
-
-        for sample in self.samples:
-
-            parameters = sample.parameters_for_model(model=self.model)
-
-            if (parameters[parameter_index] > parameter_range[0]) and (parameters[parameter_index] < parameter_range[1]):
-
-                parameter_list.append(parameters)
-                log_likelihoods.append(sample.log_likelihood)
-                log_priors.append(sample.log_prior)
-                weights.append(sample.weights)
+        values = self.parameter_array[:, parameter_index]
+        mask = (values > parameter_range[0]) & (values < parameter_range[1])
 
         samples = Sample.from_lists(
             model=self.model,
-            parameters=parameter_list,
-            log_likelihoods=log_likelihoods,
-            log_priors=log_priors,
-            weights=weights
+            parameters=self.parameter_array[mask],
+            log_likelihoods=self.samples.log_likelihoods[mask],
+            log_priors=self.samples.log_priors[mask],
+            weights=self.samples.weights[mask]
         )
 
         return NestSamples(
@@ -1229,3 +1420,78 @@ def quantile(x, q, weights=None):
         cdf /= cdf[-1]
         cdf = np.append(0, cdf)
         return np.interp(q, cdf, x[idx]).tolist()
+
+
+def column_quantiles(x, q, weights):
+    """
+    Compute weighted quantiles of every column of a 2D array at once, using the same
+    interpolation as `quantile`.
+
+    Parameters
+    ----------
+    x : array_like[nsamples, ncolumns]
+        The samples.
+    q : array_like[nquantiles,]
+        The list of quantiles to compute. These should all be in the range
+        ``[0, 1]``.
+    weights : array_like[nsamples,]
+        The weight corresponding to each sample.
+
+    Returns
+    -------
+    quantiles : ndarray[nquantiles, ncolumns]
+        The sample quantiles of each column computed at ``q``.
+    """
+    return ColumnQuantiles(x=x, weights=weights)(q=q)
+
+
+class ColumnQuantiles:
+    def __init__(self, x, weights):
+        """
+        Computes weighted quantiles of every column of a 2D array, using the same interpolation as `quantile`.
+
+        Each column is sorted and its cumulative weights computed once, so that further quantiles only require an
+        interpolation of the sorted columns.
+
+        Parameters
+        ----------
+        x : array_like[nsamples, ncolumns]
+            The samples.
+        weights : array_like[nsamples,]
+            The weight corresponding to each sample.
+        """
+        x = np.asarray(x)
+        weights = np.asarray(weights)
+
+        if len(x) != len(weights):
+            raise ValueError("Dimension mismatch: len(weights) != len(x)")
+
+        idx = np.argsort(x, axis=0)
+        self.sorted_x = np.take_along_axis(x, idx, axis=0)
+        cdf = np.cumsum(weights[idx], axis=0)[:-1]
+        cdf /= cdf[-1]
+        self.cdf = np.vstack((np.zeros((1, x.shape[1])), cdf))
+
+    def __call__(self, q) -> np.ndarray:
+        """
+        The quantiles q of every column.
+
+        Parameters
+        ----------
+        q : array_like[nquantiles,]
+            The list of quantiles to compute. These should all be in the range ``[0, 1]``.
+
+        Returns
+        -------
+        quantiles : ndarray[nquantiles, ncolumns]
+            The sample quantiles of each column computed at ``q``.
+        """
+        q = np.atleast_1d(q)
+
+        if np.any(q < 0.0) or np.any(q > 1.0):
+            raise ValueError("Quantiles must be between 0 and 1")
+
+        return np.array([
+            np.interp(q, self.cdf[:, i], self.sorted_x[:, i])
+            for i in range(self.sorted_x.shape[1])
+        ]).reshape(self.sorted_x.shape[1], len(q)).T
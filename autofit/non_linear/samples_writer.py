@@ -0,0 +1,152 @@
+import csv
+import json
+from os import path
+
+import h5py
+import numpy as np
+
+
+class SamplesWriter:
+
+    def __init__(self, hdf5_file: str, csv_file: str = None):
+        """Writes the samples of a `NonLinearSearch` to the binary samples file (and optionally samples.csv) on every
+        update, writing only the samples which have been added since the previous update.
+
+        The number of leading samples which are final and will not change is stored in the binary samples file as
+        a high-water mark. On the next update (including after a search is resumed) only samples from the high-water
+        mark onwards are written, so that a search whose sample history is append-only does not rewrite its full
+        history on every update.
+
+        Parameters
+        ----------
+        hdf5_file : str
+            The path of the binary samples file.
+        csv_file : str or None
+            The path of samples.csv, or None if the samples are not exported to csv.
+        """
+        self.hdf5_file = hdf5_file
+        self.csv_file = csv_file
+
+    @property
+    def high_water_mark(self) -> int:
+        """
+        The number of samples in the binary samples file which are final.
+        """
+        if not path.exists(self.hdf5_file):
+            return 0
+        with h5py.File(self.hdf5_file, "r") as f:
+            return int(f.attrs.get("high_water_mark", 0))
+
+    def write(self, samples, final_samples: int = 0, rewrite_weights: bool = False):
+        """
+        Write the samples from the high-water mark onwards and update the high-water mark.
+
+        Parameters
+        ----------
+        samples : OptimizerSamples
+            The samples of the search, of which the first high-water mark samples must be identical to those of the
+            previous update.
+        final_samples : int
+            The number of leading samples which will not change as the search continues. These are not written again
+            on the next update.
+        rewrite_weights : bool
+            If True the weights of every sample may change between updates, so that the weights are rewritten in
+            full.
+        """
+        total_samples = len(samples.samples)
+        final_samples = min(max(final_samples, 0), total_samples)
+
+        start = self._start(samples=samples)
+
+        if start is not None and final_samples < start:
+            start = None
+
+        if start is None:
+            samples.write_hdf5(filename=self.hdf5_file)
+        else:
+            with h5py.File(self.hdf5_file, "a") as f:
+                for name, values in (
+                        ("parameters", samples.parameter_array),
+                        ("log_likelihood", samples.samples.log_likelihoods),
+                        ("log_prior", samples.samples.log_priors),
+                        ("weights", samples.samples.weights),
+                ):
+                    f[name].resize(total_samples, axis=0)
+                    f[name][start:] = values[start:]
+
+                if rewrite_weights:
+                    f["weights"][:] = samples.samples.weights
+
+        csv_final_bytes = None
+
+        if self.csv_file is not None:
+            csv_final_bytes = self._write_csv(
+                samples=samples,
+                start=None if rewrite_weights else start,
+                final_samples=final_samples,
+            )
+
+        with h5py.File(self.hdf5_file, "a") as f:
+            f.attrs["high_water_mark"] = final_samples
+            if csv_final_bytes is None:
+                f.attrs.pop("csv_final_bytes", None)
+            else:
+                f.attrs["csv_final_bytes"] = csv_final_bytes
+
+    def _start(self, samples):
+        """
+        The index of the first sample which must be written, or None if the binary samples file must be rewritten in
+        full because it does not exist or does not correspond to these samples.
+        """
+        if not path.exists(self.hdf5_file):
+            return None
+
+        with h5py.File(self.hdf5_file, "r") as f:
+            if json.loads(f.attrs["names"]) != samples.parameter_names:
+                return None
+
+            start = int(f.attrs.get("high_water_mark", 0))
+
+            if start > len(samples.samples):
+                return None
+
+            if start > 0 and not (
+                    f["log_likelihood"][start - 1] == samples.samples.log_likelihoods[start - 1]
+                    and np.array_equal(f["parameters"][start - 1], samples.parameter_array[start - 1])
+            ):
+                return None
+
+        return start
+
+    def _write_csv(self, samples, start, final_samples) -> int:
+        """
+        Write the samples to samples.csv from the start index onwards, truncating any samples after the previous
+        high-water mark.
+
+        Returns
+        -------
+        The byte offset in samples.csv at which the samples after the final samples begin.
+        """
+        csv_final_bytes = None
+
+        if start is not None and path.exists(self.csv_file):
+            with h5py.File(self.hdf5_file, "r") as f:
+                csv_final_bytes = f.attrs.get("csv_final_bytes")
+
+        if csv_final_bytes is None:
+            with open(self.csv_file, "w+", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(samples._headers)
+                return self._write_rows(f, writer, samples, 0, final_samples)
+
+        with open(self.csv_file, "r+", newline="") as f:
+            f.seek(int(csv_final_bytes))
+            f.truncate()
+            return self._write_rows(f, csv.writer(f), samples, start, final_samples)
+
+    @staticmethod
+    def _write_rows(f, writer, samples, start, final_samples) -> int:
+        writer.writerows(samples._rows_between(start=start, stop=final_samples))
+        csv_final_bytes = f.tell()
+        writer.writerows(samples._rows_between(start=final_samples, stop=len(samples.samples)))
+        return csv_final_bytes
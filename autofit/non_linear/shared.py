@@ -0,0 +1,187 @@
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import contextmanager
+from os import path
+from types import FunctionType, MethodType, ModuleType
+
+import numpy as np
+
+from autofit.non_linear.log import logger
+
+# Arrays smaller than this are pickled as usual, as copying them costs less than creating a file.
+MIN_BYTES = 1 << 20
+
+
+def _attach(filename: str) -> "SharedArray":
+    """
+    Map an array written by *shared_arrays* into this process.
+    """
+    return SharedArray.from_file(filename)
+
+
+class SharedArray(np.ndarray):
+    """
+    An array stored in a file which is mapped into memory, so that every process using it shares the same
+    pages of memory.
+
+    When a shared array is pickled, e.g. to send an analysis to a worker process, only the name of its file is
+    pickled and the process unpickling it maps the file rather than copying the data. The array is mapped copy on
+    write, so a process which modifies it changes its own copy of the modified pages.
+
+    Arrays derived from a shared array (e.g. slices or the results of calculations) are pickled as usual.
+    """
+
+    @classmethod
+    def from_file(cls, filename: str) -> "SharedArray":
+        array = np.load(filename, mmap_mode="c").view(cls)
+        array._source = (filename, array.ctypes.data, array.shape, array.strides)
+        return array
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, directory: str) -> "SharedArray":
+        filename = path.join(directory, f"{uuid.uuid4().hex}.npy")
+        try:
+            np.save(filename, array, allow_pickle=False)
+        except OSError:
+            # e.g. the directory is full, in which case a partial file may have been written
+            if path.exists(filename):
+                os.remove(filename)
+            raise
+        return cls.from_file(filename)
+
+    def __array_finalize__(self, obj):
+        self._source = getattr(obj, "_source", None)
+
+    def __array_wrap__(self, obj, context=None):
+        array = obj.view(np.ndarray)
+        if array.ndim == 0:
+            return array[()]
+        return array
+
+    @property
+    def filename(self):
+        if self._source is None:
+            return None
+        filename, address, shape, strides = self._source
+        if (self.ctypes.data, self.shape, self.strides) != (address, shape, strides):
+            return None
+        return filename
+
+    def __reduce__(self):
+        filename = self.filename
+        if filename is None:
+            return np.array(self).__reduce__()
+        return _attach, (filename,)
+
+
+def _shared_directory() -> str:
+    """
+    Files are written to /dev/shm, which is held in memory, where available.
+    """
+    if os.access("/dev/shm", os.W_OK):
+        return tempfile.mkdtemp(prefix="autofit_", dir="/dev/shm")
+    return tempfile.mkdtemp(prefix="autofit_")
+
+
+def _is_shareable(value, min_bytes: int) -> bool:
+    return (
+            type(value) is np.ndarray
+            and value.nbytes >= min_bytes
+            and not value.dtype.hasobject
+    )
+
+
+def _children(obj):
+    """
+    The attributes, items or values of an object which may hold arrays, with a function which replaces each of them.
+    """
+    if isinstance(obj, dict):
+        return [(key, value, obj.__setitem__) for key, value in obj.items()]
+    if isinstance(obj, list):
+        return [(index, value, obj.__setitem__) for index, value in enumerate(obj)]
+    if isinstance(obj, (type, ModuleType, FunctionType, MethodType, np.ndarray)):
+        return []
+    try:
+        attributes = vars(obj)
+    except TypeError:
+        return []
+    return [
+        (name, value, lambda name, value: setattr(obj, name, value))
+        for name, value in attributes.items()
+    ]
+
+
+@contextmanager
+def shared_arrays(obj, min_bytes: int = MIN_BYTES, max_depth: int = 4):
+    """
+    Move the large numpy arrays of an object (e.g. the dataset of an `Analysis`, or a fitness function holding an
+    analysis) into shared memory for the duration of the context.
+
+    Arrays are found in the attributes of the object, and in the attributes, lists and dictionaries they contain, to
+    a depth of *max_depth*. Each array is written once to a memory mapped file and replaced by a `SharedArray`, so
+    that pickling the object inside the context (e.g. to send it to worker processes) sends the name of the file in
+    place of the data and every worker maps the same memory.
+
+    The original arrays are restored on exit and the files are removed. Workers which have already unpickled the
+    object keep their mapping of the memory.
+
+    If an array cannot be written to /dev/shm (e.g. in a Docker container, where it is 64MB by default) it is written
+    to the temporary directory instead, and if that fails too it is left to be pickled as usual.
+
+    Parameters
+    ----------
+    obj
+        The object holding the arrays
+    min_bytes
+        Arrays smaller than this are left as they are
+    max_depth
+        How many attributes deep to look for arrays
+    """
+    directories = [_shared_directory()]
+    replaced = []
+    visited = set()
+    # arrays referenced more than once are only written once
+    shared = dict()
+
+    def write(array):
+        """
+        Write an array to the last directory, falling back to the temporary directory once /dev/shm is full
+        """
+        while True:
+            try:
+                return SharedArray.from_array(array, directories[-1])
+            except OSError as e:
+                logger.debug(f"Could not write an array of {array.nbytes} bytes to {directories[-1]}: {e}")
+            if len(directories) > 1 or path.dirname(directories[0]) == tempfile.gettempdir():
+                return None
+            directories.append(tempfile.mkdtemp(prefix="autofit_"))
+
+    def share(parent, depth):
+        if depth > max_depth or id(parent) in visited:
+            return
+        visited.add(id(parent))
+
+        for key, value, set_value in _children(parent):
+            if _is_shareable(value, min_bytes):
+                if id(value) not in shared:
+                    shared[id(value)] = write(value)
+                if shared[id(value)] is not None:
+                    set_value(key, shared[id(value)])
+                    replaced.append((key, value, set_value))
+            else:
+                share(value, depth + 1)
+
+    try:
+        share(obj, 0)
+        written = [array for array in shared.values() if array is not None]
+        logger.debug(
+            f"Shared {len(written)} arrays ({sum(array.nbytes for array in written)} bytes)"
+        )
+        yield obj
+    finally:
+        for key, value, set_value in reversed(replaced):
+            set_value(key, value)
+        for directory in directories:
+            shutil.rmtree(directory, ignore_errors=True)
@@ -34,9 +34,11 @@ def results_to_file(samples, filename, during_analysis):
 
     formatter = frm.TextFormatter()
 
+    max_log_likelihood_vector = samples.max_log_likelihood_vector
+
     for i, prior_path in enumerate(samples.model.unique_prior_paths):
         formatter.add(
-            (prior_path, format_str().format(samples.max_log_likelihood_vector[i]))
+            (prior_path, format_str().format(max_log_likelihood_vector[i]))
         )
     results += [formatter.text + "\n"]
 
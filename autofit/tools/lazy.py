@@ -0,0 +1,52 @@
+import re
+from importlib import import_module
+
+
+class LazyImports:
+    def __init__(self, module_globals: dict):
+        """
+        Defers imports made by a package's __init__ until the imported name is first accessed, so that importing the
+        package does not import modules (and the libraries they depend on) which are not used.
+
+        The package assigns *getattr* and *dir* to its module level __getattr__ and __dir__.
+
+        Parameters
+        ----------
+        module_globals
+            The globals of the package's __init__, to which each name is added once it has been imported
+        """
+        self.globals = module_globals
+        self.imports = dict()
+
+    def add(self, import_lines: str):
+        """
+        Register names to be imported lazily, given as relative import statements of the form used in the package's
+        __init__, one per line:
+
+            from .module import Name
+            from .module import Name as Alias
+        """
+        for line in import_lines.strip().splitlines():
+            match = re.match(r"from (\S+) import (\S+)(?: as (\S+))?$", line.strip())
+            if match is None:
+                raise ValueError(f"Cannot lazily import '{line}'")
+            module_name, attribute_name, alias = match.groups()
+            self.imports[alias or attribute_name] = (module_name, attribute_name)
+
+    def getattr(self, name: str):
+        try:
+            module_name, attribute_name = self.imports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {self.globals['__name__']!r} has no attribute {name!r}"
+            )
+
+        value = getattr(
+            import_module(module_name, self.globals["__name__"]),
+            attribute_name
+        )
+        self.globals[name] = value
+        return value
+
+    def dir(self):
+        return sorted(set(self.globals) | set(self.imports))
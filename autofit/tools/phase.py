@@ -7,7 +7,6 @@ from typing import Dict
 from autoconf import conf
 from autofit.mapper.model_mapper import ModelMapper
 from autofit.mapper.prior.promise import PromiseResult
-from autofit.non_linear.grid import grid_search
 
 logger = logging.getLogger(__name__)
 
@@ -208,6 +207,8 @@ def as_grid_search(phase_class, parallel=False):
         ):
             super().__init__(search=search, **kwargs)
 
+            from autofit.non_linear.grid import grid_search
+
             self.search = grid_search.GridSearch(
                 paths=self.paths,
                 number_of_steps=number_of_steps,
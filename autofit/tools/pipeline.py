@@ -1,6 +1,7 @@
 import logging
 import copy
 from autofit import exc
+from autofit.non_linear.pool import shared_pools
 
 logger = logging.getLogger(__name__)
 
@@ -185,6 +186,8 @@ class Pipeline:
         """
         Run the function for each phase in the pipeline.
 
+        The phases share the same pool of worker processes for parallel searches.
+
         Parameters
         ----------
         func
@@ -200,13 +203,14 @@ class Pipeline:
         else:
             results = self.results
 
-        for i, phase in enumerate(self.phases):
-            logger.info(
-                "Running Phase {} (Number {})".format(
-                    phase.name,
-                    i
+        with shared_pools():
+            for i, phase in enumerate(self.phases):
+                logger.info(
+                    "Running Phase {} (Number {})".format(
+                        phase.name,
+                        i
+                    )
                 )
-            )
-            name = phase.name
-            results.add(name, func(phase, results))
+                name = phase.name
+                results.add(name, func(phase, results))
         return results
@@ -0,0 +1,79 @@
+"""
+Measure the time taken to store many fitted models in an SQLite database file, adding
+each model to the session as an ORM object compared with autofit.database.bulk_add.
+
+Run from the repository root:
+
+    python benchmarks/database_bulk.py
+"""
+import tempfile
+import time
+from os import path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import autofit as af
+from autoconf import conf
+from autofit import database as db
+from autofit.mock import mock
+
+directory = path.dirname(path.realpath(__file__))
+
+conf.instance.push(
+    new_path=path.join(directory, "..", "test_autofit", "unit", "config"),
+)
+
+N_MODELS = 1000
+
+
+def make_models():
+    return [
+        af.CollectionPriorModel(
+            gaussian=af.PriorModel(mock.Gaussian),
+            instance=mock.Gaussian(centre=float(i), intensity=1.0, sigma=2.0),
+        )
+        for i in range(N_MODELS)
+    ]
+
+
+def make_session(filename):
+    engine = create_engine(f"sqlite:///{filename}")
+    db.Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def add_all(session, models):
+    session.add_all(
+        db.Object.from_object(model)
+        for model in models
+    )
+    session.commit()
+
+
+def main():
+    models = make_models()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        timings = dict()
+        for name, function in [
+            ("add_all", add_all),
+            ("bulk_add", db.bulk_add),
+        ]:
+            session = make_session(path.join(temporary_directory, f"{name}.sqlite"))
+
+            start = time.perf_counter()
+            function(session, models)
+            timings[name] = time.perf_counter() - start
+
+            rows = session.query(db.Object).count()
+            assert session.query(db.Object).get(1)().instance.centre == 0.0
+            session.close()
+
+            print(f"{name:<10} {N_MODELS} models {rows} rows {timings[name]:7.3f} s")
+
+    print(f"\nspeedup {timings['add_all'] / timings['bulk_add']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measure the time taken to evaluate an expensive ModelFactor over a batch of samples,
+as an ImportanceSampler does, using each map strategy.
+
+Two likelihoods are compared: one dominated by numpy operations on a large dataset,
+which release the GIL, and one written as a python loop, which holds it.
+
+Run from the repository root:
+
+    python benchmarks/factor_map.py
+"""
+import os
+import time
+from os import path
+
+import numpy as np
+
+import autofit as af
+import autofit.graphical as g
+from autoconf import conf
+from autofit.mock import mock
+
+directory = path.dirname(path.realpath(__file__))
+
+conf.instance.push(
+    new_path=path.join(directory, "..", "test_autofit", "unit", "config"),
+)
+
+N_SAMPLES = 200
+N_DATA = 200000
+N_LOOP = 20000
+N_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class NumpyAnalysis(af.Analysis):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def log_likelihood_function(self, instance):
+        return -0.5 * np.sum(np.square(instance(self.x) - self.y))
+
+
+class PythonAnalysis(af.Analysis):
+    def log_likelihood_function(self, instance):
+        total = 0.0
+        for i in range(N_LOOP):
+            total += (instance.centre - i * instance.sigma) % 1.0
+        return -total
+
+
+def make_factor(analysis):
+    model = af.PriorModel(
+        mock.Gaussian,
+        centre=af.UniformPrior(0.0, 100.0),
+        intensity=af.UniformPrior(0.0, 10.0),
+        sigma=af.UniformPrior(1.0, 10.0),
+    )
+    return g.ModelFactor(model, analysis=analysis)
+
+
+def make_samples(factor):
+    random = np.random.RandomState(1)
+    return {
+        variable: random.uniform(1.0, 10.0, size=N_SAMPLES)
+        for variable in factor.variables
+    }
+
+
+def main():
+    x = np.linspace(0.0, 100.0, N_DATA)
+    y = mock.Gaussian(centre=50.0, intensity=5.0, sigma=5.0)(x)
+
+    print(f"{N_SAMPLES} samples, {N_WORKERS} workers\n")
+
+    for name, analysis in [
+        ("numpy", NumpyAnalysis(x, y)),
+        ("python", PythonAnalysis()),
+    ]:
+        factor = make_factor(analysis)
+        samples = make_samples(factor)
+        expected = None
+
+        for strategy_name, map_strategy in [
+            ("serial", g.SerialMap()),
+            ("thread", g.ThreadMap(N_WORKERS)),
+            ("thread chunked", g.ThreadMap(N_WORKERS, chunksize=N_SAMPLES // N_WORKERS)),
+            ("process", g.ProcessMap(N_WORKERS)),
+            ("process chunked", g.ProcessMap(N_WORKERS, chunksize=N_SAMPLES // N_WORKERS)),
+        ]:
+            with map_strategy:
+                factor.map_strategy = map_strategy
+                # the first call starts any workers and sends them the factor
+                factor(samples)
+
+                start = time.perf_counter()
+                value = factor(samples).log_value
+                elapsed = time.perf_counter() - start
+
+            if expected is None:
+                expected = value
+            assert np.allclose(value, expected)
+
+            print(f"{name:<7} {strategy_name:<16} {elapsed:7.3f} s")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Measure the time taken to import autofit, as reported by python -X importtime.
+
+The samplers (emcee, dynesty, pyswarms), h5py, dill and scipy.stats are only
+imported when they are first used, so importing autofit must not import them.
+The script exits with an error if it does.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py
+"""
+import statistics
+import subprocess
+import sys
+from os import path
+
+directory = path.dirname(path.realpath(__file__))
+
+REPEATS = 5
+
+DEFERRED_MODULES = (
+    "emcee",
+    "dynesty",
+    "pyswarms",
+    "h5py",
+    "dill",
+    "scipy.stats",
+    "autofit.aggregator",
+    "autofit.non_linear.grid.grid_search",
+)
+
+
+def import_times():
+    """
+    Import autofit in a new interpreter and return the cumulative import time of every module in microseconds.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import autofit"],
+        stderr=subprocess.PIPE,
+        cwd=path.join(directory, ".."),
+        check=True,
+    ).stderr.decode()
+
+    times = dict()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    runs = [import_times() for _ in range(REPEATS)]
+    totals = [times["autofit"] / 1e6 for times in runs]
+
+    print(f"import autofit: median {statistics.median(totals):.3f} s over {REPEATS} runs\n")
+
+    slowest = sorted(
+        (
+            (time, name)
+            for name, time in runs[-1].items()
+            if name.count(".") == 0 and name != "autofit"
+        ),
+        reverse=True
+    )[:10]
+
+    print("slowest top-level imports:")
+    for time, name in slowest:
+        print(f"    {time / 1e6:7.3f} s  {name}")
+
+    imported = [name for name in DEFERRED_MODULES if name in runs[-1]]
+    if imported:
+        sys.exit(f"\nimport autofit imported deferred modules: {', '.join(imported)}")
+
+
+if __name__ == "__main__":
+    main()
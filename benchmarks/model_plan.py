@@ -0,0 +1,67 @@
+"""
+Measure the per-call overhead of constructing instances from a 40 parameter model.
+
+The compiled model plan is compared against rebuilding the plan on every call,
+which reproduces the cost of traversing the model tree each time as was done
+before plans were cached.
+
+Run from the repository root:
+
+    python benchmarks/model_plan.py
+"""
+import timeit
+from os import path
+
+import autofit as af
+from autoconf import conf
+from autofit.mapper.prior_model.plan import invalidate
+from autofit.mock import mock
+
+directory = path.dirname(path.realpath(__file__))
+
+conf.instance.push(
+    new_path=path.join(directory, "..", "test_autofit", "unit", "config"),
+)
+
+NUMBER = 1000
+
+
+def make_model():
+    return af.Collection(
+        profiles=[
+            af.PriorModel(mock.Gaussian)
+            for _ in range(13)
+        ],
+        extra=mock.MockClassx2Tuple,
+    )
+
+
+def main():
+    model = make_model()
+    vector = model.physical_values_from_prior_medians
+    unit_vector = [0.5] * model.prior_count
+
+    print(f"Model with {model.prior_count} parameters, {NUMBER} calls each\n")
+
+    for name, func in [
+        ("instance_from_vector", lambda: model.instance_from_vector(vector)),
+        ("vector_from_unit_vector", lambda: model.vector_from_unit_vector(unit_vector)),
+        ("log_priors_from_vector", lambda: model.log_priors_from_vector(vector)),
+    ]:
+        def uncached():
+            invalidate()
+            func()
+
+        cached_time = timeit.timeit(func, number=NUMBER) / NUMBER
+        uncached_time = timeit.timeit(uncached, number=NUMBER) / NUMBER
+
+        print(
+            f"{name:<25} "
+            f"uncached {1e6 * uncached_time:9.1f} us  "
+            f"cached {1e6 * cached_time:9.1f} us  "
+            f"speedup {uncached_time / cached_time:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
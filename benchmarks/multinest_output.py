@@ -0,0 +1,69 @@
+"""
+Measure the time taken to load the samples of a large MultiNest search from its multinest.txt
+file, reading each fixed width field in Python compared with loading the file as one array.
+
+Run from the repository root:
+
+    python benchmarks/multinest_output.py
+"""
+import tempfile
+import time
+from os import path
+
+import numpy as np
+
+from autofit.non_linear.nest import multi_nest as mn
+
+TOTAL_SAMPLES = 100000
+PRIOR_COUNT = 11
+
+
+def write_weighted_samples(filename):
+    random = np.random.RandomState(1)
+    weighted_samples = random.uniform(size=(TOTAL_SAMPLES, PRIOR_COUNT + 2))
+    np.savetxt(filename, weighted_samples, fmt="%28.18E", delimiter="")
+    return weighted_samples
+
+
+def read_fields(filename):
+    """
+    Read every field with read(28), as each quantity was previously read from the file
+    """
+    with open(filename) as weighted_samples:
+        total_samples = sum(1 for _ in weighted_samples)
+        weighted_samples.seek(0)
+        rows = []
+        for _ in range(total_samples):
+            rows.append([
+                float(weighted_samples.read(28))
+                for _ in range(PRIOR_COUNT + 2)
+            ])
+            weighted_samples.readline()
+    return np.array(rows)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{TOTAL_SAMPLES} samples of {PRIOR_COUNT} parameters\n")
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        filename = path.join(temporary_directory, "multinest.txt")
+        expected = write_weighted_samples(filename)
+
+        for name, load in [
+            ("read(28)", lambda: read_fields(filename)),
+            ("array", lambda: mn.weighted_samples_from_file(filename)),
+            ("cached", lambda: mn.weighted_samples_from_file(filename)),
+        ]:
+            load_time, weighted_samples = timed(load)
+            assert np.allclose(weighted_samples, expected)
+            print(f"{name:<9} load {load_time:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
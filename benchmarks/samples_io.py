@@ -0,0 +1,90 @@
+"""
+Measure the time taken to write and reload the samples of a large search.
+
+The binary HDF5 samples file is compared against samples.csv for an 11 parameter
+model with 200000 samples, and the round trip is checked to be lossless.
+
+Run from the repository root:
+
+    python benchmarks/samples_io.py
+"""
+import tempfile
+import time
+from os import path
+
+import numpy as np
+
+import autofit as af
+from autoconf import conf
+from autofit.mock import mock
+from autofit.non_linear import samples as samps
+
+directory = path.dirname(path.realpath(__file__))
+
+conf.instance.push(
+    new_path=path.join(directory, "..", "test_autofit", "unit", "config"),
+)
+
+TOTAL_SAMPLES = 200000
+
+
+def make_samples():
+    model = af.Collection(
+        profiles=[
+            af.PriorModel(mock.Gaussian)
+            for _ in range(3)
+        ],
+        extra=mock.MockClassx2Tuple,
+    )
+    random = np.random.RandomState(1)
+
+    return af.NestSamples(
+        model=model,
+        samples=samps.Sample.from_lists(
+            model=model,
+            parameters=random.uniform(size=(TOTAL_SAMPLES, model.prior_count)),
+            log_likelihoods=random.normal(size=TOTAL_SAMPLES),
+            log_priors=random.normal(size=TOTAL_SAMPLES),
+            weights=random.uniform(size=TOTAL_SAMPLES),
+        ),
+        number_live_points=50,
+        log_evidence=0.0,
+        total_samples=TOTAL_SAMPLES,
+    )
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    samples = make_samples()
+
+    print(f"{TOTAL_SAMPLES} samples of {samples.model.prior_count} parameters\n")
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        csv_file = path.join(temporary_directory, "samples.csv")
+        hdf5_file = path.join(temporary_directory, "samples.h5")
+
+        for name, write, load, filename in [
+            ("csv", samples.write_table, samps.load_from_table, csv_file),
+            ("hdf5", samples.write_hdf5, samps.load_from_hdf5, hdf5_file),
+        ]:
+            write_time, _ = timed(lambda: write(filename=filename))
+            load_time, sample_list = timed(lambda: load(filename=filename))
+
+            assert np.array_equal(sample_list.parameters, samples.parameter_array)
+            assert np.array_equal(sample_list.log_likelihoods, samples.samples.log_likelihoods)
+
+            print(
+                f"{name:<5} "
+                f"write {write_time:7.3f} s  "
+                f"load {load_time:7.3f} s  "
+                f"size {path.getsize(filename) / 1e6:7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
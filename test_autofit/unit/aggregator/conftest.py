@@ -1,4 +1,5 @@
 import os
+import shutil
 from os import path
 
 import pytest
@@ -15,10 +16,16 @@ def make_path_aggregator(aggregator_directory):
 
 
 @pytest.fixture(name="aggregator_directory")
-def make_aggregator_directory():
+def make_aggregator_directory(tmp_path):
     directory = path.dirname(path.realpath(__file__))
 
-    return path.join(f"{directory}", "..", "tools", "files", "aggregator")
+    # copied so that the index written by the aggregator is not left in the repository
+    aggregator_directory = str(tmp_path / "aggregator")
+    shutil.copytree(
+        path.join(f"{directory}", "..", "tools", "files", "aggregator"),
+        aggregator_directory
+    )
+    return aggregator_directory
 
 
 @pytest.fixture(name="aggregator")
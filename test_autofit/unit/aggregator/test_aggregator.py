@@ -1,8 +1,11 @@
+import pickle
 from os import path
 import pytest
 
 import autofit as af
-from autofit.mock.mock import MockPhaseOutput
+from autofit.mock.mock import MockClassx2, MockPhaseOutput
+from autofit.non_linear.profiling import Profiler
+from autofit.non_linear.samples import Sample
 
 
 def test_completed_aggregator(aggregator_directory):
@@ -25,6 +28,46 @@ class TestLoading:
         assert list(path_aggregator.values("nonsense"))[0] is None
 
 
+def test_samples_from_hdf5(tmp_path):
+    model = af.ModelMapper(mock_class=MockClassx2)
+    samples = af.OptimizerSamples(
+        model=model,
+        samples=Sample.from_lists(
+            model=model,
+            parameters=[[1.0, 2.0], [3.0, 4.0]],
+            log_likelihoods=[1.0, 2.0],
+            log_priors=[0.0, 0.0],
+            weights=[1.0, 1.0],
+        )
+    )
+
+    (tmp_path / "metadata").write_text("phase=phase")
+    (tmp_path / "samples").mkdir()
+    (tmp_path / "pickles").mkdir()
+    samples.write_hdf5(filename=str(tmp_path / "samples" / "samples.h5"))
+    with open(tmp_path / "pickles" / "samples.pickle", "w+b") as f:
+        pickle.dump(samples.without_sample_list(), f)
+
+    loaded = af.PhaseOutput(str(tmp_path)).samples
+
+    assert loaded.parameters == [[1.0, 2.0], [3.0, 4.0]]
+    assert loaded.max_log_likelihood_vector == [3.0, 4.0]
+
+
+def test_profiling(tmp_path):
+    (tmp_path / "metadata").write_text("phase=phase")
+
+    phase_output = af.PhaseOutput(str(tmp_path))
+    assert phase_output.profiling is None
+
+    profiler = Profiler()
+    profiler.add("log_likelihood", 0.5, count=2)
+    profiler.output_to_json(filename=str(tmp_path / "profiling.json"))
+
+    assert phase_output.profiling["log_likelihood_calls"] == 2
+    assert phase_output.profiling["timings"]["log_likelihood"]["mean"] == 0.25
+
+
 @pytest.fixture(name="aggregator_2")
 def make_aggregator_2():
     aggregator = af.Aggregator("")
@@ -0,0 +1,140 @@
+import os
+import pickle
+
+import pytest
+
+import autofit as af
+from autofit.aggregator.cache import PickleCache
+from autofit.mock.mock import MockClassx2
+from autofit.non_linear.samples import Sample
+
+
+@pytest.fixture(name="cache", autouse=True)
+def make_cache(monkeypatch):
+    cache = PickleCache()
+    monkeypatch.setattr(af.PhaseOutput, "cache", cache)
+    return cache
+
+
+def write_pickle(directory, name, obj):
+    with open(directory / "pickles" / f"{name}.pickle", "w+b") as f:
+        pickle.dump(obj, f)
+
+
+@pytest.fixture(name="phase_directory")
+def make_phase_directory(tmp_path):
+    (tmp_path / "pickles").mkdir()
+    (tmp_path / "metadata").write_text("phase=phase")
+    write_pickle(tmp_path, "dataset", {"name": "dataset"})
+    write_pickle(tmp_path, "model", {"name": "model"})
+    return tmp_path
+
+
+def test_hits_and_misses(phase_directory, cache):
+    phase = af.PhaseOutput(str(phase_directory))
+
+    dataset = phase.dataset
+    assert dataset == {"name": "dataset"}
+    assert af.PhaseOutput(str(phase_directory)).dataset is dataset
+    assert phase.model is phase.model
+    assert phase.nonsense is None
+
+    assert cache.stats["hits"] == 2
+    assert cache.stats["misses"] == 2
+    assert len(cache) == 2
+
+
+def test_modified(phase_directory, cache):
+    phase = af.PhaseOutput(str(phase_directory))
+    assert phase.dataset == {"name": "dataset"}
+
+    write_pickle(phase_directory, "dataset", {"name": "modified"})
+    os.utime(phase_directory / "pickles" / "dataset.pickle", (0, 0))
+
+    assert phase.dataset == {"name": "modified"}
+    assert cache.misses == 2
+
+
+def test_evicted(phase_directory, cache):
+    phase = af.PhaseOutput(str(phase_directory))
+    phase.dataset
+    phase.model
+
+    cache.max_bytes = cache.size - 1
+
+    assert len(cache) == 1
+    assert cache.evictions == 1
+
+    phase.model
+    assert cache.hits == 1
+
+    phase.dataset
+    assert cache.misses == 3
+    assert len(cache) == 1
+
+
+def test_too_large(phase_directory, cache):
+    cache.max_bytes = 1
+
+    phase = af.PhaseOutput(str(phase_directory))
+    assert phase.dataset == {"name": "dataset"}
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_grow(phase_directory, cache):
+    phase = af.PhaseOutput(str(phase_directory))
+    phase.dataset
+    phase.model
+
+    key = phase._cache_key("pickles/model.pickle")
+    size = cache.size
+    cache.grow(key, 100)
+    assert cache.size == size + 100
+
+    # the least recently used dataset is evicted to make room for the model
+    cache.max_bytes = size + 99
+    assert len(cache) == 1
+    assert phase.model is not None
+    assert cache.hits == 1
+
+    # a model which grows larger than the cache is removed
+    cache.grow(key, cache.max_bytes)
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_samples_columns_counted(tmp_path, cache):
+    model = af.ModelMapper(mock_class=MockClassx2)
+    samples = af.OptimizerSamples(
+        model=model,
+        samples=Sample.from_lists(
+            model=model,
+            parameters=[[1.0, 2.0], [3.0, 4.0]],
+            log_likelihoods=[1.0, 2.0],
+            log_priors=[0.0, 0.0],
+            weights=[1.0, 1.0],
+        )
+    )
+
+    (tmp_path / "metadata").write_text("phase=phase")
+    (tmp_path / "samples").mkdir()
+    (tmp_path / "pickles").mkdir()
+    samples.write_hdf5(filename=str(tmp_path / "samples" / "samples.h5"))
+    write_pickle(tmp_path, "samples", samples.without_sample_list())
+
+    phase = af.PhaseOutput(str(tmp_path))
+    pickle_size = os.path.getsize(tmp_path / "pickles" / "samples.pickle")
+
+    loaded = phase.samples
+
+    assert cache.size == pickle_size + loaded.samples.nbytes
+    assert phase.samples is loaded
+    assert cache.size == pickle_size + loaded.samples.nbytes
+
+
+def test_zip(path_aggregator, cache):
+    assert list(path_aggregator.values("model")) == list(path_aggregator.values("model"))
+
+    assert cache.misses == 2
+    assert cache.hits == 2
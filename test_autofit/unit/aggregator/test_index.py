@@ -0,0 +1,89 @@
+import os
+import pickle
+import zipfile
+from os import path
+
+import pytest
+
+import autofit as af
+from autofit.aggregator import index as i
+
+
+def test_index_written(aggregator_directory):
+    aggregator = af.Aggregator(aggregator_directory)
+
+    assert path.exists(path.join(aggregator_directory, i.INDEX_FILENAME))
+    assert not path.exists(path.join(aggregator_directory, "phase"))
+    assert {phase.zip_path for phase in aggregator.phases} == {
+        path.join(aggregator_directory, "phase.zip"),
+        path.join(aggregator_directory, "phase_completed.zip"),
+    }
+
+
+def test_read_from_zip(aggregator_directory):
+    aggregator = af.Aggregator(aggregator_directory, completed_only=True)
+    phase = aggregator[0]
+
+    assert phase.directory == path.join(aggregator_directory, "phase_completed", "phase_completed")
+    assert phase.model_results == "model.results\n"
+    assert phase.dataset_name == "dataset"
+    assert phase.model["name"] == "model"
+    assert phase.nonsense is None
+
+
+def test_index_reused(aggregator_directory, monkeypatch):
+    aggregator = af.Aggregator(aggregator_directory)
+
+    def read_zip(zip_path):
+        raise AssertionError(f"{zip_path} read")
+
+    monkeypatch.setattr(i, "_zip_phases", read_zip)
+
+    assert [
+               phase.text for phase in af.Aggregator(aggregator_directory).phases
+           ] == [
+               phase.text for phase in aggregator.phases
+           ]
+
+
+def test_index_refreshed(aggregator_directory):
+    af.Aggregator(aggregator_directory)
+
+    zip_path = path.join(aggregator_directory, "phase.zip")
+    with zipfile.ZipFile(zip_path, "a") as f:
+        f.writestr("phase/.completed", "")
+
+    assert len(af.Aggregator(aggregator_directory, completed_only=True)) == 2
+
+    os.remove(zip_path)
+
+    assert len(af.Aggregator(aggregator_directory)) == 1
+
+
+def test_directory(tmp_path):
+    phase_directory = tmp_path / "output" / "phase"
+    (phase_directory / "pickles").mkdir(parents=True)
+    (phase_directory / "metadata").write_text("phase=phase\npipeline=pipeline")
+    with open(phase_directory / "pickles" / "model.pickle", "w+b") as f:
+        pickle.dump("model", f)
+
+    aggregator = af.Aggregator(str(tmp_path))
+
+    assert len(aggregator) == 1
+    assert aggregator[0].zip_path is None
+    assert aggregator[0].pipeline == "pipeline"
+    assert aggregator[0].model == "model"
+
+    (phase_directory / "metadata").write_text("phase=phase\npipeline=other")
+    os.utime(phase_directory / "metadata", (0, 0))
+
+    assert list(af.Aggregator(str(tmp_path)).filter(
+        aggregator.pipeline == "other"
+    ).values("phase")) == ["phase"]
+
+
+def test_missing_file(tmp_path):
+    (tmp_path / "metadata").write_text("phase=phase")
+
+    with pytest.raises(FileNotFoundError):
+        af.PhaseOutput(str(tmp_path)).read("model.results")
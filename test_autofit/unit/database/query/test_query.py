@@ -83,3 +83,55 @@ def test_query(
     )
 
     assert result == [gaussian_2]
+
+
+def test_deep_query(
+        session,
+        aggregator
+):
+    ids = db.bulk_add(
+        session,
+        [
+            af.Collection(
+                lens=af.Collection(
+                    gaussian=m.Gaussian(
+                        centre=centre
+                    )
+                )
+            )
+            for centre in (1, 2)
+        ]
+    )
+
+    result, = aggregator.filter(
+        aggregator.lens.gaussian.centre > 1.5
+    )
+    assert result.id == ids[1]
+
+    result = aggregator.filter(
+        (aggregator.lens.gaussian.centre < 1.5) | (aggregator.lens.gaussian.intensity > 0.05)
+    )
+    assert {obj.id for obj in result} == set(ids)
+
+    result, = aggregator.filter(
+        (aggregator.lens.gaussian.centre < 1.5) & (aggregator.lens.gaussian == m.Gaussian)
+    )
+    assert result.id == ids[0]
+
+
+def test_indexes(session):
+    from sqlalchemy import inspect
+
+    inspector = inspect(session.bind)
+
+    assert {
+               tuple(index["column_names"])
+               for index in inspector.get_indexes("object")
+           } >= {
+               ("name", "parent_id"),
+               ("parent_id",),
+               ("class_path",),
+           }
+    assert [
+               index["column_names"] for index in inspector.get_indexes("value")
+           ] == [["value"]]
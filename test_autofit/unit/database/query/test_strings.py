@@ -8,9 +8,9 @@ class TestString:
         )
 
         assert query.query == (
-            "SELECT parent_id "
-            "FROM object AS o "
-            "WHERE o.name = 'a'"
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "WHERE o0.name = 'a'"
         )
 
     def test_with_string(self):
@@ -23,12 +23,12 @@ class TestString:
         )
 
         assert query.query == (
-            "SELECT parent_id "
-            "FROM object AS o "
-            "JOIN string_value AS sv "
-            "ON o.id = sv.id "
-            "WHERE o.name = 'a' "
-            "AND sv.value = 'value'"
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "JOIN string_value AS sv0 "
+            "ON sv0.id = o0.id "
+            "WHERE o0.name = 'a' "
+            "AND sv0.value = 'value'"
         )
 
     def test_with_value(self):
@@ -41,12 +41,12 @@ class TestString:
         )
 
         assert query.query == (
-            "SELECT parent_id "
-            "FROM object AS o "
-            "JOIN value AS v "
-            "ON o.id = v.id "
-            "WHERE o.name = 'a' "
-            "AND v.value = 1"
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "JOIN value AS v0 "
+            "ON v0.id = o0.id "
+            "WHERE o0.name = 'a' "
+            "AND v0.value = 1"
         )
 
     def test_simple_and(
@@ -54,13 +54,13 @@ class TestString:
             simple_and
     ):
         assert simple_and.query == (
-            "SELECT parent_id "
-            "FROM object AS o "
-            "JOIN value AS v "
-            "ON o.id = v.id "
-            "WHERE o.name = 'a' "
-            "AND v.value < 1 "
-            "AND v.value > 0"
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "JOIN value AS v0 "
+            "ON v0.id = o0.id "
+            "WHERE o0.name = 'a' "
+            "AND v0.value < 1 "
+            "AND v0.value > 0"
         )
 
     def test_simple_or(
@@ -68,13 +68,13 @@ class TestString:
             simple_or
     ):
         assert simple_or.query == (
-            "SELECT parent_id "
-            "FROM object AS o "
-            "JOIN value AS v "
-            "ON o.id = v.id "
-            "WHERE o.name = 'a' "
-            "AND v.value < 1 "
-            "OR v.value > 0"
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "LEFT JOIN value AS v0 "
+            "ON v0.id = o0.id "
+            "WHERE o0.name = 'a' "
+            "AND (v0.value < 1 "
+            "OR v0.value > 0)"
         )
 
     def test_second_level(
@@ -82,18 +82,99 @@ class TestString:
             second_level
     ):
         assert second_level.query == (
-            "SELECT parent_id "
-            "FROM object AS o "
-            "JOIN value AS v "
-            "ON o.id = v.id "
-            "WHERE o.id IN ("
-            "SELECT parent_id "
-            "FROM object AS o "
-            "JOIN value AS v "
-            "ON o.id = v.id "
-            "WHERE o.name = 'b' "
-            "AND v.value > 0"
-            ") "
-            "AND o.name = 'a' "
-            "AND v.value < 1"
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "JOIN object AS o1 "
+            "ON o1.parent_id = o0.id "
+            "JOIN value AS v1 "
+            "ON v1.id = o1.id "
+            "JOIN value AS v0 "
+            "ON v0.id = o0.id "
+            "WHERE o0.name = 'a' "
+            "AND o1.name = 'b' "
+            "AND v1.value > 0 "
+            "AND v0.value < 1"
+        )
+
+    def test_third_level(self):
+        query = q.Q(
+            "a",
+            q.Q(
+                "b",
+                q.Q(
+                    "c",
+                    q.V(
+                        ">",
+                        1
+                    )
+                )
+            )
+        )
+
+        assert query.query == (
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "JOIN object AS o1 "
+            "ON o1.parent_id = o0.id "
+            "JOIN object AS o2 "
+            "ON o2.parent_id = o1.id "
+            "JOIN value AS v2 "
+            "ON v2.id = o2.id "
+            "WHERE o0.name = 'a' "
+            "AND o1.name = 'b' "
+            "AND o2.name = 'c' "
+            "AND v2.value > 1"
+        )
+
+    def test_or_children(
+            self,
+            less_than,
+            greater_than
+    ):
+        query = q.Q(
+            "a",
+            q.Or(
+                q.Q(
+                    "b",
+                    less_than
+                ),
+                q.Q(
+                    "c",
+                    greater_than
+                )
+            )
+        )
+
+        assert query.query == (
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "WHERE o0.name = 'a' "
+            "AND (o0.id IN ("
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "JOIN value AS v0 "
+            "ON v0.id = o0.id "
+            "WHERE o0.name = 'b' "
+            "AND v0.value < 1"
+            ") OR o0.id IN ("
+            "SELECT o0.parent_id "
+            "FROM object AS o0 "
+            "JOIN value AS v0 "
+            "ON v0.id = o0.id "
+            "WHERE o0.name = 'c' "
+            "AND v0.value > 0"
+            "))"
+        )
+
+    def test_quoted(self):
+        query = q.Q(
+            "a",
+            q.SV(
+                "=",
+                "it's"
+            )
+        )
+
+        assert query.query.endswith(
+            "AND sv0.value = 'it''s'"
         )
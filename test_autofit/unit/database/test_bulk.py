@@ -0,0 +1,88 @@
+import pytest
+
+import autofit as af
+from autofit import database as db
+from autofit.mock import mock as m
+
+
+@pytest.fixture(
+    name="models"
+)
+def make_models():
+    return [
+        af.CollectionPriorModel(
+            gaussian=af.PriorModel(
+                m.Gaussian
+            ),
+            centre=float(i),
+        )
+        for i in range(3)
+    ]
+
+
+def count(obj):
+    return 1 + sum(map(count, obj.children))
+
+
+def test_ids(session, models):
+    n = count(db.Object.from_object(models[0]))
+
+    ids = db.bulk_add(
+        session,
+        models
+    )
+    assert ids == [1, 1 + n, 1 + 2 * n]
+    assert session.query(db.Object).count() == 3 * n
+
+    assert db.bulk_add(
+        session,
+        [m.Gaussian()]
+    ) == [1 + 3 * n]
+
+
+def test_deserialize(session, models):
+    ids = db.bulk_add(
+        session,
+        models,
+        names=["one", "two", "three"]
+    )
+
+    obj = session.query(db.Object).get(ids[1])
+    assert isinstance(obj, db.CollectionPriorModel)
+    assert obj.name == "two"
+    assert obj.parent is None
+
+    model = obj()
+    assert model.centre == 1.0
+    assert model.gaussian.cls is m.Gaussian
+    assert isinstance(model.gaussian.centre, af.UniformPrior)
+
+
+def test_matches_add(session, models):
+    serialized = db.Object.from_object(models[0])
+    session.add(serialized)
+    session.commit()
+
+    id_, = db.bulk_add(
+        session,
+        models[:1]
+    )
+
+    def rows(obj):
+        return [
+            (type(obj), obj.name, obj.class_path, getattr(obj, "value", None)),
+            *[row for child in obj.children for row in rows(child)]
+        ]
+
+    assert rows(session.query(db.Object).get(id_)) == rows(serialized)
+
+
+def test_query(session, models):
+    db.bulk_add(
+        session,
+        [m.Gaussian(centre=0.5), m.Gaussian(centre=2.0)]
+    )
+    aggregator = db.Aggregator(session)
+
+    result, = aggregator.filter(aggregator.centre < 1)
+    assert result().centre == 0.5
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import autofit as af
+from autofit import database as db
+from autofit import exc
+from autofit.database import query_model as q
+from autofit.mock import mock as m
+
+
+@pytest.fixture(name="engine")
+def make_engine(tmp_path):
+    """
+    A database containing a model, written without the path and root_id columns and
+    their indexes as by an earlier version
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'database.sqlite'}")
+    db.Base.metadata.create_all(engine)
+
+    session = sessionmaker(bind=engine)()
+    session.add(
+        db.Object.from_object(
+            af.Collection(
+                lens=af.Collection(
+                    gaussian=m.Gaussian(centre=2.0)
+                )
+            )
+        )
+    )
+    session.commit()
+    session.close()
+
+    with engine.begin() as connection:
+        for index in db.Object.__table__.indexes:
+            connection.execute(text(f"DROP INDEX {index.name}"))
+        connection.execute(text(
+            "CREATE TABLE object_old AS "
+            "SELECT type, id, parent_id, name, class_path FROM object"
+        ))
+        connection.execute(text("DROP TABLE object"))
+        connection.execute(text("ALTER TABLE object_old RENAME TO object"))
+
+    yield engine
+    engine.dispose()
+
+
+def test_outdated(engine):
+    assert not db.is_current(engine)
+
+    with pytest.raises(exc.AggregatorException):
+        db.Aggregator(sessionmaker(bind=engine)())
+
+
+def test_migrate(engine):
+    db.migrate(engine)
+
+    assert db.is_current(engine)
+
+    session = sessionmaker(bind=engine)()
+    root = session.query(db.Object).filter(
+        db.Object.parent_id.is_(None)
+    ).one()
+    assert root.path == ""
+    assert root.root_id is None
+
+    result, = db.Aggregator(session).filter(
+        q.P("lens.gaussian.centre") > 1.5
+    )
+    assert result.id == root.id
+    assert result().lens.gaussian.centre == 2.0
+    session.close()
+
+    db.migrate(engine)
+    assert db.is_current(engine)
@@ -0,0 +1,155 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+import autofit as af
+from autofit import database as db
+from autofit.database import query_model as q
+from autofit.mock import mock as m
+
+
+@pytest.fixture(
+    name="model"
+)
+def make_model():
+    return af.Collection(
+        lens=af.Collection(
+            gaussian=m.Gaussian(
+                centre=1.0
+            )
+        )
+    )
+
+
+def paths(obj):
+    return [
+        (obj.path, obj.root_id),
+        *[path for child in obj.children for path in paths(child)]
+    ]
+
+
+@pytest.fixture(
+    name="expected"
+)
+def make_expected():
+    return [
+        ("", None),
+        ("lens", 1),
+        ("lens.gaussian", 1),
+        ("lens.gaussian.centre", 1),
+        ("lens.gaussian.intensity", 1),
+        ("lens.gaussian.sigma", 1),
+    ]
+
+
+def test_add(session, model, expected):
+    obj = db.Object.from_object(model)
+    session.add(obj)
+    session.commit()
+
+    assert paths(obj) == expected
+
+
+def test_bulk_add(session, model, expected):
+    id_, = db.bulk_add(session, [model])
+
+    assert paths(session.query(db.Object).get(id_)) == expected
+
+
+def test_path_query(session):
+    aggregator = db.Aggregator(session)
+    ids = db.bulk_add(
+        session,
+        [
+            af.Collection(
+                lens=af.Collection(
+                    gaussian=m.Gaussian(
+                        centre=centre
+                    )
+                )
+            )
+            for centre in (1.0, 2.0)
+        ]
+    )
+
+    result, = aggregator.filter(
+        q.P("lens.gaussian.centre") > 1.5
+    )
+    assert result.id == ids[1]
+
+    result, = aggregator.filter(
+        (q.P("lens").gaussian == m.Gaussian) & (q.P("lens.gaussian.centre") < 1.5)
+    )
+    assert result.id == ids[0]
+
+    assert aggregator.filter(
+        q.P("gaussian.centre") > 0
+    ) == []
+
+
+def test_path_query_string():
+    assert (q.P("lens.gaussian.centre") > 1).query == (
+        "SELECT o0.root_id "
+        "FROM object AS o0 "
+        "JOIN value AS v0 "
+        "ON v0.id = o0.id "
+        "WHERE o0.path = 'lens.gaussian.centre' "
+        "AND v0.value > 1"
+    )
+
+
+def test_subtree_single_query(session, model):
+    id_, = db.bulk_add(session, [model])
+
+    new_session = Session(bind=session.bind)
+    statements = []
+
+    @event.listens_for(session.bind, "before_cursor_execute")
+    def count(*args):
+        statements.append(args)
+
+    obj = new_session.query(db.Object).get(id_)
+    assert len(statements) == 1
+
+    instance = obj()
+    assert len(statements) == 2
+    assert instance.lens.gaussian.centre == 1.0
+
+    event.remove(session.bind, "before_cursor_execute", count)
+    new_session.close()
+
+
+def test_subtree_of_child(session, model):
+    id_, = db.bulk_add(session, [model])
+
+    lens, = session.query(db.Object).filter(
+        db.Object.path == "lens"
+    ).all()
+    lens.load_subtree()
+
+    gaussian, = lens.children
+    assert gaussian.path == "lens.gaussian"
+    assert {child.name for child in gaussian.children} == {"centre", "intensity", "sigma"}
+
+
+def test_child_of_stored_object(session, model):
+    obj = db.Object.from_object(model)
+    session.add(obj)
+    session.commit()
+
+    lens, = [child for child in obj.children if child.name == "lens"]
+    lens.children.append(
+        db.Object.from_object(
+            m.Gaussian(centre=2.0),
+            name="source"
+        )
+    )
+    session.commit()
+
+    source, = [child for child in lens.children if child.name == "source"]
+    assert source.path == "lens.source"
+    assert source.root_id == obj.id
+
+    centre, = [child for child in source.children if child.name == "centre"]
+    assert centre.path == "lens.source.centre"
+    assert centre.root_id == obj.id
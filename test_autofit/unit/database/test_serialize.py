@@ -122,3 +122,29 @@ def test_commit(session):
     serialized = db.Object.from_object(model)
     session.add(serialized)
     session.commit()
+
+
+class TestClassRegistry:
+    def test_path_for(self):
+        registry = db.ClassRegistry()
+
+        class_path = registry.path_for(m.Gaussian)
+        assert class_path == "autofit.mock.mock.Gaussian"
+        assert registry.class_for(class_path) is m.Gaussian
+
+    def test_memoised(self, monkeypatch):
+        registry = db.ClassRegistry()
+        assert registry.class_for("autofit.mock.mock.Gaussian") is m.Gaussian
+
+        def import_module(name):
+            raise AssertionError(f"{name} imported")
+
+        monkeypatch.setattr(db.model.importlib, "import_module", import_module)
+
+        assert registry.class_for("autofit.mock.mock.Gaussian") is m.Gaussian
+        assert len(registry) == 1
+
+    def test_object_cls(self, serialized_model):
+        assert serialized_model.class_path == "autofit.mock.mock.Gaussian"
+        assert serialized_model.cls is m.Gaussian
+        assert db.class_registry.class_for(serialized_model.class_path) is m.Gaussian
@@ -198,6 +198,22 @@ def test_gaussian():
     assert model.sigma.mean == pytest.approx(10, rel=0.1)
 
 
+def test_process_map(make_model_factor):
+    model_factor = make_model_factor(
+        centre=40,
+        sigma=10
+    )
+    values = {
+        variable: np.random.uniform(5, 50, size=20)
+        for variable in model_factor.variables
+    }
+    serial = model_factor(values).log_value
+
+    with ep.ProcessMap(2, chunksize=5) as process_map:
+        model_factor.map_strategy = process_map
+        assert model_factor(values).log_value == pytest.approx(serial)
+
+
 @pytest.fixture(name="prior_model")
 def make_prior_model():
     return af.PriorModel(Gaussian)
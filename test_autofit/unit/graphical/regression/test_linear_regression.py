@@ -170,6 +170,64 @@ def test_laplace(
 
 
 
+def test_laplace_broyden(
+        model_approx,
+        a_,
+        b_,
+        y_,
+        z_,
+):
+    cache = mp.BroydenJacobianCache(refresh_every=5, max_step=10.)
+    laplace = mp.LaplaceFactorOptimiser(jacobian_cache=cache)
+    opt = mp.EPOptimiser(
+        model_approx.factor_graph,
+        default_optimiser=laplace)
+    new_approx = opt.run(model_approx, max_steps=5)
+
+    y = new_approx.mean_field[y_].mean
+    y_pred = new_approx.mean_field[z_].mean
+
+    assert mp.utils.r2_score(y, y_pred) > 0.95
+    assert cache.n_refresh >= 1
+    assert cache.n_update >= 1
+
+
+def test_broyden_jacobian_cache():
+    plate = mp.Plate()
+    x_ = mp.Variable('x', plate)
+    y_ = mp.Variable('y', plate)
+    factor = mp.Factor(lambda x: np.exp(x), x=x_) == y_
+
+    cache = mp.BroydenJacobianCache(refresh_every=2, max_step=0.1)
+
+    def jacobian(x):
+        mode = {x_: x, y_: np.exp(x)}
+        return cache(factor, mode, (x_,))[x_][y_]
+
+    x = np.array([0.1, 0.2, 0.3])
+    assert jacobian(x) == pytest.approx(np.diag(np.exp(x)), abs=1e-4)
+    assert cache.n_refresh == 1
+
+    # a small step is a Broyden update, the change along the step is exact
+    x1 = x + 0.01
+    jac = jacobian(x1)
+    assert cache.n_update == 1
+    assert jac.dot(x1 - x) == pytest.approx(np.exp(x1) - np.exp(x))
+    assert jac == pytest.approx(np.diag(np.exp(x1)), abs=0.02)
+
+    # a large step refreshes the jacobian
+    x2 = x1 + 1.
+    assert jacobian(x2) == pytest.approx(np.diag(np.exp(x2)), abs=1e-4)
+    assert cache.n_refresh == 2
+
+    # as does reaching refresh_every updates
+    jacobian(x2 + 0.01)
+    jacobian(x2 + 0.02)
+    assert cache.n_update == 3
+    jacobian(x2 + 0.03)
+    assert cache.n_refresh == 3
+
+
 def test_importance_sampling(
         model,
         model_approx,
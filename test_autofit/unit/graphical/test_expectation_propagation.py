@@ -130,3 +130,128 @@ def test_looped_importance_sampling(
 
     assert result.mu == pytest.approx(-0.243, rel=0.1)
     assert result.sigma == pytest.approx(0.466, rel=0.1)
+
+
+def test_project_factor_dists(
+        model_approx,
+        normal_factor,
+        x
+):
+    factor_dists = {
+        normal_factor: mp.MeanField({
+            x: autofit.graphical.messages.normal.NormalMessage(1, 0.5)
+        })
+    }
+    new_approx, status = model_approx.project_factor_dists(
+        factor_dists, delta=1.
+    )
+    assert status.success
+    assert new_approx.factor_mean_field[normal_factor][x].mu == 1
+
+    new_approx, status = model_approx.project_factor_dists(
+        factor_dists, delta=0.5
+    )
+    damped = new_approx.factor_mean_field[normal_factor][x]
+    expected = 0.5 * (
+            factor_dists[normal_factor][x].natural_parameters
+            + model_approx.factor_mean_field[normal_factor][x].natural_parameters
+    )
+    assert damped.natural_parameters == pytest.approx(expected)
+
+
+def test_parallel_laplace(
+        model,
+        model_approx,
+        normal_factor,
+        probit_factor,
+        x
+):
+    from concurrent.futures import ThreadPoolExecutor
+
+    laplace = mp.LaplaceFactorOptimiser()
+    result = mp.EPOptimiser(
+        model, default_optimiser=laplace
+    ).run(model_approx, max_steps=20)
+
+    history = mp.expectation_propagation.EPHistory(kl_tol=1e-6)
+    with ThreadPoolExecutor(2) as pool:
+        opt = mp.EPOptimiser(
+            model,
+            default_optimiser=mp.LaplaceFactorOptimiser(),
+            callback=history,
+            pool=pool,
+            delta=0.5
+        )
+        parallel_result = opt.run(model_approx, max_steps=50)
+
+    assert (0, normal_factor) in history.history
+    assert (0, probit_factor) in history.history
+
+    assert parallel_result.mean_field[x].mu == pytest.approx(
+        result.mean_field[x].mu, rel=0.05)
+    assert parallel_result.mean_field[x].sigma == pytest.approx(
+        result.mean_field[x].sigma, rel=0.05)
+
+
+def test_importance_sampling_history(
+        model_approx,
+        probit_factor,
+):
+    factor_approx = model_approx.factor_approximation(probit_factor)
+    sampler = mp.ImportanceSampler(
+        n_samples=100, min_n_eff=50, max_history=2, adaptive=False
+    )
+    for _ in range(4):
+        sampler(factor_approx)
+
+    history = sampler.history_samples(probit_factor)
+    assert len(history) == 2
+    assert sampler._history[probit_factor].n_samples == 400
+
+
+def test_importance_sampling_adaptive(
+        model_approx,
+        probit_factor,
+):
+    factor_approx = model_approx.factor_approximation(probit_factor)
+    sampler = mp.ImportanceSampler(
+        n_samples=100, min_n_eff=1000, max_samples=10000
+    )
+    sample = sampler(factor_approx)
+
+    assert mp.sampling.log_effective_sample_size(
+        sample.log_weights).mean() > 1000
+    assert len(sampler.history_samples(probit_factor)) <= 3
+    assert sample.n_samples == len(sample.log_weights)
+
+
+def test_importance_sampling_reuse(
+        model_approx,
+        normal_factor,
+        probit_factor,
+        x
+):
+    sampler = mp.ImportanceSampler(
+        n_samples=500, min_n_eff=100, force_sample=False
+    )
+    factor_approx = model_approx.factor_approximation(probit_factor)
+    sample = sampler(factor_approx)
+
+    model_approx, _ = model_approx.project(
+        factor_approx.project(
+            mp.project_factor_approx_sample(factor_approx, sample)
+        )[0]
+    )
+    factor_approx = model_approx.factor_approximation(probit_factor)
+    sampler(factor_approx, force_sample=True)
+
+    n_drawn = sampler._history[probit_factor].n_samples
+
+    # samples from both past proposals are pooled and reweighted
+    factor_approx = model_approx.factor_approximation(probit_factor)
+    reused = sampler(factor_approx)
+
+    assert sampler._history[probit_factor].n_samples == n_drawn
+    assert reused.n_samples == n_drawn
+    assert reused.proposal_dist is None
+    assert np.isfinite(reused.log_weights).all()
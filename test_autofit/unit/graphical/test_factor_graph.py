@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
 import numpy as np
 import pytest
 
@@ -188,6 +190,32 @@ class TestFactorGraph:
             sigmoid(variables).log_value, 
             vectorised_sigmoid(variables).log_value)
 
+    @pytest.mark.parametrize(
+        "map_strategy",
+        [
+            mp.SerialMap(),
+            mp.ThreadMap(2),
+            mp.ThreadMap(2, chunksize=7),
+            mp.ProcessMap(2, chunksize=10),
+        ]
+    )
+    def test_map_strategy(
+            self,
+            x,
+            vectorised_sigmoid,
+            map_strategy
+    ):
+        factor = mp.Factor(
+            log_sigmoid,
+            map_strategy=map_strategy,
+            x=x
+        )
+        variables = {x: np.linspace(-5., 5., 100)}
+        with map_strategy:
+            assert np.allclose(
+                factor(variables).log_value,
+                vectorised_sigmoid(variables).log_value)
+
     def test_broadcast(
             self,
             compound
@@ -226,6 +254,28 @@ class TestFactorGraph:
             y: 5
         }
 
+    @pytest.mark.parametrize(
+        "executor_class",
+        [ThreadPoolExecutor, ProcessPoolExecutor]
+    )
+    def test_executor(
+            self,
+            flat_compound,
+            x,
+            y,
+            executor_class
+    ):
+        with executor_class(2) as executor:
+            graph = flat_compound.with_executor(executor)
+            value = graph({x: 3})
+
+            assert (graph * mp.Factor(log_phi, x=x)).executor is executor
+
+        assert value.log_value == -13.467525884778414
+        assert value.deterministic_values == {
+            y: 5
+        }
+
     def test_plates(self):
         obs = autofit.mapper.variable.Plate(name='obs')
         dims = autofit.mapper.variable.Plate(name='dims')
@@ -262,3 +312,113 @@ class TestFactorGraph:
             {x: 2},
             [x],
         )[x] == pytest.approx(coefficient)
+
+
+class TestJacobianBackend:
+    @pytest.fixture(name="obs")
+    def make_obs(self):
+        return mp.Plate(name='obs')
+
+    @pytest.fixture(name="dims")
+    def make_dims(self):
+        return mp.Plate(name='dims')
+
+    @pytest.fixture(name="a")
+    def make_a(self, obs, dims):
+        return mp.Variable('a', obs, dims)
+
+    @pytest.fixture(name="b")
+    def make_b(self, dims):
+        return mp.Variable('b', dims)
+
+    @pytest.fixture(name="values")
+    def make_values(self, a, b):
+        return {
+            a: np.random.randn(2, 3),
+            b: np.random.randn(3),
+        }
+
+    @staticmethod
+    def log_likelihood(a, b):
+        return - (a - b ** 2) ** 2
+
+    @pytest.mark.parametrize("axis", [False, None, 1])
+    def test_batched(self, a, b, values, axis):
+        factor = mp.Factor(
+            self.log_likelihood,
+            jacobian_backend=mp.BatchedNumericalJacobian(),
+            a=a, b=b
+        )
+        assert factor.jacobian_backend.check(factor, values, axis=axis)
+
+    def test_batched_deterministic(self, a, b, obs, dims, values):
+        c = mp.Variable('c', obs, dims)
+
+        factor = mp.Factor(
+            lambda a, b: a * b,
+            jacobian_backend=mp.BatchedNumericalJacobian(),
+            a=a, b=b
+        ) == c
+        assert factor.jacobian_backend.check(factor, values)
+
+    def test_batched_calls(self):
+        x = mp.Variable('x', mp.Plate())
+        calls = []
+
+        def log_phi_counted(x):
+            calls.append(x)
+            return log_phi(x)
+
+        factor = mp.Factor(
+            log_phi_counted,
+            vectorised=True,
+            jacobian_backend=mp.BatchedNumericalJacobian(),
+            x=x
+        )
+        fval, fjac = factor.func_jacobian({x: np.ones(10)}, axis=None)
+
+        assert len(calls) == 2
+        assert fjac[x] == pytest.approx(-np.ones(10), rel=1e-4)
+
+    def test_hessian(self, a, b, values):
+        numerical = mp.Factor(self.log_likelihood, a=a, b=b)
+        batched = mp.Factor(
+            self.log_likelihood,
+            jacobian_backend=mp.BatchedNumericalJacobian(),
+            a=a, b=b
+        )
+        _, _, hess0 = numerical.func_jacobian_hessian(values, axis=None)
+        _, _, hess = batched.func_jacobian_hessian(values, axis=None)
+
+        for v in (a, b):
+            assert np.allclose(hess[v], hess0[v], rtol=1e-3, atol=1e-3)
+
+    def test_analytic(self, a, b, values):
+        def gradient(a, b):
+            residual = a - b ** 2
+            n_obs, n_dims = residual.shape
+            grad_a = np.zeros(residual.shape * 2)
+            grad_b = np.zeros(residual.shape + (n_dims,))
+            for i in range(n_obs):
+                for j in range(n_dims):
+                    grad_a[i, j, i, j] = - 2 * residual[i, j]
+                    grad_b[i, j, j] = 4 * residual[i, j] * b[j]
+            return {"a": grad_a, "b": grad_b}
+
+        factor = mp.Factor(
+            self.log_likelihood,
+            jacobian_backend=mp.AnalyticJacobian(gradient),
+            a=a, b=b
+        )
+        assert factor.jacobian_backend.check(factor, values)
+        assert factor.jacobian_backend.check(factor, values, axis=None)
+
+    def test_jax(self, x):
+        jnp = pytest.importorskip("jax.numpy")
+
+        factor = mp.Factor(
+            lambda x: - x ** 2 / 2 - 0.5 * jnp.log(2 * jnp.pi),
+            jacobian_backend=mp.JaxJacobian(),
+            x=x
+        )
+        assert factor.jacobian_backend.check(factor, {x: 1.5})
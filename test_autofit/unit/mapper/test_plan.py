@@ -0,0 +1,85 @@
+import copy
+import pickle
+
+import pytest
+
+import autofit as af
+from autofit.mock import mock
+
+
+@pytest.fixture(name="model")
+def make_model():
+    return af.Collection(
+        one=af.PriorModel(mock.MockClassx2),
+        tup=af.PriorModel(mock.MockClassx2Tuple),
+    )
+
+
+def test_plan_is_reused(model):
+    assert model.plan is model.plan
+    assert model.one.plan is model.one.plan
+
+
+def test_ordered_priors(model):
+    assert model.plan.priors_ordered_by_id == tuple(
+        prior_tuple.prior
+        for prior_tuple
+        in model._prior_tuples_ordered_by_id
+    )
+    assert model.prior_tuples_ordered_by_id == model._prior_tuples_ordered_by_id
+
+
+def test_invalidated_by_new_prior(model):
+    plan = model.plan
+    assert model.prior_count == 4
+
+    model.one.one = 1.0
+
+    assert model.plan is not plan
+    assert model.prior_count == 3
+    instance = model.instance_from_vector([0.2, 0.3, 0.4])
+    assert instance.one.one == 1.0
+    assert instance.one.two == 0.2
+
+
+def test_invalidated_by_tuple_prior(model):
+    model.tup.one_tuple.one_tuple_0 = 2.0
+
+    assert model.prior_count == 3
+    instance = model.instance_from_vector([0.1, 0.2, 0.3])
+    assert instance.tup.one_tuple == (2.0, 0.3)
+
+
+def test_invalidated_by_assertion(model):
+    model.plan
+    model.add_assertion(model.one.one < model.one.two)
+
+    with pytest.raises(af.exc.FitException):
+        model.instance_from_vector([0.5, 0.4, 0.1, 0.2])
+
+
+def test_invalidated_by_remove():
+    model = af.Collection([mock.MockClassx2, mock.MockClassx2])
+    assert model.prior_count == 4
+
+    model.remove(model[0])
+    assert model.prior_count == 2
+
+
+@pytest.mark.parametrize(
+    "copy_function",
+    [
+        copy.deepcopy,
+        lambda obj: pickle.loads(pickle.dumps(obj))
+    ]
+)
+def test_copy(model, copy_function):
+    model.plan
+
+    copied = copy_function(model)
+
+    assert copied.plan is not model.plan
+    assert copied.plan.priors_ordered_by_id[0] is copied.one.one
+    instance = copied.instance_from_vector([0.1, 0.2, 0.3, 0.4])
+    assert instance.one.one == 0.1
+    assert instance.tup.one_tuple == (0.3, 0.4)
@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 import pytest
 
 import autofit as af
@@ -379,3 +380,47 @@ class TestGaussianPrior:
         log_prior = gaussian_simple.log_prior_from_value(value=2.0)
 
         assert log_prior == pytest.approx(0.108888, 1.0e-4)
+
+
+class TestBatch:
+    @pytest.fixture(name="model")
+    def make_model(self):
+        model = af.PriorModel(mock.MockClassx4)
+        model.one = af.GaussianPrior(mean=0.5, sigma=2.0)
+        model.two = af.UniformPrior(lower_limit=-1.0, upper_limit=3.0)
+        model.three = af.LogUniformPrior(lower_limit=1e-2, upper_limit=1e2)
+        model.four = af.GaussianPrior(mean=1.0, sigma=0.1)
+        return model
+
+    @pytest.fixture(name="unit_vectors")
+    def make_unit_vectors(self):
+        return np.random.uniform(size=(10, 4))
+
+    def test_value_for_array(self):
+        prior = af.GaussianPrior(mean=0.5, sigma=2.0)
+        values = prior.value_for(np.array([0.1, 0.5, 0.9]))
+
+        assert values == pytest.approx([-2.0631031, 0.5, 3.0631031], 1.0e-4)
+
+    def test_vectors_from_unit_vectors(self, model, unit_vectors):
+        vectors = model.vectors_from_unit_vectors(unit_vectors)
+
+        assert vectors.shape == (10, 4)
+        for unit_vector, vector in zip(unit_vectors, vectors):
+            assert list(vector) == pytest.approx(
+                model.vector_from_unit_vector(unit_vector)
+            )
+
+    def test_log_priors_from_vectors(self, model, unit_vectors):
+        vectors = model.vectors_from_unit_vectors(unit_vectors)
+        log_priors = model.log_priors_from_vectors(vectors)
+
+        assert log_priors.shape == (10, 4)
+        for vector, log_prior in zip(vectors, log_priors):
+            assert list(log_prior) == pytest.approx(
+                model.log_priors_from_vector(vector)
+            )
+
+    def test_empty(self, model):
+        assert model.vectors_from_unit_vectors([]).shape == (0, 4)
+
@@ -326,6 +326,59 @@ class TestMulitNest:
 
         assert weights == [0.02, 0.02, 0.01, 0.05, 0.1, 0.1, 0.1, 0.1, 0.2, 0.3]
 
+    def test__weighted_samples_array(self, multi_nest_samples_path):
+        conf.instance.output_path = path.join(multi_nest_samples_path, "1_class")
+
+        multi_nest = af.MultiNest()
+
+        create_weighted_samples_4_parameters(file_path=multi_nest.paths.path)
+
+        weighted_samples = mn.weighted_samples_from_file(
+            file_weighted_samples=path.join(multi_nest.paths.path, "multinest.txt")
+        )
+
+        assert weighted_samples.shape == (10, 6)
+        assert weighted_samples[0] == pytest.approx([0.02, 9999999.9, 1.1, 2.1, 3.1, 4.1])
+        assert not weighted_samples.flags.writeable
+
+    def test__weighted_samples_fields_not_separated_by_whitespace(self, tmp_path):
+        file_weighted_samples = str(tmp_path / "multinest.txt")
+        with open(file_weighted_samples, "w") as f:
+            f.write(
+                "-0.100000000000000000000E+01-0.200000000000000000000E+01-0.300000000000000000000E+01\n"
+            )
+
+        weighted_samples = mn.weighted_samples_from_file(file_weighted_samples)
+
+        assert weighted_samples.tolist() == [[-1.0, -2.0, -3.0]]
+
+    def test__weighted_samples_cached_until_file_changes(self, tmp_path):
+        file_weighted_samples = str(tmp_path / "multinest.txt")
+        line = "    0.100000000000000000E+01    0.200000000000000000E+01\n"
+        with open(file_weighted_samples, "w") as f:
+            f.write(line)
+
+        first = mn.weighted_samples_from_file(file_weighted_samples)
+
+        assert mn.weighted_samples_from_file(file_weighted_samples) is first
+
+        with open(file_weighted_samples, "a") as f:
+            f.write(line)
+
+        second = mn.weighted_samples_from_file(file_weighted_samples)
+
+        assert second is not first
+        assert second.shape == (2, 2)
+
+    def test__weighted_samples_cache_bounded(self, tmp_path):
+        line = "    0.100000000000000000E+01    0.200000000000000000E+01\n"
+        for index in range(10):
+            with open(tmp_path / f"{index}.txt", "w") as f:
+                f.write(line)
+            mn.weighted_samples_from_file(str(tmp_path / f"{index}.txt"))
+
+        assert mn._weighted_samples_from_file.cache_info().currsize <= 4
+
     def test__read_total_samples_from_file_resume(self, multi_nest_resume_path):
         conf.instance.output_path = path.join(multi_nest_resume_path, "1_class")
 
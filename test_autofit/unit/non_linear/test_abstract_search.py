@@ -194,3 +194,134 @@ class TestMovePickleFiles:
 
         if path.exists(test_path):
             shutil.rmtree(test_path)
+
+
+class ScalarAnalysis(af.Analysis):
+    def __init__(self):
+        self.calls = 0
+
+    def log_likelihood_function(self, instance):
+        self.calls += 1
+        if instance.one < 0.0:
+            raise af.exc.FitException
+        return instance.one + instance.two
+
+
+class BatchAnalysis(ScalarAnalysis):
+    def __init__(self):
+        super().__init__()
+        self.batch_calls = 0
+
+    def log_likelihood_function_batch(self, parameters, model):
+        self.batch_calls += 1
+        log_likelihoods = parameters[:, 0] + parameters[:, 1]
+        log_likelihoods[parameters[:, 0] < 0.0] = np.nan
+        return log_likelihoods
+
+
+@pytest.fixture(name="batch_model")
+def make_batch_model():
+    model = af.PriorModel(mock.MockClassx2)
+    model.one = af.UniformPrior(lower_limit=-1.0, upper_limit=1.0)
+    model.two = af.UniformPrior(lower_limit=0.0, upper_limit=1.0)
+    return model
+
+
+class TestBatchFitness:
+    parameters = np.array([[0.5, 0.5], [-0.5, 0.5], [0.25, 0.0]])
+
+    @pytest.mark.parametrize("analysis_class", [ScalarAnalysis, BatchAnalysis])
+    def test__log_likelihoods(self, batch_model, analysis_class):
+        analysis = analysis_class()
+        fitness = af.Emcee.Fitness(
+            paths=None, model=batch_model, analysis=analysis, samples_from_model=None
+        )
+
+        log_likelihoods = fitness.log_likelihoods_from_parameters(parameters=self.parameters)
+
+        assert log_likelihoods[0] == 1.0
+        assert np.isnan(log_likelihoods[1])
+        assert log_likelihoods[2] == 0.25
+        assert fitness.max_log_likelihood == 1.0
+
+        log_posteriors = fitness.log_posteriors_from_parameters(parameters=self.parameters)
+
+        assert log_posteriors[0] == 1.0
+
+        assert fitness.call_batch(parameters=self.parameters)[1] == -np.inf
+
+    @pytest.mark.parametrize("analysis_class, batch", [(ScalarAnalysis, False), (BatchAnalysis, True)])
+    def test__batch_if_overridden(self, batch_model, analysis_class, batch):
+        fitness = af.Emcee.Fitness(
+            paths=None, model=batch_model, analysis=analysis_class(), samples_from_model=None
+        )
+
+        assert fitness.batch is batch
+
+    def test__batch_not_implemented_raised(self, batch_model):
+        class UnfinishedAnalysis(ScalarAnalysis):
+            def log_likelihood_function_batch(self, parameters, model):
+                raise NotImplementedError()
+
+        fitness = af.Emcee.Fitness(
+            paths=None, model=batch_model, analysis=UnfinishedAnalysis(), samples_from_model=None
+        )
+
+        with pytest.raises(NotImplementedError):
+            fitness.log_likelihoods_from_parameters(parameters=self.parameters)
+
+    def test__batch_outside_prior_limits(self, batch_model):
+        analysis = BatchAnalysis()
+        fitness = af.Emcee.Fitness(
+            paths=None, model=batch_model, analysis=analysis, samples_from_model=None
+        )
+
+        parameters = np.array([[0.5, 0.5], [5.0, 0.5]])
+
+        log_likelihoods = fitness.log_likelihoods_from_parameters(parameters=parameters)
+
+        assert log_likelihoods[0] == 1.0
+        assert np.isnan(log_likelihoods[1])
+        assert analysis.batch_calls == 1
+
+        assert fitness.call_batch(parameters=parameters)[1] == fitness.resample_figure_of_merit
+
+    def test__batch_fit_exception(self, batch_model):
+        class InstanceAnalysis(ScalarAnalysis):
+            def log_likelihood_function_batch(self, parameters, model):
+                return np.array([
+                    self.log_likelihood_function(model.instance_from_vector(vector=vector))
+                    for vector in parameters
+                ])
+
+        fitness = af.Emcee.Fitness(
+            paths=None, model=batch_model, analysis=InstanceAnalysis(), samples_from_model=None
+        )
+
+        log_likelihoods = fitness.log_likelihoods_from_parameters(parameters=self.parameters)
+
+        assert np.all(np.isnan(log_likelihoods))
+
+    def test__batch_called_once(self, batch_model):
+        analysis = BatchAnalysis()
+        fitness = af.PySwarmsGlobal.Fitness(
+            paths=None, model=batch_model, analysis=analysis, samples_from_model=None
+        )
+
+        figures_of_merit = fitness(parameters=self.parameters)
+
+        assert analysis.batch_calls == 1
+        assert analysis.calls == 0
+        assert figures_of_merit[0] == -2.0
+        assert figures_of_merit[1] == np.inf
+
+    def test__log_likelihood_cap(self, batch_model):
+        fitness = af.Emcee.Fitness(
+            paths=None,
+            model=batch_model,
+            analysis=BatchAnalysis(),
+            samples_from_model=None,
+            log_likelihood_cap=0.5,
+        )
+
+        assert fitness.log_likelihoods_from_parameters(parameters=self.parameters)[0] == 0.5
@@ -1,3 +1,5 @@
+import numpy as np
+
 import autofit as af
 from autofit.mock.mock import MockClassx4
 
@@ -6,6 +8,9 @@ class MockFitness:
     def figure_of_merit_from_parameters(self, parameters):
         return 1.0
 
+    def figures_of_merit_from_parameters(self, parameters):
+        return np.ones(len(parameters))
+
 
 class TestInitializePrior:
     def test__prior__initial_samples_sample_priors(self):
@@ -0,0 +1,58 @@
+import pytest
+
+from autofit.non_linear.parallel import AbstractJob, AbstractJobResult, Process
+
+
+class JobResult(AbstractJobResult):
+    def __init__(self, value, number):
+        super().__init__(number)
+        self.value = value
+
+
+class Job(AbstractJob):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def perform(self):
+        if self.value < 0:
+            raise ValueError("negative value")
+        return JobResult(2 * self.value, self.number)
+
+
+class TestRunJobs:
+    def test__results(self):
+        results = sorted(Process.run_jobs(
+            [Job(value) for value in range(10)],
+            number_of_cores=3,
+        ))
+
+        assert [result.value for result in results] == list(range(0, 20, 2))
+
+    def test__exception_propagated(self):
+        with pytest.raises(ValueError):
+            list(Process.run_jobs(
+                [Job(1), Job(-1), Job(2)],
+                number_of_cores=2,
+            ))
+
+    def test__max_in_flight(self):
+        submitted = list()
+
+        def jobs():
+            for value in range(6):
+                submitted.append(value)
+                yield Job(value)
+
+        for count, _ in enumerate(Process.run_jobs(
+                jobs(),
+                number_of_cores=2,
+                max_in_flight=2,
+        ), start=1):
+            assert len(submitted) <= count + 2
+
+        assert len(submitted) == 6
+
+    def test__too_few_cores(self):
+        with pytest.raises(AssertionError):
+            list(Process.run_jobs([Job(1)], number_of_cores=1))
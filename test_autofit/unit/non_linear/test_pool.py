@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+
+from autofit.non_linear import pool as p
+
+
+class MockFitness:
+    def __init__(self, offset):
+        self.offset = offset
+
+    def __call__(self, value):
+        return value + self.offset
+
+
+def call(args):
+    fitness, value = args
+    return fitness(value)
+
+
+class TestSearchPool:
+    def test__install_and_map(self):
+        with p.shared_pools():
+            pool = p.pool_for(number_of_cores=2)
+
+            assert len(pool.ids) == 2
+
+            fitness = pool.install(MockFitness(offset=1.0))
+            assert pool.map(call, [(fitness, value) for value in range(4)]) == [1.0, 2.0, 3.0, 4.0]
+
+            fitness = pool.install(MockFitness(offset=10.0))
+            assert pool.map(call, [(fitness, value) for value in range(2)]) == [10.0, 11.0]
+
+    def test__pool_shared_and_closed(self):
+        with p.shared_pools():
+            pool = p.pool_for(number_of_cores=2)
+
+            with p.shared_pools():
+                assert p.pool_for(number_of_cores=2) is pool
+
+            assert p.pool_for(number_of_cores=2) is pool
+
+        assert p._pools == dict()
+
+    def test__pool_not_shared_outside_context(self):
+        pool = p.pool_for(number_of_cores=2)
+        other = p.pool_for(number_of_cores=2)
+        try:
+            assert p._pools == dict()
+            assert other is not pool
+        finally:
+            pool.close()
+            other.close()
+
+
+class TestWorkerFitness:
+    def test__fitness_not_pickled(self):
+        fitness = p.WorkerFitness(fitness=MockFitness(offset=1.0), token="token")
+
+        assert fitness(1.0) == 2.0
+
+        fitness = pickle.loads(pickle.dumps(fitness))
+
+        assert fitness.fitness is None
+        assert fitness.token == "token"
+
+    def test__not_installed(self):
+        fitness = pickle.loads(
+            pickle.dumps(p.WorkerFitness(fitness=MockFitness(offset=1.0), token="token"))
+        )
+
+        with pytest.raises(RuntimeError):
+            fitness(1.0)
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from autofit.non_linear.profiling import Histogram, Profiler
+
+
+class TestHistogram:
+    def test__statistics(self):
+        histogram = Histogram()
+
+        for _ in range(99):
+            histogram.add(1.0e-3)
+        histogram.add(1.0)
+
+        assert histogram.count == 100
+        assert histogram.total == pytest.approx(1.099)
+        assert histogram.max == 1.0
+        assert histogram.quantile(0.5) == pytest.approx(1.0e-3, rel=0.1)
+        assert histogram.quantile(0.99) == pytest.approx(1.0e-3, rel=0.1)
+        assert histogram.quantile(1.0) == 1.0
+
+    def test__batch(self):
+        histogram = Histogram()
+        histogram.add(1.0, count=4)
+
+        assert histogram.count == 4
+        assert histogram.mean == 0.25
+        assert histogram.quantile(0.5) == pytest.approx(0.25, rel=0.1)
+
+    def test__empty(self):
+        histogram = Histogram()
+
+        assert histogram.mean == 0.0
+        assert histogram.quantile(0.99) == 0.0
+
+
+class TestProfiler:
+    def test__context(self):
+        profiler = Profiler()
+
+        with profiler("update.visualize"):
+            pass
+
+        assert profiler.histograms["update.visualize"].count == 1
+        assert "visualize" in profiler.to_dict()["update"]
+
+    def test__output_to_json(self, tmp_path):
+        profiler = Profiler()
+        profiler.add("log_likelihood", 0.1, count=10)
+        profiler.add("instance", 0.01, count=10)
+
+        filename = str(tmp_path / "profiling.json")
+        profiler.output_to_json(filename=filename)
+
+        with open(filename) as f:
+            profiling = json.load(f)
+
+        assert profiling["log_likelihood_calls"] == 10
+        assert profiling["log_likelihood_mean"] == pytest.approx(0.01)
+        assert profiling["overhead_fraction"] < 1.0
+        assert profiling["timings"]["instance"]["count"] == 10
+
+    def test__parallel(self):
+        profiler = Profiler()
+        profiler.start(parallel=True)
+        profiler.add("instance", 0.01)
+
+        profiling = profiler.to_dict()
+
+        assert profiling["parallel"] is True
+        assert profiling["log_likelihood_calls"] is None
+        assert profiling["calls_per_second"] is None
+        assert profiling["overhead_fraction"] is None
+        assert profiling["timings"]["instance"]["count"] == 1
+
+    def test__start(self):
+        profiler = Profiler()
+        profiler.add("log_likelihood", 0.1)
+        profiler.start()
+
+        assert profiler.histograms == dict()
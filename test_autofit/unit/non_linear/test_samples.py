@@ -1,10 +1,12 @@
 import os
+import pickle
 
+import numpy as np
 import pytest
 
 import autofit as af
 from autofit.mock.mock import MockClassx2, MockClassx4
-from autofit.non_linear.samples import OptimizerSamples, PDFSamples, Sample
+from autofit.non_linear.samples import ColumnQuantiles, OptimizerSamples, PDFSamples, Sample, SampleList, column_quantiles, load_from_hdf5, quantile
 
 pytestmark = pytest.mark.filterwarnings("ignore::FutureWarning")
 
@@ -63,6 +65,24 @@ class TestSamplesTable:
         assert os.path.exists(filename)
         os.remove(filename)
 
+    def test__hdf5_round_trip(self, samples, tmp_path):
+        filename = str(tmp_path / "samples.h5")
+        samples.write_hdf5(filename=filename)
+
+        sample_list = load_from_hdf5(filename=filename)
+
+        assert sample_list.names == samples.model.model_component_and_parameter_names
+        assert sample_list.parameters.tolist() == samples.parameters
+        assert sample_list.log_likelihoods.tolist() == samples.log_likelihoods
+        assert sample_list.weights.tolist() == samples.weights
+
+    def test__without_sample_list(self, samples):
+        header = samples.without_sample_list()
+
+        assert header.samples is None
+        assert header.model is samples.model
+        assert len(samples.samples) == 5
+
 
 class TestOptimizerSamples:
     def test__max_log_likelihood_vector_and_instance(self, samples):
@@ -236,6 +256,34 @@ class TestPDFSamples:
         assert median_pdf_instance.mock_class.one == pytest.approx(1.0, 1e-1)
         assert median_pdf_instance.mock_class.two == pytest.approx(2.0, 1e-1)
 
+    def test__column_quantiles_cached_until_samples_change(self):
+        model = af.ModelMapper(mock_class=MockClassx2)
+
+        def make_sample_list(offset):
+            return Sample.from_lists(
+                model=model,
+                parameters=[[1.0 + offset, 2.0], [1.1 + offset, 2.1], [0.9 + offset, 1.9]],
+                log_likelihoods=3 * [0.1],
+                log_priors=3 * [0.0],
+                weights=3 * [1.0 / 3.0],
+            )
+
+        samples = PDFSamples(model=model, samples=make_sample_list(0.0))
+
+        engine = samples.column_quantiles
+        median_pdf_vector = samples.median_pdf_vector
+        samples.vector_at_sigma(sigma=1.0)
+
+        assert samples.column_quantiles is engine
+
+        samples.samples = make_sample_list(1.0)
+
+        assert samples.column_quantiles is not engine
+        assert samples.median_pdf_vector[0] == pytest.approx(median_pdf_vector[0] + 1.0)
+
+        state = pickle.loads(pickle.dumps(samples)).__dict__
+        assert state["_column_quantiles"] is None
+
     def test__unconverged__median_pdf_vector(self):
         parameters = [
             [1.0, 2.0],
@@ -575,4 +623,89 @@ class TestNestSamples:
         assert samples_range.parameters[0] == [0.0, 1.0, 2.0, 3.0]
         assert samples_range.parameters[1] == [0.0, 1.0, 2.0, 3.0]
         assert samples_range.parameters[2] == [0.0, 1.0, 2.0, 3.0]
-        assert samples_range.parameters[3] == [0.0, 1.0, 2.0, 3.0]
\ No newline at end of file
+        assert samples_range.parameters[3] == [0.0, 1.0, 2.0, 3.0]
+
+
+class TestSampleList:
+    def test__stored_as_arrays(self, samples):
+        sample_list = samples.samples
+
+        assert isinstance(sample_list, SampleList)
+        assert sample_list.parameters.shape == (5, 4)
+        assert sample_list.log_likelihoods.shape == (5,)
+        assert len(sample_list) == 5
+
+    def test__sample_view(self, samples):
+        sample = samples.samples[3]
+
+        assert isinstance(sample, Sample)
+        assert sample.log_likelihood == 10.0
+        assert sample.kwargs["mock_class_1_two"] == 22.0
+        assert samples.max_log_likelihood_sample.kwargs == sample.kwargs
+        assert len(list(samples.samples)) == 5
+        assert len(samples.samples[1:3]) == 2
+
+    def test__names_must_match_columns(self):
+        with pytest.raises(ValueError):
+            SampleList(
+                names=["one", "two", "three"],
+                parameters=[[1.0, 2.0], [3.0, 4.0]],
+                log_likelihoods=[1.0, 2.0],
+                log_priors=[0.0, 0.0],
+                weights=[1.0, 1.0],
+            )
+
+        sample_list = SampleList(
+            names=["one", "two"],
+            parameters=[[], []],
+            log_likelihoods=[1.0, 2.0],
+            log_priors=[0.0, 0.0],
+            weights=[1.0, 1.0],
+        )
+
+        assert sample_list.names == []
+        assert sample_list[0].kwargs == dict()
+
+    def test__from_sample_objects(self, samples):
+        converted = OptimizerSamples(
+            model=samples.model,
+            samples=list(samples.samples)
+        )
+
+        assert isinstance(converted.samples, SampleList)
+        assert converted.parameters == samples.parameters
+        assert converted.log_likelihoods == samples.log_likelihoods
+
+    def test__pickle_with_list_of_samples(self, samples):
+        loaded = pickle.loads(pickle.dumps(samples))
+        assert loaded.parameters == samples.parameters
+
+        state = {
+            "model": samples.model,
+            "samples": list(samples.samples),
+            "time": None,
+        }
+        old = OptimizerSamples.__new__(OptimizerSamples)
+        old.__setstate__(state)
+
+        assert old.max_log_likelihood_vector == [21.0, 22.0, 23.0, 24.0]
+
+    def test__column_quantiles(self):
+        x = np.random.RandomState(1).normal(size=(100, 3))
+        weights = np.random.RandomState(2).uniform(size=100)
+
+        quantiles = column_quantiles(x=x, q=[0.2, 0.5], weights=weights)
+
+        assert quantiles.shape == (2, 3)
+        for i in range(3):
+            assert quantiles[:, i] == pytest.approx(
+                quantile(x=x[:, i], q=[0.2, 0.5], weights=weights)
+            )
+
+        engine = ColumnQuantiles(x=x, weights=weights)
+
+        assert engine(q=[0.2, 0.5]) == pytest.approx(quantiles)
+        assert engine(q=0.9)[0, 1] == pytest.approx(quantile(x=x[:, 1], q=0.9, weights=weights)[0])
+
+        with pytest.raises(ValueError):
+            engine(q=1.5)
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+import autofit as af
+from autofit.mock.mock import MockClassx2
+from autofit.non_linear.samples import OptimizerSamples, Sample, load_from_hdf5, load_from_table
+from autofit.non_linear.samples_writer import SamplesWriter
+
+
+@pytest.fixture(name="model")
+def make_model():
+    return af.ModelMapper(mock_class=MockClassx2)
+
+
+def make_samples(model, parameters, weights=None):
+    parameters = np.asarray(parameters, dtype=float)
+    total_samples = len(parameters)
+    return OptimizerSamples(
+        model=model,
+        samples=Sample.from_lists(
+            model=model,
+            parameters=parameters,
+            log_likelihoods=parameters[:, 0],
+            log_priors=np.zeros(total_samples),
+            weights=np.ones(total_samples) if weights is None else weights,
+        )
+    )
+
+
+@pytest.fixture(name="writer")
+def make_writer(tmp_path):
+    return SamplesWriter(
+        hdf5_file=str(tmp_path / "samples.h5"),
+        csv_file=str(tmp_path / "samples.csv"),
+    )
+
+
+def assert_written(writer, samples, tmp_path):
+    sample_list = load_from_hdf5(writer.hdf5_file)
+    assert sample_list.parameters.tolist() == samples.parameters
+    assert sample_list.log_likelihoods.tolist() == samples.log_likelihoods
+    assert sample_list.weights.tolist() == samples.weights
+
+    expected = str(tmp_path / "expected.csv")
+    samples.write_table(filename=expected)
+    with open(writer.csv_file) as f, open(expected) as g:
+        assert f.read() == g.read()
+
+
+class TestSamplesWriter:
+    def test__append(self, model, writer, tmp_path):
+        parameters = [[float(i), float(i) + 0.5] for i in range(5)]
+
+        writer.write(samples=make_samples(model, parameters[:3]), final_samples=3)
+        assert writer.high_water_mark == 3
+
+        samples = make_samples(model, parameters)
+        writer.write(samples=samples, final_samples=5)
+
+        assert writer.high_water_mark == 5
+        assert_written(writer, samples, tmp_path)
+        assert load_from_table(writer.csv_file).parameters.tolist() == parameters
+
+    def test__samples_after_high_water_mark_replaced(self, model, writer, tmp_path):
+        writer.write(
+            samples=make_samples(model, [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [9.0, 9.0]]),
+            final_samples=2,
+        )
+
+        samples = make_samples(model, [[0.0, 0.0], [1.0, 1.0], [2.0, 3.0], [3.0, 3.0], [8.0, 8.0]])
+        writer.write(samples=samples, final_samples=4)
+
+        assert writer.high_water_mark == 4
+        assert_written(writer, samples, tmp_path)
+
+    def test__different_samples_rewritten(self, model, writer, tmp_path):
+        writer.write(samples=make_samples(model, [[0.0, 0.0], [1.0, 1.0]]), final_samples=2)
+
+        samples = make_samples(model, [[5.0, 5.0], [6.0, 6.0], [7.0, 7.0]])
+        writer.write(samples=samples, final_samples=3)
+
+        assert_written(writer, samples, tmp_path)
+
+    def test__rewrite_weights(self, model, writer, tmp_path):
+        writer.write(samples=make_samples(model, [[0.0, 0.0], [1.0, 1.0]]), final_samples=2)
+
+        samples = make_samples(
+            model, [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]], weights=[0.2, 0.3, 0.5]
+        )
+        writer.write(samples=samples, final_samples=3, rewrite_weights=True)
+
+        assert_written(writer, samples, tmp_path)
+
+    def test__no_final_samples(self, model, writer, tmp_path):
+        writer.write(samples=make_samples(model, [[0.0, 0.0], [1.0, 1.0]]))
+
+        samples = make_samples(model, [[2.0, 2.0]])
+        writer.write(samples=samples)
+
+        assert writer.high_water_mark == 0
+        assert_written(writer, samples, tmp_path)
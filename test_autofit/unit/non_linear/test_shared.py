@@ -0,0 +1,136 @@
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from autofit.non_linear import pool as p
+from autofit.non_linear import shared as s
+
+
+class MockDataset:
+    def __init__(self, data, noise_map):
+        self.data = data
+        self.noise_map = noise_map
+
+
+class MockAnalysis:
+    def __init__(self, dataset, mask):
+        self.dataset = dataset
+        self.mask = mask
+        self.arrays = [dataset.data]
+
+    def __call__(self, value):
+        return type(self.dataset.data).__name__, float(np.sum(self.dataset.data)) + value
+
+
+def make_analysis(size=1000):
+    data = np.arange(size, dtype=float)
+    return MockAnalysis(
+        dataset=MockDataset(data=data, noise_map=np.ones(size)),
+        mask=np.zeros(10, dtype=bool),
+    )
+
+
+class TestSharedArrays:
+    def test__arrays_shared_and_restored(self):
+        analysis = make_analysis()
+        data = analysis.dataset.data
+        mask = analysis.mask
+
+        with s.shared_arrays(analysis, min_bytes=1000) as shared:
+            assert shared is analysis
+            assert isinstance(analysis.dataset.data, s.SharedArray)
+            assert isinstance(analysis.dataset.noise_map, s.SharedArray)
+            assert analysis.arrays[0] is analysis.dataset.data
+            assert analysis.mask is mask
+            assert (analysis.dataset.data == data).all()
+
+            filename = analysis.dataset.data.filename
+            assert os.path.exists(filename)
+
+        assert analysis.dataset.data is data
+        assert analysis.arrays[0] is data
+        assert not os.path.exists(filename)
+
+    def test__fall_back_when_shared_memory_full(self, tmp_path, monkeypatch):
+        full = str(tmp_path / "full")
+        os.mkdir(full)
+        from_array = s.SharedArray.from_array.__func__
+
+        def from_array_with_full_directory(cls, array, directory):
+            if directory == full:
+                raise OSError(28, "No space left on device")
+            return from_array(cls, array, directory)
+
+        monkeypatch.setattr(s, "_shared_directory", lambda: full)
+        monkeypatch.setattr(s.SharedArray, "from_array", classmethod(from_array_with_full_directory))
+
+        analysis = make_analysis()
+
+        with s.shared_arrays(analysis, min_bytes=1000):
+            assert isinstance(analysis.dataset.data, s.SharedArray)
+            assert os.path.dirname(os.path.dirname(analysis.dataset.data.filename)) == tempfile.gettempdir()
+            directory = os.path.dirname(analysis.dataset.data.filename)
+
+        assert not os.path.exists(directory)
+        assert not os.path.exists(full)
+
+    def test__not_shared_when_no_space(self, monkeypatch):
+        def from_array(cls, array, directory):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(s.SharedArray, "from_array", classmethod(from_array))
+
+        analysis = make_analysis(size=100000)
+        data = analysis.dataset.data
+
+        with s.shared_arrays(analysis, min_bytes=1000):
+            assert analysis.dataset.data is data
+            assert pickle.loads(pickle.dumps(analysis))(0.0) == analysis(0.0)
+
+    def test__pickled_by_filename(self):
+        analysis = make_analysis(size=100000)
+
+        with s.shared_arrays(analysis, min_bytes=1000):
+            string = pickle.dumps(analysis)
+            assert len(string) < 10000
+
+            unpickled = pickle.loads(string)
+
+        data = unpickled.dataset.data
+        assert isinstance(data, s.SharedArray)
+        assert (data == np.arange(100000)).all()
+
+        data[0] = 5.0
+        assert data[0] == 5.0
+
+    def test__derived_arrays(self):
+        analysis = make_analysis()
+
+        with s.shared_arrays(analysis, min_bytes=1000):
+            data = analysis.dataset.data
+
+            assert data[1:].filename is None
+            assert (pickle.loads(pickle.dumps(data[1:])) == np.arange(1, 1000)).all()
+
+            assert type(data + 1) is np.ndarray
+            assert isinstance(np.sum(data), float)
+
+    def test__worker_attaches(self):
+        analysis = make_analysis(size=s.MIN_BYTES // 8)
+
+        with p.shared_pools():
+            pool = p.pool_for(number_of_cores=2)
+            fitness = pool.install(analysis)
+
+            assert pool.map(call, [(fitness, 1.0)] * 2) == [
+                ("SharedArray", float(np.sum(analysis.dataset.data)) + 1.0)
+            ] * 2
+
+        assert type(analysis.dataset.data) is np.ndarray
+
+
+def call(args):
+    fitness, value = args
+    return fitness(value)
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+
+import autofit as af
+from autofit.tools.lazy import LazyImports
+
+
+@pytest.fixture(name="lazy_imports")
+def make_lazy_imports():
+    lazy_imports = LazyImports({"__name__": "autofit"})
+    lazy_imports.add("""
+from .non_linear.paths import Paths
+from .non_linear.paths import Paths as Alias
+""")
+    return lazy_imports
+
+
+class TestLazyImports:
+    def test__import(self, lazy_imports):
+        assert lazy_imports.getattr("Paths") is af.Paths
+        assert lazy_imports.getattr("Alias") is af.Paths
+        assert lazy_imports.globals["Alias"] is af.Paths
+
+    def test__missing(self, lazy_imports):
+        with pytest.raises(AttributeError):
+            lazy_imports.getattr("Missing")
+
+    def test__dir(self, lazy_imports):
+        assert "Alias" in lazy_imports.dir()
+
+    def test__bad_line(self, lazy_imports):
+        with pytest.raises(ValueError):
+            lazy_imports.add("import numpy")
+
+
+def test_public_names():
+    assert af.Emcee.__name__ == "Emcee"
+    assert af.SearchGridSearch.__name__ == "GridSearch"
+    assert "DynestyStatic" in dir(af)
+
+
+def test_samplers_not_imported():
+    modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, autofit; print(' '.join(sys.modules))",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout.decode().split()
+
+    for module in ("emcee", "dynesty", "pyswarms", "h5py", "dill"):
+        assert module not in modules